@@ -1,3 +1,4 @@
 from .abstractscrollview import TTkAbstractScrollViewInterface, TTkAbstractScrollView, TTkAbstractScrollViewGridLayout
 from .abstractscrollarea import TTkAbstractScrollArea
 from .abstractitemmodel import TTkAbstractItemModel
+from .abstracttablemodel import TTkAbstractTableModel
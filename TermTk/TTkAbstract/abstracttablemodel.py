@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2022 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from TermTk.TTkCore.constant import TTkK
+from TermTk.TTkCore.signal import pyTTkSignal
+from TermTk.TTkAbstract.abstractitemmodel import TTkAbstractItemModel
+
+class TTkAbstractTableModel(TTkAbstractItemModel):
+    ''' TTkAbstractTableModel
+
+    Base class of the models displayed by a :class:`~TermTk.TTkWidgets.TTkModelView.tableview.TTkTableView`
+    (similar to the QAbstractTableModel).
+
+    Reimplement :meth:`rowCount`, :meth:`columnCount` and :meth:`data`,
+    the view queries only the displayed cells, the data is never copied.
+
+    The changes are notified through the signals:
+
+    * :attr:`rowsInserted` (first, count)
+    * :attr:`rowsRemoved` (first, count)
+    * :attr:`rowsChanged` (first, count): the data of those rows is changed
+    * :attr:`modelReset` (): everything is changed (rows, columns and header)
+    '''
+    __slots__ = (
+        # Signals
+        'rowsInserted', 'rowsRemoved', 'rowsChanged', 'modelReset'
+    )
+    def __init__(self, *args, **kwargs):
+        # Signals
+        self.rowsInserted = pyTTkSignal(int, int)
+        self.rowsRemoved  = pyTTkSignal(int, int)
+        self.rowsChanged  = pyTTkSignal(int, int)
+        self.modelReset   = pyTTkSignal()
+        super().__init__(*args, **kwargs)
+
+    def rowCount(self) -> int:
+        ''' Return the number of rows '''
+        return 0
+
+    def columnCount(self) -> int:
+        ''' Return the number of columns '''
+        return 0
+
+    def data(self, row, col, role=TTkK.DisplayRole):
+        ''' Return the data of the cell for the given role, None if not available
+
+        :param row: the row of the cell
+        :type row: int
+        :param col: the column of the cell
+        :type col: int
+        :param role: the role of the data
+        :type role: :class:`~TermTk.TTkCore.constant.TTkConstant.ItemDataRole`, optional
+        '''
+        return None
+
+    def headerData(self, col, role=TTkK.DisplayRole):
+        ''' Return the data of the column header for the given role, None if not available '''
+        return None
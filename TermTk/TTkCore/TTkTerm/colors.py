@@ -27,6 +27,7 @@
 
 import re
 
+from TermTk.TTkCore.constant import TTkK
 from .colors_ansi_map import ansiMap256, ansiMap16
 
 class TTkTermColor():
@@ -35,35 +36,105 @@ class TTkTermColor():
     UNDERLINE    = 0x04
     STRIKETROUGH = 0x08
     BLINKING     = 0x10
+    # Used only in the monochrome output to highlight
+    # the colors with a light background
+    REVERSE      = 0x20
+
+    _modOn  = ((BOLD,'1'),(ITALIC,'3'),(UNDERLINE,'4'),(STRIKETROUGH,'9'),(BLINKING,'5'),(REVERSE,'7'))
+    _modOff = ((BOLD,'22'),(ITALIC,'23'),(UNDERLINE,'24'),(STRIKETROUGH,'29'),(BLINKING,'25'),(REVERSE,'27'))
+
+    # Palettes used to quantize the rgb colors, the first 16 colors of the
+    # 256 palette are the standard terminal colors (normal + bright),
+    # the 256 colors quantization use only the 6x6x6 cube and the grayscale
+    # to avoid the colors that may be redefined by the terminal theme
+    _palette16  = [(i,ansiMap256[i]) for i in range(16)]
+    _palette256 = [(i,ansiMap256[i]) for i in range(16,256)]
+    # rgb -> nearest palette index
+    _nearest16  = {}
+    _nearest256 = {}
 
     @staticmethod
-    def rgb2ansi(fg: tuple=None, bg:tuple=None, mod:int=0, clean:bool=False):
+    def _nearest(rgb, palette, cache) -> int:
+        if (ret := cache.get(rgb)) is None:
+            r,g,b = rgb
+            ret = cache[rgb] = min(palette,
+                key=lambda c: (c[1][0]-r)**2 + (c[1][1]-g)**2 + (c[1][2]-b)**2)[0]
+        return ret
+
+    @staticmethod
+    def rgb2codes(fg: tuple=None, bg:tuple=None, mod:int=0, depth:int=TTkK.DEP_24):
+        ''' Return the (fg, bg, mod) sgr parameters of the color quantized to the
+        color depth (TTkK.DEP_2, DEP_4, DEP_8, DEP_24), the quantization
+        of each rgb value is computed only once '''
+        if depth >= TTkK.DEP_24:
+            return (
+                f'38;2;{fg[0]};{fg[1]};{fg[2]}' if fg else None,
+                f'48;2;{bg[0]};{bg[1]};{bg[2]}' if bg else None,
+                mod )
+        if depth >= TTkK.DEP_8:
+            return (
+                f'38;5;{TTkTermColor._nearest(fg, TTkTermColor._palette256, TTkTermColor._nearest256)}' if fg else None,
+                f'48;5;{TTkTermColor._nearest(bg, TTkTermColor._palette256, TTkTermColor._nearest256)}' if bg else None,
+                mod )
+        if depth >= TTkK.DEP_4:
+            def _code(rgb, base):
+                c = TTkTermColor._nearest(rgb, TTkTermColor._palette16, TTkTermColor._nearest16)
+                return str(base+c if c < 8 else base+60+c-8)
+            return (
+                _code(fg,30) if fg else None,
+                _code(bg,40) if bg else None,
+                mod )
+        # DEP_2, no colors, reverse the light backgrounds
+        def _luma(rgb): return 0.299*rgb[0] + 0.587*rgb[1] + 0.114*rgb[2]
+        if bg and _luma(bg) > (_luma(fg) if fg else 128):
+            mod |= TTkTermColor.REVERSE
+        return None, None, mod
+
+    @staticmethod
+    def rgb2ansi(fg: tuple=None, bg:tuple=None, mod:int=0, clean:bool=False, depth:int=TTkK.DEP_24):
         ret = []
 
         if clean:
-            ret.append(0)
+            ret.append('0')
+
+        fg, bg, mod = TTkTermColor.rgb2codes(fg, bg, mod, depth)
 
         if fg:
-            ret.append(f'38;2;{fg[0]};{fg[1]};{fg[2]}')
+            ret.append(fg)
         if bg:
-            ret.append(f'48;2;{bg[0]};{bg[1]};{bg[2]}')
-
-        if mod & TTkTermColor.BOLD:
-            ret.append('1')
-        if mod & TTkTermColor.ITALIC:
-            ret.append('3')
-        if mod & TTkTermColor.UNDERLINE:
-            ret.append('4')
-        if mod & TTkTermColor.STRIKETROUGH:
-            ret.append('9')
-        if mod & TTkTermColor.BLINKING:
-            ret.append('5')
+            ret.append(bg)
+
+        for m,v in TTkTermColor._modOn:
+            if mod & m: ret.append(v)
 
         if ret:
-            return f'\033[{";".join(str(x) for x in ret)}m'
+            return f'\033[{";".join(ret)}m'
         else:
             return '\033[0m'
 
+    @staticmethod
+    def rgb2ansiTransition(fromColor:tuple, toColor:tuple, reset:str=None, depth:int=TTkK.DEP_24):
+        ''' Return the shortest escape sequence that switch the terminal
+        from the (fg, bg, mod) "fromColor" to the (fg, bg, mod) "toColor",
+        either a partial update of the changed attributes or
+        a reset followed by the full "toColor" (precomputed in "reset" if available) '''
+        ffg, fbg, fmod = TTkTermColor.rgb2codes(*fromColor, depth)
+        fg,  bg,  mod  = TTkTermColor.rgb2codes(*toColor,   depth)
+        if (ffg, fbg, fmod) == (fg, bg, mod): return ''
+        ret = []
+        for m,v in TTkTermColor._modOff:
+            if fmod & m and not mod & m: ret.append(v)
+        for m,v in TTkTermColor._modOn:
+            if mod & m and not fmod & m: ret.append(v)
+        if fg != ffg:
+            ret.append(fg or '39')
+        if bg != fbg:
+            ret.append(bg or '49')
+        delta = f'\033[{";".join(ret)}m'
+        if reset is None:
+            reset = TTkTermColor.rgb2ansi(*toColor, clean=True, depth=depth)
+        return delta if len(delta) <= len(reset) else reset
+
     def _256toRgb(val):
         pass
 
@@ -80,24 +151,25 @@ class TTkTermColor():
             if not all(values): # Return None if not all the values are set
                 return (None, None, 0, True)
 
-            while values:
-                s = int(values.pop(0))
+            values = iter(values)
+            for s in values:
+                s = int(s)
                 if 30 <= s <= 37: # Ansi 16 colors - fg
                     fg = ansiMap16.get(s-30)
                 elif 40 <= s <= 47: # Ansi 16 colors - bg
                     bg = ansiMap16.get(s-40)
                 elif s == 38:
-                    t =  int(values.pop(0))
+                    t =  int(next(values))
                     if t == 5:# 256 fg
-                        fg = ansiMap256.get(int(values.pop(0)))
+                        fg = ansiMap256.get(int(next(values)))
                     if t == 2:# 24 bit fg
-                        fg = (int(values.pop(0)),int(values.pop(0)),int(values.pop(0)))
+                        fg = (int(next(values)),int(next(values)),int(next(values)))
                 elif s == 48:
-                    t =  int(values.pop(0))
+                    t =  int(next(values))
                     if t == 5:# 256 bg
-                        bg = ansiMap256.get(int(values.pop(0)))
+                        bg = ansiMap256.get(int(next(values)))
                     if t == 2:# 24 bit bg
-                        bg = (int(values.pop(0)),int(values.pop(0)),int(values.pop(0)))
+                        bg = (int(next(values)),int(next(values)),int(next(values)))
                 elif s==0: # Reset Color/Format
                     fg = None
                     bg = None
@@ -28,6 +28,8 @@ class TTkTermBase():
     CLEAR         = "\033[2J\033[0;0f" # Clear screen and set cursor to position 0,0
     ALT_SCREEN    = "\033[?1049h"                       #* Switch to alternate screen
     NORMAL_SCREEN = "\033[?1049l"                       #* Switch to normal screen
+    SYNC_BEGIN    = "\033[?2026h"                       # Begin Synchronized Update (DEC private mode 2026)
+    SYNC_END      = "\033[?2026l"                       # End Synchronized Update
 
     class Mouse():
         ON         = "\033[?1002h\033[?1015h\033[?1006h" # Enable reporting of mouse position on click and release
@@ -86,12 +88,17 @@ class TTkTermBase():
     height: int = 0
     mouse: bool = True
     directMouse: bool = False
+    syncUpdate: bool = False
 
     _sigWinChCb = None
+    _frame = None
 
     @staticmethod
-    def init(mouse: bool = True, directMouse: bool = False, title: str = "TermTk", sigmask=0):
+    def init(mouse: bool = True, directMouse: bool = False, title: str = "TermTk", sigmask=0, syncUpdate: bool = False):
         TTkTermBase.title = title
+        # Wrap each frame in a synchronized update,
+        # the terminals that do not support it ignore the sequence
+        TTkTermBase.syncUpdate = syncUpdate
         TTkTermBase.mouse = mouse | directMouse
         TTkTermBase.directMouse = directMouse
         TTkTermBase.push(TTkTermBase.ALT_SCREEN + TTkTermBase.CLEAR + TTkTermBase.Cursor.HIDE + TTkTermBase.escTitle(TTkTermBase.title))
@@ -127,6 +134,32 @@ class TTkTermBase():
         TTkTermBase.setEcho(False)
         TTkTermBase.CRNL(False)
 
+    @staticmethod
+    def push(*args):
+        if TTkTermBase._frame is not None:
+            TTkTermBase._frame.append(str(*args))
+        else:
+            TTkTermBase.write(str(*args))
+
+    @staticmethod
+    def beginFrame():
+        ''' Collect all the following pushes until :meth:`endFrame` '''
+        if TTkTermBase._frame is None:
+            TTkTermBase._frame = []
+
+    @staticmethod
+    def endFrame():
+        ''' Send all the pushes collected since :meth:`beginFrame` with a single write,
+        return the data sent '''
+        frame, TTkTermBase._frame = TTkTermBase._frame, None
+        if not frame: return ''
+        if TTkTermBase.syncUpdate:
+            data = TTkTermBase.SYNC_BEGIN + ''.join(frame) + TTkTermBase.SYNC_END
+        else:
+            data = ''.join(frame)
+        TTkTermBase.write(data)
+        return data
+
     @staticmethod
     def escTitle(txt = "") -> str:
         tt = os.environ.get("TERMINAL_TITLE", "")
@@ -139,7 +172,7 @@ class TTkTermBase():
     # those methods are supposed to be overwritten with the
     # compatible one in "term_unix.py" or "term_pyodide.py"
     setSigmask = lambda *args: None
-    push       = lambda *args: None
+    write      = lambda *args: None
     flush      = lambda *args: None
     setEcho    = lambda *args: None
     CRNL       = lambda *args: None
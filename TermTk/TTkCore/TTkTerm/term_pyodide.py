@@ -28,9 +28,9 @@ from .term_base import TTkTermBase
 
 class TTkTerm(TTkTermBase):
     @staticmethod
-    def _push(*args):
-        pyodideProxy.termPush(str(*args))
-    TTkTermBase.push = _push
+    def _write(data:str):
+        pyodideProxy.termPush(data)
+    TTkTermBase.write = _write
 
     @staticmethod
     def _getTerminalSize():
@@ -80,10 +80,14 @@ class TTkTerm(TTkTermBase):
         termios.tcsetattr(sys.stdin, termios.TCSADRAIN, TTkTerm._termAttr)
 
     @staticmethod
-    def _push(*args):
-        sys.stdout.write(str(*args))
+    def _write(data:str):
+        # Anything still buffered in stdout need to go first
         sys.stdout.flush()
-    TTkTermBase.push = _push
+        data = memoryview(data.encode())
+        fd = sys.stdout.fileno()
+        while data:
+            data = data[os.write(fd, data):]
+    TTkTermBase.write = _write
 
     @staticmethod
     def _flush():
@@ -7,4 +7,5 @@ from .color import *
 from .string import *
 from .timer import *
 from .filebuffer import *
+from .renderstats import *
 from .TTkTerm import *
\ No newline at end of file
@@ -22,18 +22,34 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from array import array
+
 from TermTk.TTkCore.TTkTerm.term import TTkTerm
 from TermTk.TTkCore.constant import TTkK
 from TermTk.TTkCore.log import TTkLog
 from TermTk.TTkCore.cfg import TTkCfg
 from TermTk.TTkCore.color import TTkColor
-from TermTk.TTkCore.string import TTkString
+from TermTk.TTkCore.string import TTkString, _TTkColorRuns
+
+class _TTkGlyphIds(dict):
+    ''' glyph -> id, the missing glyphs are interned in the :class:`TTkCanvas` pool '''
+    __slots__ = ()
+    def __missing__(self, ch):
+        gid = self[ch] = len(TTkCanvas._glyphs)
+        TTkCanvas._glyphs.append(ch)
+        TTkCanvas._glyphsWide.append(TTkString._isWideCharData(ch))
+        TTkCanvas._glyphsSize.append(len(ch.encode()))
+        return gid
 
 class TTkCanvas:
     ''' Init the Canvas object
 
     :param  width: the width of the Canvas
     :param  height: the height of the Canvas
+
+    The cells are stored in two flat arrays (row major, index = y*width+x),
+    each cell hold the id of the glyph interned in the pool shared by all the canvases
+    and the id of the color (:meth:`~TermTk.TTkCore.color.TTkColor.colorId`).
     '''
     __slots__ = (
         '_widget',
@@ -42,20 +58,48 @@ class TTkCanvas:
         '_data', '_colors',
         '_bufferedData', '_bufferedColors',
         '_visible', '_doubleBuffer')
+
+    # Glyph Pool, the id 0 is reserved to the space ' '
+    # and the id 1 to the empty string used as placeholder
+    # for the second half of the wide chars
+    _glyphs     = [' ', '']
+    _glyphsWide = [False, False]
+    _glyphsSize = [1, 0] # utf-8 bytes
+    _glyphsId   = _TTkGlyphIds({' ':0, '':1})
+    # Color Pool, the id 0 is reserved to TTkColor.RST
+    _colorPool   = TTkColor._interned
+    # Shared blank buffer (all the cells set to ' ' - TTkColor.RST)
+    # used to clean the canvases without reallocating them
+    _blank = array('I')
+
     def __init__(self, *args, **kwargs):
         self._widget = kwargs.get('widget', None)
         self._visible = True
         self._doubleBuffer = False
         self._width = 0
         self._height = 0
-        self._data = [[0]]
-        self._colors = [[TTkColor.RST]]
+        self._data   = array('I')
+        self._colors = array('I')
         self._newWidth = kwargs.get('width', 0 )
         self._newHeight = kwargs.get('height', 0 )
         self.updateSize()
         # self.resize(self._width, self._height)
         # TTkLog.debug((self._width, self._height))
 
+    @staticmethod
+    def _glyphId(ch):
+        return TTkCanvas._glyphsId[ch]
+
+    @staticmethod
+    def _colorId(color):
+        return color.colorId()
+
+    @staticmethod
+    def _blankCells(size):
+        if len(TTkCanvas._blank) < size:
+            TTkCanvas._blank = array('I',[0])*size
+        return memoryview(TTkCanvas._blank)[:size]
+
     def getWidget(self): return self._widget
 
     def enableDoubleBuffer(self):
@@ -67,13 +111,11 @@ class TTkCanvas:
         w,h = self._newWidth, self._newHeight
         if w  == self._width and h == self._height:
             return
-        baseData = [' ']*w
-        baseColors = [TTkColor.RST]*w
-        self._data   = [baseData.copy()   for _ in range(h)]
-        self._colors = [baseColors.copy() for _ in range(h)]
+        self._data   = array('I',[0])*(w*h)
+        self._colors = array('I',[0])*(w*h)
         if self._doubleBuffer:
-            self._bufferedData   = [baseData.copy()   for _ in range(h)]
-            self._bufferedColors = [baseColors.copy() for _ in range(h)]
+            self._bufferedData   = array('I',[0])*(w*h)
+            self._bufferedColors = array('I',[0])*(w*h)
         self._height = h
         self._width  = w
 
@@ -91,17 +133,12 @@ class TTkCanvas:
 
     def clean(self):
         if not self._visible: return
-        w,h = self._width, self._height
-        baseData = [' ']*w
-        baseColors = [TTkColor.RST]*w
-        self._data   = [baseData.copy()   for _ in range(h)]
-        self._colors = [baseColors.copy() for _ in range(h)]
+        blank = TTkCanvas._blankCells(len(self._data))
+        memoryview(self._data)[:]   = blank
+        memoryview(self._colors)[:] = blank
 
     def copy(self):
-        h = self._height
-        retData   = [self._data[i].copy()   for i in range(h)]
-        retColors = [self._colors[i].copy() for i in range(h)]
-        return retData, retColors
+        return self._data[:], self._colors[:]
 
     def hide(self):
         self._visible = False
@@ -112,8 +149,9 @@ class TTkCanvas:
     def _set(self, _y, _x, _ch, _col=TTkColor.RST):
         if 0 <= _y < self._height and \
            0 <= _x < self._width  :
-            self._data[_y][_x] = _ch
-            self._colors[_y][_x] = _col.mod(_x,_y)
+            i = _y*self._width+_x
+            self._data[i]   = TTkCanvas._glyphId(_ch)
+            self._colors[i] = TTkCanvas._colorId(_col.mod(_x,_y))
 
     def drawVLine(self, pos, size, color=TTkColor.RST):
         if size == 0: return
@@ -179,25 +217,41 @@ class TTkCanvas:
 
         if x+width<0 or x>=self._width : return
 
-        text = text.align(width=width, alignment=alignment, color=color)
-        txt, colors = text.tab2spaces().getData()
+        text = text.align(width=width, alignment=alignment, color=color).tab2spaces()
+        if text._hasSpecialWidth is None:
+            # The color runs are already aligned to the cells
+            txt, runs = text._text, text._runs
+        else:
+            txt, colors = text._getDataW()
+            runs = _TTkColorRuns.compress(colors)
         if forceColor:
-            colors=[color]*len(colors)
+            runs = _TTkColorRuns.fill(color, len(txt))
         a,b = max(0,-x), min(len(txt),self._width-x)
-        for i in range(a,b):
-            #self._set(y, x+i, txt[i-x], colors[i-x])
-            self._data[y][x+i] = txt[i]
-            if colors[i] == TTkColor.RST != color:
-                self._colors[y][x+i] =  color.mod(x+i,y)
+        if a >= b: return
+        off = y*self._width+x
+        glyphId = TTkCanvas._glyphsId.__getitem__
+        # The RST color (id 0) is replaced by the default one
+        useDefault = color.colorId() != 0
+        self._data[off+a:off+b] = array('I',map(glyphId, txt[a:b]))
+        dstColors = self._colors
+        start = 0
+        for end, c in runs:
+            ra, rb = max(a,start), min(b,end)
+            start = end
+            if ra >= rb: continue
+            if useDefault and c.colorId() == 0:
+                c = color
+            if c._colorMod is None:
+                dstColors[off+ra:off+rb] = array('I',[c.colorId()])*(rb-ra)
             else:
-                self._colors[y][x+i] =  colors[i].mod(x+i,y)
+                for i in range(ra,rb):
+                    dstColors[off+i] = c.mod(x+i,y).colorId()
+            if end >= b: break
         # Check the full wide chars on the edge of the two canvasses
-        if ((0 <= (x+a) < self._width) and self._data[y][x+a] == ''):
-            self._data[y][x+a]   = TTkCfg.theme.unicodeWideOverflowCh[0]
-            self._colors[y][x+a] = TTkCfg.theme.unicodeWideOverflowColor
-        if ((0 <= (x+b-1) < self._width) and TTkString._isWideCharData(self._data[y][x+b-1])):
-            self._data[y][x+b-1]   = TTkCfg.theme.unicodeWideOverflowCh[1]
-            self._colors[y][x+b-1] = TTkCfg.theme.unicodeWideOverflowColor
+        if self._data[off+a] == 1: # ''
+            self._set(y, x+a,   TTkCfg.theme.unicodeWideOverflowCh[0], TTkCfg.theme.unicodeWideOverflowColor)
+        if TTkCanvas._glyphsWide[self._data[off+b-1]]:
+            self._set(y, x+b-1, TTkCfg.theme.unicodeWideOverflowCh[1], TTkCfg.theme.unicodeWideOverflowColor)
 
     def drawText(self, pos, text, width=None, color=TTkColor.RST, alignment=TTkK.NONE, forceColor=False):
         '''
@@ -590,6 +644,7 @@ class TTkCanvas:
         if not self._visible: return
         if not canvas._visible: return
         if canvas._width==0 or canvas._height==0: return
+        if bw<=0 or bh<=0: return
         if x+w<=bx or y+h<=by or bx+bw-1<x or by+bh-1<y:
             return
 
@@ -600,78 +655,181 @@ class TTkCanvas:
 
         xoffset = min(max(0,bx-x),canvas._width-1)
         yoffset = min(max(0,by-y),canvas._height-1)
-        wslice = min(w if x+w < bx+bw else bx+bw-x,canvas._width)
-        hslice = min(h if y+h < by+bh else by+bh-y,canvas._height)
-
+        wslice = min(w if x+w < bx+bw else bx+bw-x,canvas._width,self._width-x)
+        hslice = min(h if y+h < by+bh else by+bh-y,canvas._height,self._height-y)
+        if xoffset >= wslice: return
+
+        sw, cw = self._width, canvas._width
+        data,    srcData    = self._data,    canvas._data
+        colors,  srcColors  = self._colors,  canvas._colors
+        glyphsWide = TTkCanvas._glyphsWide
+        ovfCh    = TTkCfg.theme.unicodeWideOverflowCh
+        ovfColor = TTkCfg.theme.unicodeWideOverflowColor
         for iy in range(yoffset,hslice):
             a, b = x+xoffset, x+wslice
-            self._data[y+iy][a:b]   = canvas._data[iy][xoffset:wslice]
-            self._colors[y+iy][a:b] = canvas._colors[iy][xoffset:wslice]
+            off = (y+iy)*sw
+            src = iy*cw
+            data[off+a:off+b]   = srcData[src+xoffset:src+wslice]
+            colors[off+a:off+b] = srcColors[src+xoffset:src+wslice]
 
             # Check the full wide chars on the edge of the two canvasses
-            if ((0 <= a < self._width) and self._data[y+iy][a]==''):
-                self._data[y+iy][a]   = TTkCfg.theme.unicodeWideOverflowCh[0]
-                self._colors[y+iy][a] = TTkCfg.theme.unicodeWideOverflowColor
-            if ((0 < b <= self._width) and TTkString._isWideCharData(self._data[y+iy][b-1])):
-                self._data[y+iy][b-1]   = TTkCfg.theme.unicodeWideOverflowCh[1]
-                self._colors[y+iy][b-1] = TTkCfg.theme.unicodeWideOverflowColor
-            if ((0 < a <= self._width) and TTkString._isWideCharData(self._data[y+iy][a-1])):
-                self._data[y+iy][a-1]   = TTkCfg.theme.unicodeWideOverflowCh[1]
-                self._colors[y+iy][a-1] = TTkCfg.theme.unicodeWideOverflowColor
-            if ((0 <= b < self._width) and self._data[y+iy][b]==''):
-                self._data[y+iy][b]   = TTkCfg.theme.unicodeWideOverflowCh[0]
-                self._colors[y+iy][b] = TTkCfg.theme.unicodeWideOverflowColor
+            if ((0 <= a < sw) and data[off+a]==1):
+                self._set(y+iy, a,   ovfCh[0], ovfColor)
+            if ((0 < b <= sw) and glyphsWide[data[off+b-1]]):
+                self._set(y+iy, b-1, ovfCh[1], ovfColor)
+            if ((0 < a <= sw) and glyphsWide[data[off+a-1]]):
+                self._set(y+iy, a-1, ovfCh[1], ovfColor)
+            if ((0 <= b < sw) and data[off+b]==1):
+                self._set(y+iy, b,   ovfCh[0], ovfColor)
 
     def pushToTerminal(self, x, y, w, h):
         # TTkLog.debug("pushToTerminal")
-        lastcolor = TTkColor.RST
+        glyphs, sgr = TTkCanvas._glyphs, TTkColor.transition
+        TTkColor.transitions()
+        out = [str(TTkColor.RST)]
+        lastcolor = 0 # TTkColor.RST
         for y in range(0, self._height):
-            ansi = TTkColor.RST+TTkTerm.Cursor.moveTo(y+1,1)
+            out.append(TTkTerm.Cursor.moveTo(y+1,1))
+            off = y*self._width
             for x in range(0, self._width):
-                ch = self._data[y][x]
-                color = self._colors[y][x]
-                if color != lastcolor:
-                    ansi += color-lastcolor
-                    lastcolor = color
-                ansi+=ch
-            TTkTerm.push(ansi)
+                if (cid := self._colors[off+x]) != lastcolor:
+                    out.append(sgr(lastcolor,cid))
+                    lastcolor = cid
+                out.append(glyphs[self._data[off+x]])
+        TTkTerm.push(''.join(out))
 
     def cleanBuffers(self):
         if not self._visible: return
-        w,h = self._width, self._height
-        baseData = [' ']*w
-        baseColors = [TTkColor.RST]*w
-        self._bufferedData   = [baseData.copy()   for _ in range(h)]
-        self._bufferedColors = [baseColors.copy() for _ in range(h)]
+        blank = TTkCanvas._blankCells(len(self._bufferedData))
+        memoryview(self._bufferedData)[:]   = blank
+        memoryview(self._bufferedColors)[:] = blank
+
+    @staticmethod
+    def _cursorMove(cx, cy, x, y):
+        ''' Return the shortest sequence to move the cursor from (cx,cy) to (x,y),
+        (cx,cy) = (-1,-1) if the current position is unknown '''
+        ret = TTkTerm.Cursor.moveTo(y+1,x+1)
+        if cy < 0: return ret
+        if   x==cx: hor = ''
+        elif x==0:  hor = '\r'
+        elif x==cx+1: hor = '\033[C'
+        elif x==cx-1: hor = '\033[D'
+        elif x > cx:  hor = f'\033[{x-cx}C'
+        else:         hor = f'\033[{cx-x}D'
+        if x>0 and len(cha := f'\033[{x+1}G') < len(hor): hor = cha
+        if   y==cy:   ver = ''
+        elif y==cy+1: ver = '\033[B'
+        elif y==cy-1: ver = '\033[A'
+        elif y > cy:  ver = f'\033[{y-cy}B'
+        else:         ver = f'\033[{cy-y}A'
+        if len(ver)+len(hor) < len(ret):
+            return ver+hor
+        return ret
 
     def pushToTerminalBuffered(self, x, y, w, h):
+        ''' Push to the terminal only the cells of the area (x,y,w,h)
+        that differ from the last pushed frame.
+
+        Each changed span is encoded choosing the cheapest (in bytes) between:
+
+        * absolute or relative cursor movements
+        * rewriting the few unchanged cells between two spans
+        * erase to the end of line (:class:`TTkCfg`.termEraseLine) and
+          repeat the last char (:class:`TTkCfg`.termRep)
+        * partial sgr updates instead of reset and reapply
+
+        The pushed area is copied back to the terminal buffer so that
+        the next call can compare a different area against it.
+        '''
         # TTkLog.debug("pushToTerminal")
         oldData, oldColors = self._bufferedData, self._bufferedColors
-        lastcolor = TTkColor.RST
-        empty = True
-        ansi = ""
-        for y in range(0, self._height):
-            for x in range(0, self._width):
-                if self._data[y][x] == oldData[y][x] and \
-                   self._colors[y][x] == oldColors[y][x]:
-                    if not empty:
-                        TTkTerm.push(ansi)
-                        empty=True
+        data, colors = self._data, self._colors
+        glyphs, glyphsWide, glyphsSize = TTkCanvas._glyphs, TTkCanvas._glyphsWide, TTkCanvas._glyphsSize
+        colorPool = TTkCanvas._colorPool
+        sgr, sgrCache = TTkColor.transition, TTkColor.transitions()
+        cursorMove = TTkCanvas._cursorMove
+        termRep, termEraseLine = TTkCfg.termRep, TTkCfg.termEraseLine
+        sw = self._width
+        x1, y1 = max(0,x), max(0,y)
+        x2, y2 = min(sw,x+w), min(self._height,y+h)
+        if x1>=x2 or y1>=y2: return
+        out = []
+        lastcolor = 0 # TTkColor.RST
+        cx, cy = -1, -1
+        for y in range(y1, y2):
+            off = y*sw
+            a, b = off+x1, off+x2
+            # Skip the unchanged rows, the arrays compare in bulk
+            if data[a:b]   == oldData[a:b] and \
+               colors[a:b] == oldColors[a:b]:
+                continue
+            # Build the changed spans [start,end)
+            spans = []
+            for i in range(a, b):
+                if data[i] == oldData[i] and colors[i] == oldColors[i]: continue
+                if spans and spans[-1][1] == i:
+                    spans[-1][1] = i+1
                     continue
-                ch = self._data[y][x]
-                color = self._colors[y][x]
-                if empty:
-                    ansi = TTkTerm.Cursor.moveTo(y+1,x+1)
-                    empty = False
-                if color != lastcolor:
-                    ansi += str(color-lastcolor)
-                    lastcolor = color
-                ansi+=ch
-            if not empty:
-                TTkTerm.push(ansi)
-                empty=True
-        # Reset the color at the end
-        TTkTerm.push(TTkColor.RST)
-        # Switch the buffer
-        self._bufferedData, self._bufferedColors = self._data, self._colors
-        self._data, self._colors = oldData, oldColors
+                # The second half of a wide char cannot be addressed alone
+                if data[i]==1 and i>off: i -= 1
+                # Rewrite the unchanged cells between two spans
+                # if it is cheaper than moving the cursor
+                if spans:
+                    pe = spans[-1][1]
+                    gap = i-pe
+                    if gap <= 4 and \
+                       all(colors[j]==colors[pe-1] for j in range(pe,i)) and \
+                       sum(glyphsSize[data[j]] for j in range(pe,i)) <= (3 if gap==1 else 4):
+                        spans[-1][1] = i+1
+                        continue
+                spans.append([i,i+1])
+            # Erase the blank tail of the line if it is cheaper
+            eraseFrom = None
+            if termEraseLine and x2==sw and data[off+sw-1]==0:
+                tc = colors[off+sw-1]
+                # The monochrome output use the reverse video for the backgrounds
+                if not colorPool[tc]._mod and \
+                   (colorPool[tc]._bg is None or TTkCfg.color_depth != TTkK.DEP_2):
+                    t = off+sw-1
+                    while t > a and data[t-1]==0 and colors[t-1]==tc: t-=1
+                    if off+sw-t > 3 and spans[-1][1] > t:
+                        eraseFrom = t
+                        while spans and spans[-1][0] >= t: spans.pop()
+                        if spans and spans[-1][1] > t: spans[-1][1] = t
+            for s,e in spans:
+                if (s-off,y) != (cx,cy):
+                    out.append(cursorMove(cx,cy,s-off,y))
+                i = s
+                while i < e:
+                    gid, cid = data[i], colors[i]
+                    if cid != lastcolor:
+                        out.append(sgrCache.get((lastcolor,cid)) or sgr(lastcolor,cid))
+                        lastcolor = cid
+                    out.append(glyphs[gid])
+                    i += 1
+                    if termRep and gid != 1 and not glyphsWide[gid]:
+                        # Repeat the same char if it is cheaper
+                        j = i
+                        while j < e and data[j]==gid and colors[j]==cid: j+=1
+                        if (n := j-i) and len(r := f'\033[{n}b') < n*glyphsSize[gid]:
+                            out.append(r)
+                            i = j
+                # Track the cursor, a wide char at the end move the cursor 1 more step
+                cx, cy = e-off+(1 if glyphsWide[data[e-1]] else 0), y
+                # The cursor position is unreliable in the last column
+                if cx >= sw: cx, cy = -1, -1
+            if eraseFrom is not None:
+                if (eraseFrom-off,y) != (cx,cy):
+                    out.append(cursorMove(cx,cy,eraseFrom-off,y))
+                if (cid := colors[eraseFrom]) != lastcolor:
+                    out.append(sgr(lastcolor,cid))
+                    lastcolor = cid
+                out.append('\033[K')
+                cx, cy = eraseFrom-off, y
+            # Update the terminal buffer
+            oldData[a:b], oldColors[a:b] = data[a:b], colors[a:b]
+        if out:
+            # Reset the color at the end
+            if lastcolor:
+                out.append(str(TTkColor.RST))
+            TTkTerm.push(''.join(out))
@@ -33,6 +33,13 @@ class TTkCfg:
     maxFps = 35
     doubleBuffer = True
 
+    # Control sequences allowed in the terminal output
+    # REP - Repeat the last char (CSI n b)
+    #       Opt-in, not supported by all the terminals (i.e. the Linux console)
+    # EL  - Erase to the end of the line using the current background (CSI K)
+    termRep = False
+    termEraseLine = True
+
     scrollDelta = 5
     theme = None
 
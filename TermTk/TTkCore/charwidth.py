@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2023 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import unicodedata
+from functools import lru_cache
+
+class _TTkWidthCache(dict):
+    ''' char -> width, the missing chars are resolved through :class:`_TTkCharWidth`,
+    the cache is reset if it grows over "maxSize" entries '''
+    __slots__ = ()
+    maxSize = 0x4000
+    def __missing__(self, ch):
+        if len(self) >= _TTkWidthCache.maxSize:
+            self.clear()
+        w = self[ch] = _TTkCharWidth._resolve(ord(ch))
+        return w
+
+class _TTkCharWidth():
+    ''' Displayed width (0, 1, 2) of the unicode chars
+
+    * 2 - East Asian Wide chars
+    * 0 - Combining/Enclosing marks (Mn, Me)
+    * 1 - Anything else
+
+    The widths of the BMP (< 0x10000) are resolved once, the first time a
+    non ascii char is checked, in a direct lookup array;
+    the widths of the other planes
+    (mostly emoji) are resolved through unicodedata.
+    The chars already resolved are cached in a dict
+    in order to map the strings at C speed.
+    '''
+    # BMP direct lookup
+    _bmp = None
+    # char -> width
+    _widths = _TTkWidthCache()
+
+    @staticmethod
+    def _build():
+        eaw, cat = unicodedata.east_asian_width, unicodedata.category
+        bmp = bytearray(b'\x01'*0x10000)
+        # from: tests/timeit/09.widechar.check.py
+        # the first not halfsize char is 0x300
+        for cp in range(0x300, 0x10000):
+            if 0xD800 <= cp < 0xE000: continue # Surrogates
+            ch = chr(cp)
+            if eaw(ch) == 'W':
+                bmp[cp] = 2
+            elif cat(ch) in ('Me','Mn'):
+                bmp[cp] = 0
+        _TTkCharWidth._bmp = bmp
+
+    @staticmethod
+    def _resolve(cp:int) -> int:
+        if cp < 0x300: return 1
+        if cp < 0x10000:
+            if _TTkCharWidth._bmp is None:
+                _TTkCharWidth._build()
+            return _TTkCharWidth._bmp[cp]
+        ch = chr(cp)
+        if unicodedata.east_asian_width(ch) == 'W': return 2
+        if unicodedata.category(ch) in ('Me','Mn'): return 0
+        return 1
+
+    @staticmethod
+    def charWidth(ch:str) -> int:
+        return _TTkCharWidth._widths[ch]
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _textWidth(txt:str) -> int:
+        return sum(map(_TTkCharWidth._widths.__getitem__, txt))
+
+    @staticmethod
+    def textWidth(txt:str) -> int:
+        ''' Displayed width of the text '''
+        if txt.isascii(): return len(txt)
+        return _TTkCharWidth._textWidth(txt)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def textLayout(txt:str) -> tuple:
+        ''' Return the (glyphs, indexes) of the text displayed
+
+        Each glyph is a displayed cell, the wide chars are followed by an empty glyph
+        and the zero sized chars are merged to the previous glyph,
+        indexes are the positions in the text of the char of each glyph
+        '''
+        widths = _TTkCharWidth._widths
+        glyphs = []
+        indexes = []
+        for i,ch in enumerate(txt):
+            w = widths[ch]
+            if w == 1:
+                glyphs.append(ch)
+                indexes.append(i)
+            elif w == 2:
+                glyphs += (ch,'')
+                indexes += (i,i)
+            elif glyphs:
+                if len(glyphs)>1 and glyphs[-1] == '':
+                    glyphs[-2]+=ch
+                else:
+                    glyphs[-1]+=ch
+        return tuple(glyphs), tuple(indexes)
@@ -22,7 +22,10 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import threading
+
 from TermTk.TTkCore.constant import TTkK
+from TermTk.TTkCore.cfg import TTkCfg
 from TermTk.TTkCore.helper import TTkHelper
 
 # Ansi Escape Codes:
@@ -61,8 +64,37 @@ from TermTk.TTkCore.helper import TTkHelper
 # [49m          2.53      set background color to default (black)
 
 class _TTkColor:
-    __slots__ = ('_fg','_bg','_mod', '_colorMod', '_buffer', '_clean')
+    ''' Every (fg, bg, mod) combination is interned in a registry
+    shared by all the colors and identified by a small integer id,
+    the id 0 is reserved to :class:`TTkColor`.RST
+
+    When the registry is full (:attr:`registrySize`) it is restarted at the beginning
+    of the next frame (:meth:`_checkRegistry`), the ids assigned before are no more valid
+    and all the canvases are painted again. '''
+    __slots__ = ('_fg','_bg','_mod', '_colorMod', '_buffer', '_clean', '_id', '_gen')
     _fg: tuple; _bg: tuple; _mod: int
+    # (fg, bg, mod) -> id
+    _registry = {}
+    # id -> interned color (without modifier)
+    _interned = []
+    # id -> sgr sequence from a clean terminal
+    _sgr = []
+    # (fromId, toId) -> shortest sgr sequence
+    _transitions = {}
+    # Color depth used by the cached sgr sequences
+    _depth = TTkCfg.color_depth
+    # (id, id, clean) -> sum of the two colors
+    _sums = {}
+    # Generation of the registry, the ids of the colors are valid only in their generation
+    _generation = 0
+    _lock = threading.Lock()
+
+    # Max number of colors in the registry
+    registrySize = 0x40000
+    # Max number of cached transitions/sums, the cache is flushed when full
+    transitionsSize = 0x40000
+    sumsSize = 0x10000
+
     def __init__(self, fg:tuple=None, bg:tuple=None, mod:int=0, colorMod=None, clean=False):
         self._fg  = fg
         self._bg  = bg
@@ -70,6 +102,71 @@ class _TTkColor:
         self._clean = clean or not (fg or bg or mod)
         self._colorMod = colorMod
         self._buffer = None
+        self._id = None
+        self._gen = 0
+
+    def colorId(self) -> int:
+        ''' Return the id of this color (fg, bg, mod) in the colors registry '''
+        if (cid := self._id) is None or self._gen != _TTkColor._generation:
+            key = (self._fg, self._bg, self._mod)
+            if (cid := _TTkColor._registry.get(key)) is None:
+                with _TTkColor._lock:
+                    if (cid := _TTkColor._registry.get(key)) is None:
+                        cid = len(_TTkColor._interned)
+                        _TTkColor._interned.append(self.copy(modifier=False))
+                        _TTkColor._sgr.append(TTkHelper.Color.rgb2ansi(self._fg,self._bg,self._mod,True,_TTkColor._depth))
+                        # Published last, the interned color and its sgr are already available
+                        _TTkColor._registry[key] = cid
+            self._id, self._gen = cid, _TTkColor._generation
+        return cid
+
+    @staticmethod
+    def _checkRegistry() -> bool:
+        ''' Restart the registry if it is full, return True if restarted
+
+        It must be called before painting a frame, the caller must repaint all the canvases '''
+        if len(_TTkColor._interned) <= TTkColor.registrySize:
+            return False
+        with _TTkColor._lock:
+            _TTkColor._generation += 1
+            # The lists are cleared in place, they are referenced by the canvas
+            _TTkColor._registry.clear()
+            _TTkColor._interned.clear()
+            _TTkColor._sgr.clear()
+            _TTkColor._transitions.clear()
+            _TTkColor._sums.clear()
+        # The id 0 is reserved to the reset color
+        TTkColor.RST.colorId()
+        return True
+
+    @staticmethod
+    def fromId(cid):
+        ''' Return the interned color with the id "cid" '''
+        return _TTkColor._interned[cid]
+
+    @staticmethod
+    def transitions() -> dict:
+        ''' Return the transitions cache {(fromId, toId): sgr},
+        rebuilding the cached sequences if :class:`TTkCfg`.color_depth is changed '''
+        if (depth := TTkCfg.color_depth) != _TTkColor._depth:
+            _TTkColor._depth = depth
+            _TTkColor._transitions.clear()
+            _TTkColor._sgr[:] = [
+                TTkHelper.Color.rgb2ansi(c._fg,c._bg,c._mod,True,depth)
+                for c in _TTkColor._interned]
+        return _TTkColor._transitions
+
+    @staticmethod
+    def transition(fromId, toId) -> str:
+        ''' Return the (memoized) escape sequence that switch the terminal
+        from the color "fromId" to the color "toId" '''
+        if (ret := _TTkColor._transitions.get((fromId, toId))) is None:
+            if len(_TTkColor._transitions) >= TTkColor.transitionsSize:
+                _TTkColor._transitions.clear()
+            a, b = _TTkColor._interned[fromId], _TTkColor._interned[toId]
+            ret = _TTkColor._transitions[(fromId, toId)] = TTkHelper.Color.rgb2ansiTransition(
+                (a._fg, a._bg, a._mod), (b._fg, b._bg, b._mod), _TTkColor._sgr[toId], _TTkColor._depth)
+        return ret
 
     def foreground(self):
         if self._fg:
@@ -121,15 +218,18 @@ class _TTkColor:
         ret = self.copy()
         ret._fg = self._bg
         ret._bg = self._fg
+        ret._id = None
         return ret
 
     def __str__(self):
         if not self._buffer:
-            self._buffer = TTkHelper.Color.rgb2ansi(self._fg,self._bg,self._mod,self._clean)
+            self._buffer = TTkHelper.Color.rgb2ansi(self._fg,self._bg,self._mod,self._clean,TTkCfg.color_depth)
         return self._buffer
 
     def __eq__(self, other):
         if other is None: return False
+        if self._id is not None and other._id is not None and self._gen == other._gen:
+            return self._id == other._id
         return \
             self._fg  == other._fg and \
             self._bg  == other._bg and \
@@ -139,7 +239,17 @@ class _TTkColor:
     def __add__(self, other):
         # TTkLog.debug("__add__")
         if other._clean:
-            return other.copy()
+            # The colors are immutable, only the modifier need to be copied
+            return other.copy() if other._colorMod else other
+        if not (self._colorMod or other._colorMod):
+            key = (self.colorId(), other.colorId(), self._clean)
+            if (ret := _TTkColor._sums.get(key)) is None:
+                if len(_TTkColor._sums) >= TTkColor.sumsSize:
+                    _TTkColor._sums.clear()
+                ret = _TTkColor._sums[key] = TTkColor(
+                    other._fg or self._fg, other._bg or self._bg,
+                    self._mod + other._mod, None, self._clean)
+            return ret
         clean = self._clean
         fg:  str = other._fg or self._fg
         bg:  str = other._bg or self._bg
@@ -153,6 +263,7 @@ class _TTkColor:
         if ( None == self._bg  != other._bg  or
              None == self._fg  != other._fg  or
                      self._mod != other._mod ):
+            if self._clean: return self
             ret = self.copy()
             ret._clean = True
             return ret
@@ -174,6 +285,8 @@ class _TTkColor:
         ret._bg   = self._bg
         ret._mod  = self._mod
         ret._clean = self._clean
+        ret._id   = self._id
+        ret._gen  = self._gen
         if modifier and self._colorMod:
             ret._colorMod = self._colorMod.copy()
         return ret
@@ -227,6 +340,7 @@ class TTkColorGradient(_TTkColorModifier):
         copy = color.copy(modifier=False)
         copy._fg = _applyGradient(color._fg, self._fgincrement)
         copy._bg = _applyGradient(color._bg, self._bgincrement)
+        copy._id = None
         self._buffer[bname][id] = copy
         return self._buffer[bname][id]
 
@@ -265,6 +379,7 @@ class TTkLinearGradient(_TTkColorModifier):
             return target_color
         alpha = 1.0 - beta
         copy = base_color.copy(modifier=False)
+        copy._id = None
         if copy._fg is not None  and  target_color._fg is not None:
             copy._fg = (
                 int(alpha*base_color._fg[0] + beta*target_color._fg[0]),
@@ -323,6 +438,14 @@ class TTkColor(_TTkColor):
     BLINKING     = _TTkColor(mod=TTkHelper.Color.BLINKING)
     '''"Blinking" modifier'''
 
+    # Colors without modifier, shared between all the fg()/bg() calls
+    _fgCache = {}
+    _bgCache = {}
+    # ansi escape sequence -> color
+    _ansiCache = {}
+    # Max number of colors in each of the caches above, flushed when full
+    cacheSize = 0x1000
+
     @staticmethod
     def hexToRGB(val):
         r = int(val[1:3],base=16)
@@ -332,8 +455,12 @@ class TTkColor(_TTkColor):
 
     @staticmethod
     def ansi(ansi):
-        fg,bg,mod,clean = TTkHelper.Color.ansi2rgb(ansi)
-        return TTkColor(fg=fg, bg=bg, mod=mod, clean=clean)
+        if (ret := TTkColor._ansiCache.get(ansi)) is None:
+            if len(TTkColor._ansiCache) >= TTkColor.cacheSize:
+                TTkColor._ansiCache.clear()
+            fg,bg,mod,clean = TTkHelper.Color.ansi2rgb(ansi)
+            ret = TTkColor._ansiCache[ansi] = TTkColor(fg=fg, bg=bg, mod=mod, clean=clean)
+        return ret
 
     @staticmethod
     def fg(*args, **kwargs):
@@ -357,6 +484,12 @@ class TTkColor(_TTkColor):
             color = args[0]
         else:
             color = kwargs.get('color', "" )
+        if mod is None:
+            if (ret := TTkColor._fgCache.get(color)) is None:
+                if len(TTkColor._fgCache) >= TTkColor.cacheSize:
+                    TTkColor._fgCache.clear()
+                ret = TTkColor._fgCache[color] = TTkColor(fg=TTkColor.hexToRGB(color))
+            return ret
         return TTkColor(fg=TTkColor.hexToRGB(color), colorMod=mod)
 
     @staticmethod
@@ -381,4 +514,13 @@ class TTkColor(_TTkColor):
             color = args[0]
         else:
             color = kwargs.get('color', "" )
+        if mod is None:
+            if (ret := TTkColor._bgCache.get(color)) is None:
+                if len(TTkColor._bgCache) >= TTkColor.cacheSize:
+                    TTkColor._bgCache.clear()
+                ret = TTkColor._bgCache[color] = TTkColor(bg=TTkColor.hexToRGB(color))
+            return ret
         return TTkColor(bg=TTkColor.hexToRGB(color), colorMod=mod)
+
+# The id 0 is reserved to the reset color
+TTkColor.RST.colorId()
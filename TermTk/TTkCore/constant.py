@@ -137,6 +137,17 @@ class TTkConstant:
     AscendingOrder  = SortOrder.AscendingOrder
     DescendingOrder = SortOrder.DescendingOrder
 
+    class ItemDataRole(int):
+        '''The roles of the data provided by a model (see :class:`~TermTk.TTkAbstract.abstracttablemodel.TTkAbstractTableModel`)
+        '''
+        DisplayRole       = 0x00
+        '''The data to be rendered (str or :class:`~TermTk.TTkCore.string.TTkString`).'''
+        TextAlignmentRole = 0x07
+        '''The alignment of the text (:class:`~TermTk.TTkCore.constant.TTkConstant.Alignment`).'''
+
+    DisplayRole       = ItemDataRole.DisplayRole
+    TextAlignmentRole = ItemDataRole.TextAlignmentRole
+
     NoInsert             = InsertPolicy.NoInsert
     InsertAtTop          = InsertPolicy.InsertAtTop
     # InsertAtCurrent      = InsertPolicy.InsertAtCurrent
@@ -24,60 +24,61 @@
 
 import os
 import re
+import mmap
 import threading
+from array import array
+from operator import add
+from itertools import accumulate, count
+
 from TermTk.TTkCore.log import TTkLog
 from TermTk.TTkCore.signal import pyTTkSignal
 
 '''
-             w1   w3   w2   w5
-    Buffer |----|----|----|----|            cache buffer
-             |      \ /       \
-             |       x         \
-             |      / \         \
-    Pages  | 0  | 2  | 1  |None| 3  |None|  index to buffer
-    File   |----|----|----|----|----|----|  view as list of windows
-             w1   w2   w3   w4   w5   w6
+    Index   |0   |1   |2   |3   |4   |5   |6   | ...      array('Q') offset of the beginning of each line
+    File    |----------------------------------|          mmap, decoded only by pages of "window" lines
+    Pages   | p0      | p1      | p2      | p3 |
+    Cache   { p3:[lines], p0:[lines], p2:[lines] }        dict ordered from the least recently used,
+                                                          up to "numWindows" decoded pages
 '''
 class TTkFileBuffer():
-    class _Page:
-        __slots__ = ('_page', '_size', '_buffer')
-        def __init__(self, page, size):
-            self._page = page
-            self._size = size
-            self._buffer = [""]*self._size
-            #TTkLog.debug(f"{self._buffer}")
-        @property
-        def buffer(self):
-            return self._buffer
-        @property
-        def page(self):
-            return self._page
-
     __slots__ = (
         '_indexes', '_indexesMutex',
-        '_filename', '_fd',
-        '_pages', '_buffer',
+        '_filename', '_fd', '_mm', '_size',
+        '_pages',
         '_window', '_numW',
-        '_width',
+        '_width', '_indexing',
+        '_searchId', '_searchResults', '_searchMutex',
         #Signals
-        'indexUpdated', 'indexed')
+        'indexUpdated', 'indexed',
+        'searchUpdated', 'searched')
     def __init__(self, filename, window, numWindows):
         # Signals
         self.indexUpdated = pyTTkSignal(float)
         self.indexed = pyTTkSignal()
+        # (matching lines, progress) found in the last scanned chunk
+        self.searchUpdated = pyTTkSignal(list, float)
+        self.searched = pyTTkSignal()
 
         self._window = window
         self._numW = numWindows
         self._filename = filename
-        self._indexes = [0]
+        self._indexes = array('Q',[0])
         self._indexesMutex = threading.Lock()
         self._width=0
-        self._buffer = [None]*self._numW
-        self._pages = [None]
-        self._fd = open(self._filename)
-        threading.Thread(target=self.createIndex).start()
+        self._pages = {}
+        self._searchId = 0
+        self._searchResults = []
+        self._searchMutex = threading.Lock()
+        self._fd = open(self._filename,'rb')
+        self._size = os.fstat(self._fd.fileno()).st_size
+        # mmap does not support empty files
+        self._mm = mmap.mmap(self._fd.fileno(), 0, access=mmap.ACCESS_READ) if self._size else b''
+        self._indexing = True
+        threading.Thread(target=self.createIndex, daemon=True).start()
 
     def __del__(self):
+        if self._mm:
+            self._mm.close()
         self._fd.close()
 
     def getLen(self):
@@ -86,39 +87,55 @@ class TTkFileBuffer():
     def getWidth(self, indexes=None):
        return self._width
 
+    def _lineEnd(self, line):
+        ''' Return the offset of the end of the line (after the newline) '''
+        with self._indexesMutex:
+            if line+1 < len(self._indexes):
+                return self._indexes[line+1]
+            start = self._indexes[line]
+        # The next line is not indexed (yet)
+        return self._mm.find(b'\n', start)+1 or self._size
+
+    @staticmethod
+    def _decode(data):
+        text = data.decode(errors='replace')
+        if '\r' in text:
+            text = text.replace('\r\n','\n')
+        return text
+
     def getLineDirect(self, line):
         if line >= self.getLen():
             return ""
-        self._indexesMutex.acquire()
-        self._fd.seek(self._indexes[line])
-        self._indexesMutex.release()
-        return self._fd.readline()
+        return self._decode(self._mm[self._indexes[line]:self._lineEnd(line)])
+
+    def _loadPage(self, page):
+        fr = page*self._window
+        to = min(fr+self._window, self.getLen())
+        if fr >= to: return []
+        data = self._decode(self._mm[self._indexes[fr]:self._lineEnd(to-1)])
+        lines = data.split('\n')
+        last = lines.pop()
+        lines = [l+'\n' for l in lines]
+        if last:
+            lines.append(last)
+        return lines
 
     def getLine(self, line):
         if line >= self.getLen():
             return ""
         page = line//self._window
         offset = line%self._window
-        if self._pages[page] == None:
-            # Dispose of the pages to the bottom
-            dispose = self._buffer.pop(0)
-            if dispose is not None:
-                self._pages[dispose.page] = None
-            self._pages[page] = self._Page(page, self._window)
-            self._buffer.append(self._pages[page])
-            self._indexesMutex.acquire()
-            self._fd.seek(self._indexes[line-offset])
-            self._indexesMutex.release()
-            buffer = self._pages[page].buffer
-            for i in range(self._window):
-                buffer[i] = self._fd.readline()
-                #self._width = max(self._width,len(buffer[i]))
-        else:
-            # Push the page to the top of the buffer
-            i = self._buffer.index(self._pages[page])
-            p = self._buffer.pop(i)
-            self._buffer.append(p)
-        return self._pages[page].buffer[offset]
+        if (lines := self._pages.pop(page, None)) is None:
+            lines = self._loadPage(page)
+            # The last page may grow while the file is indexed
+            if len(lines) < self._window and self._indexing:
+                return lines[offset] if offset < len(lines) else ""
+            # Dispose of the least recently used page
+            if len(self._pages) >= self._numW:
+                del self._pages[next(iter(self._pages))]
+        # Push the page to the top of the cache
+        self._pages[page] = lines
+        return lines[offset] if offset < len(lines) else ""
 
     def getSlice(self, line, length):
         ret = []
@@ -126,48 +143,160 @@ class TTkFileBuffer():
             ret.append(self.getLine(i))
         return ret
 
-    def createIndex(self):
+    def refresh(self):
+        ''' Index the data appended to the file (if any) in the background,
+        the indexUpdated/indexed signals are emitted as for the initial indexing
+
+        :return: True if the file is grown
+        '''
+        if self._indexing:
+            return False
+        size = os.fstat(self._fd.fileno()).st_size
+        if size <= self._size:
+            return False
+        # The previous map may still be used by a search in progress,
+        # it is released when no longer referenced
+        self._mm = mmap.mmap(self._fd.fileno(), 0, access=mmap.ACCESS_READ)
+        self._size = size
+        # The last line and page are not complete anymore
+        lastPage = (self.getLen()-1)//self._window
+        for page in list(self._pages):
+            if page >= lastPage:
+                self._pages.pop(page, None)
+        self._indexing = True
+        threading.Thread(target=self.createIndex, args=(self._indexes[-1],), daemon=True).start()
+        return True
+
+    def createIndex(self, offset=0):
+        ''' Index the lines from "offset" (the beginning of the last indexed line) '''
         # TTkLog.debug(f"Start Indexing {self._filename}")
-        indexes = []
-        offset = 0
-        fileSize = os.stat(self._filename).st_size
+        fileSize = self._size
         chunkSize = 0x1000000 # ~16M
-        with open(self._filename,'rb') as infile:
-            while (chunk:=infile.read(chunkSize)):
-                start = 0
-                while (index:=chunk.find(0x0A,start))!=-1:
-                    indexes.append(index+offset+1)
-                    start = index+1
-                self._indexesMutex.acquire()
-                self._indexes += indexes
-                self._pages += [None]*(1+(self.getLen()//self._window)-(len(self._pages)))
-                self._indexesMutex.release()
-                indexes = []
-                offset+=len(chunk)
-                self.indexUpdated.emit(offset/fileSize)
-                # TTkLog.debug(f"{self._filename} {offset/fileSize} ...")
-        self._width = max( (self._indexes[i+1]-self._indexes[i]) for i in range(len(self._indexes)-1) )
+        while offset < fileSize:
+            chunk = self._mm[offset:offset+chunkSize]
+            # Index only the complete lines of the chunk
+            if (end := chunk.rfind(b'\n')+1) and offset+len(chunk) < fileSize:
+                chunk = chunk[:end]
+            lines = chunk.split(b'\n')
+            lines.pop()
+            if lines:
+                # Offset of the beginning of the line following each line:
+                #    offset + (len(lines[0]) + ... + len(lines[i])) + (i+1) newlines
+                indexes = array('Q', map(add, accumulate(map(len, lines)), count(offset+1)))
+                with self._indexesMutex:
+                    self._indexes.extend(indexes)
+                self._width = max(self._width, max(map(len, lines))+1)
+            offset += len(chunk)
+            self.indexUpdated.emit(offset/fileSize)
+            # TTkLog.debug(f"{self._filename} {offset/fileSize} ...")
+        self._indexing = False
         self.indexUpdated.emit(1.0)
         self.indexed.emit()
         # TTkLog.debug(f"{self._filename} {offset/fileSize} END")
 
+    def _searchChunks(self, txt, regex=True, ignoreCase=False):
+        ''' Scan the file by chunks of complete lines,
+        yield the (matching lines, progress) of each chunk '''
+        # A regex without special characters is a plain text
+        if regex and re.escape(txt) == txt:
+            regex = False
+        if not regex and not ignoreCase and '\n' not in txt and '\r' not in txt:
+            # Plain text, bytes.find is way faster than the re engine
+            # and the utf-8 encoded text is matched exactly as the decoded one
+            needle, nl = txt.encode(), b'\n'
+            decode = False
+            def _find(data, pos):
+                return data.find(needle, pos)
+        else:
+            if not regex:
+                txt = re.escape(txt)
+            flags = re.IGNORECASE if ignoreCase else 0
+            # The chunk is decoded, the patterns are matched on the text of the lines
+            # (i.e. "\w", "." or the case are evaluated on the unicode chars and "$" is not affected by "\r\n")
+            decode, nl = True, '\n'
+            rr = re.compile(txt, flags | re.MULTILINE)
+            rl = re.compile(txt, flags)
+            def _find(data, pos):
+                while ma := rr.search(data, pos):
+                    a, b = ma.span()
+                    # The pattern is matched per line (newline included),
+                    # a match across the lines is not valid (i.e. "\s" or "[^x]" matching the newline)
+                    if data.find(nl, a, b-1) == -1:
+                        return a
+                    # Check only the line where the match starts
+                    end = data.find(nl, a)+1
+                    if rl.search(data[data.rfind(nl, 0, a)+1:end]):
+                        return a
+                    pos = end
+                return -1
+        offset = 0
+        line = 0
+        lastHit = -1
+        fileSize = self._size
+        chunkSize = 0x400000 # ~4M
+        while offset < fileSize:
+            chunk = self._mm[offset:offset+chunkSize]
+            if (end := chunk.rfind(b'\n')+1) and offset+len(chunk) < fileSize:
+                chunk = chunk[:end]
+            offset += len(chunk)
+            data = self._decode(chunk) if decode else chunk
+            hits = []
+            pos = lastPos = 0
+            while (a := _find(data, pos)) != -1:
+                line += data.count(nl, lastPos, a)
+                lastPos = a
+                # A line longer than the chunk may be matched in multiple chunks
+                if line != lastHit:
+                    hits.append(line)
+                    lastHit = line
+                # Continue from the next line
+                if (pos := data.find(nl, a)) == -1:
+                    break
+                pos += 1
+            line += data.count(nl, lastPos)
+            yield hits, offset/fileSize
+
     def searchRe(self, regex, ignoreCase=False):
-        indexes = []
-        id = 0
-        rr = re.compile(regex, re.IGNORECASE if ignoreCase else 0)
         TTkLog.debug(f"Search RE: {regex}")
-        with open(self._filename) as infile:
-            for line in infile:
-                ma = rr.search(line)
-                if ma:
-                    indexes.append(id)
-                id += 1
+        indexes = []
+        for hits, _ in self._searchChunks(regex, True, ignoreCase):
+            indexes += hits
         return indexes
 
     def search(self, txt):
         indexes = []
-        with open(self._filename) as infile:
-            for line in infile:
-                if txt in line:
-                    indexes.append(id)
+        for hits, _ in self._searchChunks(txt, False):
+            indexes += hits
         return indexes
+
+    def startSearch(self, txt, regex=False, ignoreCase=False):
+        ''' Search in a background thread,
+        the matching lines are streamed through the :meth:`searchUpdated` signal
+        and the end of the search is notified by the :meth:`searched` signal,
+        any previous search is cancelled '''
+        with self._searchMutex:
+            self._searchId += 1
+            self._searchResults = []
+            searchId = self._searchId
+        threading.Thread(target=self._searchThread, args=(searchId, txt, regex, ignoreCase), daemon=True).start()
+
+    def cancelSearch(self):
+        with self._searchMutex:
+            self._searchId += 1
+
+    def searchResults(self):
+        ''' Return the matching lines found so far by :meth:`startSearch` '''
+        with self._searchMutex:
+            return self._searchResults.copy()
+
+    def _searchThread(self, searchId, txt, regex, ignoreCase):
+        for hits, progress in self._searchChunks(txt, regex, ignoreCase):
+            with self._searchMutex:
+                if searchId != self._searchId:
+                    return
+                self._searchResults += hits
+            self.searchUpdated.emit(hits, progress)
+        with self._searchMutex:
+            if searchId != self._searchId:
+                return
+        self.searched.emit()
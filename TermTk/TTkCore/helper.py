@@ -26,6 +26,7 @@ from TermTk.TTkCore.TTkTerm.colors import TTkTermColor
 from TermTk.TTkCore.TTkTerm.term import TTkTerm
 from TermTk.TTkCore.cfg import TTkCfg, TTkGlbl
 from TermTk.TTkCore.constant import TTkK
+from TermTk.TTkCore.renderstats import TTkRenderStats
 
 class TTkHelper:
     # TODO: Add Setter/Getter
@@ -34,6 +35,8 @@ class TTkHelper:
     _rootWidget = None
     _updateWidget = []
     _updateBuffer  = []
+    _maxDamageRects = 8
+    _frameRequestCb = None
     _mousePos = (0,0)
     _cursorPos = [0,0]
     _cursor = False
@@ -79,12 +82,25 @@ class TTkHelper:
         if not widget.isVisibleAndParent(): return
         if widget not in TTkHelper._updateWidget:
             TTkHelper._updateWidget.append(widget)
+            TTkHelper.requestFrame()
 
     @staticmethod
     def addUpdateBuffer(canvas):
         if canvas is not TTkHelper._rootCanvas:
             if canvas not in TTkHelper._updateBuffer:
                 TTkHelper._updateBuffer.append(canvas)
+                TTkHelper.requestFrame()
+
+    @staticmethod
+    def registerFrameRequestCb(callback):
+        '''Register the routine used by the main loop to schedule a new frame'''
+        TTkHelper._frameRequestCb = callback
+
+    @staticmethod
+    def requestFrame():
+        '''Notify the main loop that something needs to be painted'''
+        if TTkHelper._frameRequestCb is not None:
+            TTkHelper._frameRequestCb()
 
     @staticmethod
     def registerRootWidget(widget):
@@ -241,59 +257,163 @@ class TTkHelper:
         '''
             _updateBuffer = list widgets that require a repaint [paintEvent]
             _updateWidget = list widgets that need to be pushed below
+
+            Only the damaged areas are composed and pushed to the terminal:
+
+            * a repainted or pushed widget damages its whole area in the parent canvas
+            * the damaged areas of a child are propagated to the parent canvas
+            * only the damaged areas of the root canvas are compared with the terminal
         '''
         if TTkHelper._rootCanvas is None:
             return
 
-        # Build a list of buffers to be repainted
-        updateBuffers = TTkHelper._updateBuffer.copy()
-        updateWidgets = TTkHelper._updateWidget.copy()
-
-        # TTkLog.debug(f"{len(TTkHelper._updateBuffer)} {len(TTkHelper._updateWidget)}")
-        for widget in TTkHelper._updateWidget:
-            if not widget.isVisibleAndParent(): continue
-            parent = widget.parentWidget()
-            while parent is not None:
-                if parent not in updateBuffers:
-                    updateBuffers.append(parent)
-                if parent not in updateWidgets:
-                    updateWidgets.append(parent)
-                parent = parent.parentWidget()
+        # The color ids are restarted if the registry is full,
+        # all the canvases must be painted again
+        from TermTk.TTkCore.color import TTkColor
+        if TTkColor._checkRegistry():
+            TTkHelper.rePaintAll()
+            for w in TTkHelper._rootWidget.rootLayout().iterWidgets(onlyVisible=False):
+                w.update()
 
-        TTkHelper._updateBuffer = []
-        TTkHelper._updateWidget = []
+        # Swap the lists before filtering them, the updates requested
+        # in the meantime (i.e. from other threads) are left to the next frame
+        updateBuffers, TTkHelper._updateBuffer = TTkHelper._updateBuffer, []
+        updateWidgets, TTkHelper._updateWidget = TTkHelper._updateWidget, []
+        updateBuffers = [w for w in updateBuffers if w.isVisibleAndParent()]
+        updateWidgets = [w for w in updateWidgets if w.isVisibleAndParent()]
+
+        # Frame statistics, None if not enabled
+        stats = TTkRenderStats._newFrame()
 
         # Paint all the canvas
         for widget in updateBuffers:
-            if not widget.isVisibleAndParent(): continue
             # Resize the canvas just before the paintEvent
             # to avoid too many allocations
             widget.getCanvas().updateSize()
             widget.getCanvas().clean()
-            widget.paintEvent()
+            if stats is None:
+                widget.paintEvent()
+            else:
+                t = TTkRenderStats._perf()
+                widget.paintEvent()
+                stats.addPaint(widget, TTkRenderStats._perf()-t)
+
+        if stats is not None:
+            t = TTkRenderStats._perf()
+
+        # damage = { widget: list of (x,y,w,h) in the widget canvas,
+        #                    None if the whole canvas need to be composed }
+        damage = {w:None for w in updateBuffers}
+        pushed = set(updateBuffers)
+        pushed.update(updateWidgets)
+        levels = {}
+        for widget in pushed:
+            levels.setdefault(TTkHelper.widgetDepth(widget),[]).append(widget)
 
         # Compose all the canvas to the parents
         # From the deepest children to the bottom
-        pushToTerminal = False
-        sortedUpdateWidget = [ (w, TTkHelper.widgetDepth(w)) for w in updateWidgets]
-        sortedUpdateWidget = sorted(sortedUpdateWidget, key=lambda w: -w[1])
-        for w in sortedUpdateWidget:
-            widget = w[0]
-            if not widget.isVisibleAndParent(): continue
-            pushToTerminal = True
-            widget.paintChildCanvas()
-
-        if pushToTerminal:
-            if TTkHelper._cursor:
-                TTkTerm.Cursor.hide()
-            if TTkCfg.doubleBuffer:
-                TTkHelper._rootCanvas.pushToTerminalBuffered(0, 0, TTkGlbl.term_w, TTkGlbl.term_h)
+        rootDamage = []
+        for depth in range(max(levels,default=0), 0, -1):
+            # levels[depth] may be extended while processing the deeper level
+            for widget in levels.get(depth,[]):
+                rects = damage.get(widget,[])
+                if rects is None:
+                    widget.paintChildCanvas()
+                else:
+                    for rect in rects:
+                        widget.paintChildCanvas(rect)
+                if widget in pushed or rects is None:
+                    rects = [(0,0)+widget.size()]
+                if (parent := widget.parentWidget()) is None:
+                    rootDamage = rects
+                    continue
+                if (parentRects := damage.get(parent,[])) is None:
+                    continue
+                if parent not in damage:
+                    damage[parent] = parentRects
+                    if parent not in pushed:
+                        levels.setdefault(depth-1,[]).append(parent)
+                px,py = TTkHelper._canvasPos(widget)
+                for x,y,w,h in rects:
+                    TTkHelper._addDamage(parentRects,(x+px,y+py,w,h))
+
+        if stats is not None:
+            stats.composed = sum(len(l) for l in levels.values())
+            stats.composeTime = TTkRenderStats._perf()-t
+
+        if rootDamage:
+            if stats is not None:
+                t = TTkRenderStats._perf()
+            TTkTerm.beginFrame()
+            # The frame must be always closed,
+            # an open frame swallows all the following pushes (i.e. the exit sequences)
+            try:
+                if TTkHelper._cursor:
+                    TTkTerm.Cursor.hide()
+                if TTkCfg.doubleBuffer:
+                    for x,y,w,h in rootDamage:
+                        TTkHelper._rootCanvas.pushToTerminalBuffered(x, y, w, h)
+                else:
+                    TTkHelper._rootCanvas.pushToTerminal(0, 0, TTkGlbl.term_w, TTkGlbl.term_h)
+                if TTkHelper._cursor:
+                    x,y = TTkHelper._cursorPos
+                    TTkTerm.push(TTkTerm.Cursor.moveTo(y+1,x+1))
+                    TTkTerm.Cursor.show(TTkHelper._cursorType)
+            finally:
+                tw = TTkRenderStats._perf() if stats is not None else 0
+                data = TTkTerm.endFrame()
+            if stats is not None:
+                stats.writeTime = TTkRenderStats._perf()-tw
+                stats.encodeTime = tw-t
+                stats.bytes = len(data.encode()) if data else 0
+
+        if stats is not None:
+            TTkRenderStats._endFrame(stats)
+
+    @staticmethod
+    def _canvasPos(widget):
+        ''' Return the position of the widget canvas in the parent canvas '''
+        x,y = widget.pos()
+        rootLayout = widget.parentWidget().rootLayout()
+        layout = widget.widgetItem().parent()
+        while layout is not None:
+            lx,ly = layout.pos()
+            ox,oy = layout.offset()
+            x += lx+ox
+            y += ly+oy
+            if layout is rootLayout:
+                # The root layout position is added twice in the composition
+                x += lx
+                y += ly
+                break
+            layout = layout.parent()
+        return x,y
+
+    @staticmethod
+    def _addDamage(rects, rect):
+        ''' Merge the area (x,y,w,h) to the list of damaged areas '''
+        x,y,w,h = rect
+        if w<=0 or h<=0: return
+        x2,y2 = x+w,y+h
+        # Merge the overlapping areas
+        i = 0
+        while i < len(rects):
+            ax,ay,aw,ah = rects[i]
+            if ax<=x2 and x<=ax+aw and ay<=y2 and y<=ay+ah:
+                rects.pop(i)
+                x2,y2 = max(x2,ax+aw),max(y2,ay+ah)
+                x, y  = min(x,ax),min(y,ay)
+                i = 0
             else:
-                TTkHelper._rootCanvas.pushToTerminal(0, 0, TTkGlbl.term_w, TTkGlbl.term_h)
-            if TTkHelper._cursor:
-                x,y = TTkHelper._cursorPos
-                TTkTerm.push(TTkTerm.Cursor.moveTo(y+1,x+1))
-                TTkTerm.Cursor.show(TTkHelper._cursorType)
+                i += 1
+        rects.append((x,y,x2-x,y2-y))
+        # Too many areas, collapse them to the bounding box
+        if len(rects) > TTkHelper._maxDamageRects:
+            x  = min(r[0]      for r in rects)
+            y  = min(r[1]      for r in rects)
+            x2 = max(r[0]+r[2] for r in rects)
+            y2 = max(r[1]+r[3] for r in rects)
+            rects[:] = [(x,y,x2-x,y2-y)]
 
     @staticmethod
     def rePaintAll():
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2023 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import time
+from collections import deque
+from collections.abc import Callable
+
+class TTkFrameStats:
+    '''Statistics of a single frame rendered by :meth:`TTkHelper.paintAll`
+
+    :param repainted: number of widgets repainted (paintEvent)
+    :param composed: number of widgets composed to their parent
+    :param paintTime: {widget class name: [count, seconds]} spent in the paintEvent
+    :param composeTime: seconds spent composing the canvases
+    :param encodeTime: seconds spent in the terminal diff and encoding
+    :param writeTime: seconds spent writing to the terminal
+    :param bytes: bytes written to the terminal
+    '''
+    __slots__ = (
+        'time', 'repainted', 'composed',
+        'paintTime', 'composeTime', 'encodeTime', 'writeTime',
+        'bytes')
+    def __init__(self):
+        self.time        = time.time()
+        self.repainted   = 0
+        self.composed    = 0
+        self.paintTime   = {}
+        self.composeTime = 0.0
+        self.encodeTime  = 0.0
+        self.writeTime   = 0.0
+        self.bytes       = 0
+
+    def addPaint(self, widget, delta:float):
+        name = type(widget).__name__
+        if (pt := self.paintTime.get(name)) is None:
+            pt = self.paintTime[name] = [0, 0.0]
+        pt[0] += 1
+        pt[1] += delta
+        self.repainted += 1
+
+    def totalTime(self) -> float:
+        return sum(t for _,t in self.paintTime.values()) + self.composeTime + self.encodeTime + self.writeTime
+
+    def __str__(self):
+        return (f"FrameStats repainted:{self.repainted} composed:{self.composed} "
+                f"paint:{sum(t for _,t in self.paintTime.values())*1000:.2f}ms "
+                f"compose:{self.composeTime*1000:.2f}ms encode:{self.encodeTime*1000:.2f}ms "
+                f"write:{self.writeTime*1000:.2f}ms bytes:{self.bytes}")
+
+class TTkRenderStats:
+    '''Collect the statistics of the rendered frames
+
+    The collection is disabled by default and has no cost until :meth:`enable` is called
+
+    ::
+
+        TTkRenderStats.enable()
+        ...
+        for fs in TTkRenderStats.frames():
+            print(fs)
+    '''
+    _enabled = False
+    _frames = deque(maxlen=128)
+    _frameHandler = []
+    _perf = time.perf_counter
+
+    @staticmethod
+    def enable(history:int=128):
+        '''Start collecting the statistics, the last "history" frames are retained'''
+        if TTkRenderStats._frames.maxlen != history:
+            TTkRenderStats._frames = deque(TTkRenderStats._frames, maxlen=history)
+        TTkRenderStats._enabled = True
+
+    @staticmethod
+    def disable():
+        TTkRenderStats._enabled = False
+
+    @staticmethod
+    def isEnabled() -> bool:
+        return TTkRenderStats._enabled
+
+    @staticmethod
+    def clear():
+        TTkRenderStats._frames.clear()
+
+    @staticmethod
+    def frames() -> list:
+        '''Return the retained :class:`TTkFrameStats`, from the oldest'''
+        return list(TTkRenderStats._frames)
+
+    @staticmethod
+    def lastFrame():
+        return TTkRenderStats._frames[-1] if TTkRenderStats._frames else None
+
+    @staticmethod
+    def paintTimeByClass(frames=None) -> list:
+        '''Return the (class name, count, seconds) spent in the paintEvent
+        of the retained frames, sorted from the most expensive'''
+        ret = {}
+        for fs in TTkRenderStats._frames if frames is None else frames:
+            for name,(count,delta) in fs.paintTime.items():
+                pt = ret.setdefault(name,[0,0.0])
+                pt[0] += count
+                pt[1] += delta
+        return sorted(((n,c,t) for n,(c,t) in ret.items()), key=lambda x: -x[2])
+
+    @staticmethod
+    def installFrameHandler(fh: Callable):
+        '''Install a routine called with the :class:`TTkFrameStats` of each rendered frame'''
+        TTkRenderStats._frameHandler.append(fh)
+
+    @staticmethod
+    def removeFrameHandler(fh: Callable):
+        if fh in TTkRenderStats._frameHandler:
+            TTkRenderStats._frameHandler.remove(fh)
+
+    @staticmethod
+    def _newFrame():
+        return TTkFrameStats() if TTkRenderStats._enabled else None
+
+    @staticmethod
+    def _endFrame(fs:TTkFrameStats):
+        TTkRenderStats._frames.append(fs)
+        for fh in TTkRenderStats._frameHandler:
+            fh(fs)
@@ -23,11 +23,83 @@
 # SOFTWARE.
 
 import re
-import unicodedata
 
 from TermTk.TTkCore.cfg import TTkCfg
 from TermTk.TTkCore.constant import TTkK
 from TermTk.TTkCore.color import TTkColor, _TTkColor
+from TermTk.TTkCore.charwidth import _TTkCharWidth
+
+class _TTkColorRuns():
+    ''' Run-length colors of a :class:`TTkString`
+
+    The runs are a list of (end, color) sorted by "end" (excluded),
+    the last "end" is the length of the text.
+    All the routines return new lists, the input runs are never changed
+    '''
+    __slots__ = ()
+
+    @staticmethod
+    def fill(color, length:int) -> list:
+        return [(length,color)] if length > 0 else []
+
+    @staticmethod
+    def extend(runs:list, other:list, offset:int) -> list:
+        ''' Append (in place) the "other" runs shifted by "offset" (the length of "runs") '''
+        if not other: return runs
+        if runs and runs[-1][1] is other[0][1]:
+            runs[-1] = (other[0][0]+offset, other[0][1])
+            other = other[1:]
+        runs += [(end+offset,color) for end,color in other]
+        return runs
+
+    @staticmethod
+    def concat(a:list, b:list, offset:int) -> list:
+        return _TTkColorRuns.extend(list(a), b, offset)
+
+    @staticmethod
+    def slice(runs:list, fr:int, to:int) -> list:
+        ''' Return the runs of the [fr,to) slice, 0 <= fr <= to <= length '''
+        ret = []
+        if fr >= to: return ret
+        for end,color in runs:
+            if end > fr:
+                ret.append((min(end,to)-fr,color))
+                if end >= to: break
+        return ret
+
+    @staticmethod
+    def setRange(runs:list, fr:int, to:int, color, length:int) -> list:
+        if fr >= to: return list(runs)
+        ret = _TTkColorRuns.slice(runs, 0, fr)
+        _TTkColorRuns.extend(ret, [(to-fr,color)], fr)
+        return _TTkColorRuns.extend(ret, _TTkColorRuns.slice(runs, to, length), to)
+
+    @staticmethod
+    def colorAt(runs:list, pos:int):
+        for end,color in runs:
+            if pos < end: return color
+        raise IndexError("color index out of range")
+
+    @staticmethod
+    def expand(runs:list) -> list:
+        ''' Return the list of the colors of each char '''
+        ret = []
+        start = 0
+        for end,color in runs:
+            ret += [color]*(end-start)
+            start = end
+        return ret
+
+    @staticmethod
+    def compress(colors:list) -> list:
+        ''' Return the runs of the list of colors of each char '''
+        ret = []
+        for i,color in enumerate(colors):
+            if ret and ret[-1][1] is color:
+                ret[-1] = (i+1,color)
+            else:
+                ret.append((i+1,color))
+        return ret
 
 class TTkString():
     ''' TermTk String Helper
@@ -58,35 +130,100 @@ class TTkString():
         # Combination of constructors (Highly Unrecommended)
         str7 = TTkString("test 7", color=TTkColor.fg('#FF0000'))
     '''
-    __slots__ = ('_text','_colors','_baseColor','_hasTab','_hasSpecialWidth')
+    # _runs: run-length colors (see _TTkColorRuns),
+    # expanded to the color of each char only when drawn (getData)
+    __slots__ = ('_text','_runs','_baseColor','_hasTab','_hasSpecialWidth')
 
     def __init__(self, text="", color=None):
         if issubclass(type(text), TTkString):
             self._text      = text._text
-            self._colors    = text._colors if color is None else [color]*len(self._text)
+            self._runs      = text._runs if color is None else _TTkColorRuns.fill(color, len(self._text))
             self._baseColor = text._baseColor
         else:
             self._baseColor = TTkColor.RST if color is None else color
-            self._text, self._colors = TTkString._parseAnsi(str(text), self._baseColor)
+            self._text, self._runs = TTkString._parseAnsi(str(text), self._baseColor)
         self._hasTab = '\t' in self._text
         self._checkWidth()
         # raise AttributeError(f"{type(text)} not supported in TTkString")
 
+    _ansiRe     = re.compile('\033[^m]*m')
+    _ansiLineRe = re.compile('(\033[^m\n]*m)')
+
     @staticmethod
     def _parseAnsi(text, color = TTkColor.RST):
+        if '\033' not in text:
+            return text, _TTkColorRuns.fill(color, len(text))
         pos = 0
-        txtret = ""
-        colret = []
-        for m in re.findall('\033[^m]*m', text):
-            index = text.index(m,pos)
-            txt = text[pos:index]
-            txtret += txt
-            colret += [color]*len(txt)
-            color+=TTkColor.ansi(m)
-            pos = index+len(m)
-        txtret += text[pos:]
-        colret += [color]*(len(text)-pos)
-        return txtret, colret
+        length = 0
+        txtret = []
+        runs = []
+        ansi = TTkColor.ansi
+        for m in TTkString._ansiRe.finditer(text):
+            a,b = m.span()
+            if a > pos:
+                txtret.append(text[pos:a])
+                length += a-pos
+                if runs and runs[-1][1] is color:
+                    runs[-1] = (length,color)
+                else:
+                    runs.append((length,color))
+            color += ansi(m.group())
+            pos = b
+        if pos < len(text):
+            txtret.append(text[pos:])
+            _TTkColorRuns.extend(runs, [(len(text)-pos,color)], length)
+        return ''.join(txtret), runs
+
+    @staticmethod
+    def fromAnsiLines(text:str, color=None, retainColor=True) -> list:
+        ''' Return the list of :class:`TTkString` of each line of the ansi text
+
+        The text is parsed once, by default the colors are retained across the lines
+        like in the terminal output
+
+        :param text: the text, including the ansi escape sequences
+        :type text: str
+        :param color: the initial color, defaults to :class:`~TermTk.TTkCore.color.TTkColor.RST`
+        :type color: :class:`~TermTk.TTkCore.color.TTkColor`, optional
+        :param retainColor: retain the color across the lines, if False each line starts with the initial color, defaults to True
+        :type retainColor: bool, optional
+        '''
+        baseColor = color = TTkColor.RST if color is None else color
+        ansi = TTkColor.ansi
+        # (id(color), escape) -> (color, color+escape)
+        # the source color is retained to keep its id valid
+        trans = {}
+        ret = []
+        for line in text.split('\n'):
+            if not retainColor:
+                color = baseColor
+            if '\033' not in line:
+                runs = [(len(line),color)] if line else []
+            else:
+                parts = TTkString._ansiLineRe.split(line)
+                runs = []
+                length = 0
+                for i in range(0,len(parts),2):
+                    if i:
+                        key = (id(color), parts[i-1])
+                        if (t := trans.get(key)) is None:
+                            t = trans[key] = (color, color + ansi(parts[i-1]))
+                        color = t[1]
+                    if chunk := parts[i]:
+                        length += len(chunk)
+                        if runs and runs[-1][1] is color:
+                            runs[-1] = (length,color)
+                        else:
+                            runs.append((length,color))
+                line = ''.join(parts[0::2])
+            s = TTkString.__new__(TTkString)
+            s._text = line
+            s._runs = runs
+            s._baseColor = baseColor
+            s._hasTab = '\t' in line
+            s._checkWidth()
+            ret.append(s)
+        return ret
 
     def termWidth(self):
         return self._hasSpecialWidth if self._hasSpecialWidth is not None else len(self)
@@ -102,18 +239,18 @@ class TTkString():
         ret._baseColor = self._baseColor
         if   isinstance(other, TTkString):
             ret._text   = self._text   + other._text
-            ret._colors = self._colors + other._colors
+            ret._runs   = _TTkColorRuns.concat(self._runs, other._runs, len(self._text))
             ret._hasTab = '\t' in ret._text
             ret._fastCheckWidth(self._hasSpecialWidth, other._hasSpecialWidth)
         elif isinstance(other, str):
-            atxt, acol = TTkString._parseAnsi(other, self._baseColor)
+            atxt, aruns = TTkString._parseAnsi(other, self._baseColor)
             ret._text   = self._text   + atxt
-            ret._colors = self._colors + acol
+            ret._runs   = _TTkColorRuns.concat(self._runs, aruns, len(self._text))
             ret._hasTab = '\t' in ret._text
             ret._checkWidth()
         elif isinstance(other, _TTkColor):
             ret._text   = self._text
-            ret._colors = self._colors
+            ret._runs   = self._runs
             ret._hasSpecialWidth = self._hasSpecialWidth
             ret._hasTab = self._hasTab
             ret._baseColor = other
@@ -124,12 +261,12 @@ class TTkString():
         ret._baseColor = self._baseColor
         if  isinstance(other, TTkString):
             ret._text   = other._text   + self._text
-            ret._colors = other._colors + self._colors
+            ret._runs   = _TTkColorRuns.concat(other._runs, self._runs, len(other._text))
             ret._hasTab = '\t' in ret._text
             ret._fastCheckWidth(self._hasSpecialWidth, other._hasSpecialWidth)
         elif isinstance(other, str):
             ret._text   = other + self._text
-            ret._colors = [self._baseColor]*len(other) + self._colors
+            ret._runs   = _TTkColorRuns.concat(_TTkColorRuns.fill(self._baseColor, len(other)), self._runs, len(other))
             ret._hasTab = '\t' in ret._text
             ret._checkWidth()
         return ret
@@ -161,7 +298,7 @@ class TTkString():
     def lstrip(self, ch):
         ret = TTkString()
         ret._text = self._text.lstrip(ch)
-        ret._colors = self._colors[-len(ret._text):]
+        ret._runs = _TTkColorRuns.slice(self._runs, len(self._text)-len(ret._text), len(self._text))
         return ret
 
     def charAt(self, pos):
@@ -173,12 +310,18 @@ class TTkString():
         return self
 
     def colorAt(self, pos):
-        if pos >= len(self._colors):
+        if pos >= len(self._text):
             return TTkColor()
-        return self._colors[pos]
+        if pos < 0: pos += len(self._text)
+        if pos < 0:
+            raise IndexError("color index out of range")
+        return _TTkColorRuns.colorAt(self._runs, pos)
 
     def setColorAt(self, pos, color):
-        self._colors[pos] = color
+        if pos < 0: pos += len(self._text)
+        if not 0 <= pos < len(self._text):
+            raise IndexError("color index out of range")
+        self._runs = _TTkColorRuns.setRange(self._runs, pos, pos+1, color, len(self._text))
         return self
 
     def tab2spaces(self, tabSpaces=4):
@@ -188,15 +331,17 @@ class TTkString():
         slices = self._text.split("\t")
         ret._text += slices[0]
         pos = len(slices[0])
-        ret._colors += self._colors[0:pos]
+        runs = _TTkColorRuns.slice(self._runs, 0, pos)
         for s in slices[1:]:
-            c  = self._colors[pos]
+            c  = _TTkColorRuns.colorAt(self._runs, pos)
             lentxt = ret.termWidth()
             spaces = tabSpaces - (lentxt+tabSpaces)%tabSpaces
+            _TTkColorRuns.extend(runs, _TTkColorRuns.fill(c, spaces), len(ret._text))
+            _TTkColorRuns.extend(runs, _TTkColorRuns.slice(self._runs, pos+1, pos+1+len(s)), len(ret._text)+spaces)
             ret._text   += " "*spaces + s
-            ret._colors += [c]*spaces + self._colors[pos+1:pos+1+len(s)]
             ret._fastCheckWidth(self._hasSpecialWidth)
             pos+=len(s)+1
+        ret._runs = runs
         return ret
 
     def tabCharPos(self, pos, tabSpaces=4, alignTabRight=False):
@@ -255,15 +400,12 @@ class TTkString():
         # get pos in the slice:
         dx = pos
         pp = 0
+        cw = _TTkCharWidth.charWidth
         for i,ch in enumerate(self._text):
             if ch=='\t':
                 pp += tabSpaces - (pp+tabSpaces)%tabSpaces
-            elif unicodedata.east_asian_width(ch) == 'W':
-                pp += 2
-            elif unicodedata.category(ch) in ('Me','Mn'):
-                pass
             else:
-                pp += 1
+                pp += cw(ch)
             if dx < pp:
                 return i
         return len(self._text)
@@ -276,11 +418,13 @@ class TTkString():
         ''' Return the ansii (terminal colors/events) representation of the string '''
         out   = ""
         color = None
-        for ch, col in zip(self._text, self._colors):
+        start = 0
+        for end, col in self._runs:
             if col != color:
                 color = col
                 out += str(TTkColor.RST) + str(color)
-            out += ch
+            out += self._text[start:end]
+            start = end
         return out+str(TTkColor.RST)
 
     def align(self, width=None, color=TTkColor.RST, alignment=TTkK.NONE):
@@ -300,45 +444,48 @@ class TTkString():
 
         if lentxt < width:
             pad = width-lentxt
+            lenstr = len(self._text)
             if alignment in [TTkK.NONE, TTkK.LEFT_ALIGN]:
                 ret._text   = self._text   + " "    *pad
-                ret._colors = self._colors + [color]*pad
+                ret._runs   = _TTkColorRuns.concat(self._runs, _TTkColorRuns.fill(color,pad), lenstr)
             elif alignment == TTkK.RIGHT_ALIGN:
                 ret._text   = " "    *pad + self._text
-                ret._colors = [color]*pad + self._colors
+                ret._runs   = _TTkColorRuns.concat(_TTkColorRuns.fill(color,pad), self._runs, pad)
             elif alignment == TTkK.CENTER_ALIGN:
                 p1 = pad//2
                 p2 = pad-p1
                 ret._text   = " "    *p1 + self._text   + " "    *p2
-                ret._colors = [color]*p1 + self._colors + [color]*p2
+                ret._runs   = _TTkColorRuns.concat(_TTkColorRuns.fill(color,p1), self._runs, p1)
+                _TTkColorRuns.extend(ret._runs, _TTkColorRuns.fill(color,p2), p1+lenstr)
             elif alignment == TTkK.JUSTIFY:
                 # TODO: Text Justification
                 ret._text   = self._text   + " "    *pad
-                ret._colors = self._colors + [color]*pad
+                ret._runs   = _TTkColorRuns.concat(self._runs, _TTkColorRuns.fill(color,pad), lenstr)
         elif self._hasSpecialWidth is not None:
             # Trim the string to a fixed size taking care of the variable width unicode chars
             rt = ""
             sz = 0
+            cw = _TTkCharWidth.charWidth
             for ch in self._text:
                 rt += ch
-                if unicodedata.category(ch) in ('Me','Mn'):
+                if not (w := cw(ch)):
                     continue
 
-                sz += 2 if unicodedata.east_asian_width(ch) == 'W' else 1
+                sz += w
 
                 if sz == width:
                     ret._text   =  rt
-                    ret._colors =  self._colors[:len(rt)]
+                    ret._runs   =  _TTkColorRuns.slice(self._runs, 0, len(rt))
                     break
                 elif sz > width:
                     ret._text   =  rt[:-1]+TTkCfg.theme.unicodeWideOverflowCh[1]
-                    ret._colors =  self._colors[:len(ret._text)]
-                    ret._colors[-1] = TTkCfg.theme.unicodeWideOverflowColor
+                    lenret = len(ret._text)
+                    ret._runs   =  _TTkColorRuns.setRange(self._runs, lenret-1, lenret, TTkCfg.theme.unicodeWideOverflowColor, lenret)
                     break
         else:
             # Legacy, trim the string
             ret._text   =  self._text[:width]
-            ret._colors =  self._colors[:width]
+            ret._runs   =  _TTkColorRuns.slice(self._runs, 0, len(ret._text))
 
         ret._hasTab = '\t' in ret._text
         ret._fastCheckWidth(self._hasSpecialWidth)
@@ -361,31 +508,28 @@ class TTkString():
         new = args[1]
         count = args[2] if len(args)==3 else 0x1000000
 
-        if old not in self._text: return self
+        if not old or old not in self._text: return self
 
         oldLen = len(old)
         newLen = len(new)
 
         ret = TTkString()
         if oldLen == newLen:
-            ret._colors += self._colors
-            ret._text   = self._text.replace(*args, **kwargs)
-        elif oldLen > newLen:
-            start = 0
-            while pos := self._text.index(old, start) if old in self._text[start:] else None:
-                ret._colors += self._colors[start:pos+newLen]
-                start = pos+oldLen
-                count -= 1
-                if count == 0: break
-            ret._colors += self._colors[start:]
+            ret._runs   = self._runs
             ret._text   = self._text.replace(*args, **kwargs)
         else:
+            colors = _TTkColorRuns.expand(self._runs)
+            retColors = []
             start = 0
-            while pos := self._text.index(old, start) if old in self._text[start:] else None:
-                ret._colors += self._colors[start:pos+oldLen] + [self._colors[pos+oldLen-1]]*(newLen-oldLen)
+            while count and (pos := self._text.find(old, start)) != -1:
+                if oldLen > newLen:
+                    retColors += colors[start:pos+newLen]
+                else:
+                    retColors += colors[start:pos+oldLen] + [colors[pos+oldLen-1]]*(newLen-oldLen)
                 start = pos+oldLen
-                if count == 0: break
-            ret._colors += self._colors[start:]
+                count -= 1
+            retColors += colors[start:]
+            ret._runs   = _TTkColorRuns.compress(retColors)
             ret._text   = self._text.replace(*args, **kwargs)
 
         ret._hasTab = '\t' in ret._text
@@ -411,24 +555,26 @@ class TTkString():
         ret._text  += self._text
         ret._hasTab = self._hasTab
         ret._hasSpecialWidth = self._hasSpecialWidth
+        lentxt = len(self._text)
         if match:
-            ret._colors += self._colors
+            colors = _TTkColorRuns.expand(self._runs)
             start=0
             lenMatch = len(match)
             while pos := self._text.index(match, start) if match in self._text[start:] else None:
                 start = pos+lenMatch
                 for i in range(pos, pos+lenMatch):
-                    ret._colors[i] += color
+                    colors[i] += color
+            ret._runs = _TTkColorRuns.compress(colors)
         elif posFrom == posTo == None:
-            ret._colors = [c+color for c in self._colors]
+            ret._runs = [(e,c+color) for e,c in self._runs]
         elif posFrom < posTo:
-            ret._colors += self._colors
-            posFrom = min(len(self._text),posFrom)
-            posTo   = min(len(self._text),posTo)
-            for i in range(posFrom, posTo):
-                ret._colors[i] += color
+            posFrom = min(lentxt,posFrom)
+            posTo   = min(lentxt,posTo)
+            ret._runs = _TTkColorRuns.slice(self._runs, 0, posFrom)
+            _TTkColorRuns.extend(ret._runs, [(e,c+color) for e,c in _TTkColorRuns.slice(self._runs, posFrom, posTo)], posFrom)
+            _TTkColorRuns.extend(ret._runs, _TTkColorRuns.slice(self._runs, posTo, lentxt), posTo)
         else:
-            ret._colors += self._colors
+            ret._runs = self._runs
         return ret
 
 
@@ -450,22 +596,22 @@ class TTkString():
         ret._text  += self._text
         ret._hasTab = self._hasTab
         ret._hasSpecialWidth = self._hasSpecialWidth
+        lentxt = len(self._text)
         if match:
-            ret._colors += self._colors
+            ret._runs = self._runs
             start=0
             lenMatch = len(match)
             while pos := self._text.index(match, start) if match in self._text[start:] else None:
                 start = pos+lenMatch
-                ret._colors[pos: pos+lenMatch] = [color]*lenMatch
+                ret._runs = _TTkColorRuns.setRange(ret._runs, pos, pos+lenMatch, color, lentxt)
         elif posFrom == posTo == None:
-            ret._colors = [color]*len(self._text)
+            ret._runs = _TTkColorRuns.fill(color, lentxt)
         elif posFrom < posTo:
-            ret._colors += self._colors
-            posFrom = min(len(self._text),posFrom)
-            posTo   = min(len(self._text),posTo)
-            ret._colors[posFrom:posTo] = [color]*(posTo-posFrom)
+            posFrom = min(lentxt,posFrom)
+            posTo   = min(lentxt,posTo)
+            ret._runs = _TTkColorRuns.setRange(self._runs, posFrom, posTo, color, lentxt)
         else:
-            ret._colors += self._colors
+            ret._runs = self._runs
         return ret
 
     def substring(self, fr=None, to=None):
@@ -477,8 +623,9 @@ class TTkString():
         :type to: int, optional
         '''
         ret = TTkString()
+        fr, to, _ = slice(fr,to).indices(len(self._text))
         ret._text   = self._text[fr:to]
-        ret._colors = self._colors[fr:to]
+        ret._runs   = _TTkColorRuns.slice(self._runs, fr, to)
         ret._hasTab = '\t' in ret._text
         ret._fastCheckWidth(self._hasSpecialWidth)
         return ret
@@ -508,7 +655,7 @@ class TTkString():
         if self._hasSpecialWidth is not None:
             return self._getDataW()
         else:
-            return (tuple(self._text), self._colors)
+            return (tuple(self._text), _TTkColorRuns.expand(self._runs))
 
     def search(self, regexp, ignoreCase=False):
         ''' Return the **re.match** of the **regexp**
@@ -550,34 +697,32 @@ class TTkString():
         return ret
 
     # Unicode Zero/Half/Normal sized chars helpers:
+    # The widths are resolved through the cached table in _TTkCharWidth
     @staticmethod
     def _isWideCharData(ch):
-        if len(ch) == 1:
-            return unicodedata.east_asian_width(ch)=='W'
-        if len(ch) > 1:
-            return unicodedata.east_asian_width(ch[0])=='W'
+        if ch:
+            return _TTkCharWidth.charWidth(ch[0]) == 2
         return False
 
     @staticmethod
     def _isSpecialWidthChar(ch):
-        return ( unicodedata.east_asian_width(ch) == 'W' or
-                 unicodedata.category(ch) in ('Me','Mn') )
+        return _TTkCharWidth.charWidth(ch) != 1
 
     @staticmethod
     def _getWidthText(txt):
-        return ( len(txt) +
-            sum(unicodedata.east_asian_width(ch) == 'W' for ch in txt) -
-            sum(unicodedata.category(ch) in ('Me','Mn') for ch in txt) )
+        return _TTkCharWidth.textWidth(txt)
 
     @staticmethod
     def _getLenTextWoZero(txt):
-        return ( len(txt) -
-            sum(unicodedata.category(ch) in ('Me','Mn') for ch in txt) )
+        if txt.isascii(): return len(txt)
+        cw = _TTkCharWidth.charWidth
+        return sum(1 for ch in txt if cw(ch))
 
     def nextPos(self, pos):
         pos += 1
+        cw = _TTkCharWidth.charWidth
         for i,ch in enumerate(self._text[pos:]):
-            if not unicodedata.category(ch) in ('Me','Mn'):
+            if cw(ch):
                 return pos+i
         return len(self._text)
 
@@ -585,9 +730,10 @@ class TTkString():
         # from TermTk.TTkCore.log import TTkLog
         # TTkLog.debug(f"->{self._text[:pos]}<- {pos=}")
         # TTkLog.debug(f"{str(reversed(self._text[:pos]))} {pos=}")
+        cw = _TTkCharWidth.charWidth
         for i,ch in enumerate(reversed(self._text[:pos])):
             # TTkLog.debug(f"{i}---> {ch}    ")
-            if not unicodedata.category(ch) in ('Me','Mn'):
+            if cw(ch):
                 return pos-i-1
         return 0
 
@@ -596,11 +742,8 @@ class TTkString():
                 a is None and b is None ) else self._termWidthW()
 
     def _checkWidth(self):
-        # from: tests/timeit/09.widechar.check.py
-        # the first not halfsize char is 0x300
-        # this check is ~3 times faster than the 2 combined unicode checks
-        # and will quickly filter out the (more common) simple ascii text
-        tw = self._termWidthW() if any(ord(ch)>=0x300 for ch in self._text) else None
+        # quickly filter out the (more common) simple ascii text
+        tw = None if self._text.isascii() else self._termWidthW()
         self._hasSpecialWidth = tw if tw != len(self._text) else None
 
     def _termWidthW(self):
@@ -608,27 +751,10 @@ class TTkString():
 
         This value consider the displayed size (Zero, Half, Full) of each character.
         '''
-        return ( len(self._text) +
-             sum(unicodedata.east_asian_width(ch) == 'W' for ch in self._text) -
-             sum(unicodedata.category(ch) in ('Me','Mn') for ch in self._text) )
+        return _TTkCharWidth.textWidth(self._text)
 
     def _getDataW(self):
-        retTxt = []
-        retCol = []
-        for i,ch in enumerate(self._text):
-            if unicodedata.east_asian_width(ch) == 'W':
-                retTxt += (ch,'')
-                retCol += (self._colors[i],self._colors[i])
-            elif unicodedata.category(ch) in ('Me','Mn'):
-                if retTxt:
-                    if len(retTxt)>1 and retTxt[-1] == '':
-                        retTxt[-2]+=ch
-                    else:
-                        retTxt[-1]+=ch
-                #else:
-                #    retTxt = [f"{ch}"]
-                #    retCol = [TTkColor.RST]
-            else:
-                retTxt.append(ch)
-                retCol.append(self._colors[i])
-        return (retTxt, retCol)
+        # The glyphs layout is cached for the text
+        glyphs, indexes = _TTkCharWidth.textLayout(self._text)
+        colors = _TTkColorRuns.expand(self._runs)
+        return (list(glyphs), [colors[i] for i in indexes])
@@ -79,9 +79,11 @@ class TTk(TTkWidget):
     __slots__ = (
         '_input', '_termMouse', '_termDirectMouse',
         '_title',
-        '_showMouseCursor',
+        '_showMouseCursor', '_showRenderStats',
+        '_syncUpdate',
         '_sigmask',
         '_drawMutex',
+        '_timer', '_frameLock', '_frameScheduled', '_lastFrame',
         '_lastMultiTap')
 
     def __init__(self, *args, **kwargs):
@@ -93,7 +95,13 @@ class TTk(TTkWidget):
         self._title = kwargs.get('title','TermTk')
         self._sigmask = kwargs.get('sigmask', TTkK.NONE)
         self._showMouseCursor = os.environ.get("TTK_MOUSE",kwargs.get('mouseCursor', False))
+        self._showRenderStats = os.environ.get("TTK_RENDER_STATS",kwargs.get('renderStats', False))
+        self._syncUpdate = os.environ.get("TTK_SYNC_UPDATE",kwargs.get('syncUpdate', False))
         self._drawMutex = threading.Lock()
+        self._timer = None
+        self._frameLock = threading.Lock()
+        self._frameScheduled = False
+        self._lastFrame = 0
         self.setFocusPolicy(TTkK.ClickFocus)
         self.hide()
         w,h = TTkTerm.getTerminalSize()
@@ -138,10 +146,12 @@ class TTk(TTkWidget):
 
             TTkTerm.registerResizeCb(self._win_resize_cb)
 
+            # The frames are scheduled only when something is updated
             self._timer = TTkTimer()
             self._timer.timeout.connect(self._time_event)
-            self._timer.start(0.1)
+            TTkHelper.registerFrameRequestCb(self._requestFrame)
             self.show()
+            self._requestFrame()
 
             # Keep track of the multiTap to avoid the extra key release
             self._lastMultiTap = False
@@ -149,13 +159,20 @@ class TTk(TTkWidget):
                 title=self._title,
                 sigmask=self._sigmask,
                 mouse=self._termMouse,
-                directMouse=self._termDirectMouse )
+                directMouse=self._termDirectMouse,
+                syncUpdate=self._syncUpdate )
 
             if self._showMouseCursor:
                 TTkTerm.push(TTkTerm.Mouse.DIRECT_ON)
                 m = TTk._mouseCursor(self._input)
                 self.rootLayout().addWidget(m)
 
+            if self._showRenderStats:
+                from TermTk.TTkTestWidgets.renderstatsview import TTkRenderStatsView
+                rs = TTkRenderStatsView()
+                rs.move(max(0,self.width()-rs.width()),0)
+                self.rootLayout().addWidget(rs)
+
             self._mainLoop()
         finally:
             if platform.system() != 'Emscripten':
@@ -245,14 +262,24 @@ class TTk(TTkWidget):
            ( kevt.key == TTkK.Key_Left or kevt.key == TTkK.Key_Up)):
                 TTkHelper.prevFocus(focusWidget if focusWidget else self)
 
+    def _requestFrame(self):
+        '''Schedule a frame, the requests are coalesced until the frame is painted
+        and two frames are never closer than 1/TTkCfg.maxFps seconds'''
+        with self._frameLock:
+            if self._frameScheduled or self._timer is None: return
+            self._frameScheduled = True
+        delay = self._lastFrame + 1/TTkCfg.maxFps - time.time()
+        self._timer.start(max(0.0,delay))
+
     def _time_event(self):
-        w,h = TTkTerm.getTerminalSize()
         self._drawMutex.acquire()
-        self.setGeometry(0,0,w,h)
+        # Any update received from now on requires a new frame
+        with self._frameLock:
+            self._frameScheduled = False
+        self._lastFrame = time.time()
         self._fps()
         TTkHelper.paintAll()
         self._drawMutex.release()
-        self._timer.start(1/TTkCfg.maxFps)
 
     def _win_resize_cb(self, width, height):
         TTkGlbl.term_w = int(width)
@@ -267,6 +294,7 @@ class TTk(TTkWidget):
     def quit(self):
         '''Tells the application to exit with a return code.'''
         self._input.inputEvent.clear()
+        TTkHelper.registerFrameRequestCb(None)
         TTkTimer.quitAll()
         self._input.close()
 
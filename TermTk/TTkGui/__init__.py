@@ -2,5 +2,7 @@ from .drag  import TTkDrag, TTkDropEvent
 from .textwrap1 import TTkTextWrap
 from .textcursor import TTkTextCursor
 from .textdocument import TTkTextDocument
+from .filedocument import TTkFileDocument
+from .syntaxhighlighter import TTkSyntaxHighlighter
 from .clipboard import TTkClipboard
 from .tooltip import TTkToolTip
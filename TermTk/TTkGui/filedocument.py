@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2023 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from TermTk.TTkCore.signal import pyTTkSlot
+from TermTk.TTkCore.string import TTkString
+from TermTk.TTkCore.timer import TTkTimer
+from TermTk.TTkCore.filebuffer import TTkFileBuffer
+from TermTk.TTkGui.textdocument import TTkTextDocument
+
+class _TTkFileLines():
+    ''' Read only lines of :class:`TTkFileDocument`,
+    the lines are retrieved from the :class:`~TermTk.TTkCore.filebuffer.TTkFileBuffer`
+    and converted to :class:`~TermTk.TTkCore.string.TTkString` only when accessed '''
+    __slots__ = ('_fileBuffer', '_cache')
+    cacheSize = 0x400
+
+    def __init__(self, fileBuffer):
+        self._fileBuffer = fileBuffer
+        # line -> TTkString, ordered from the least recently used
+        self._cache = {}
+
+    def copy(self):
+        return self
+
+    def clearCache(self):
+        self._cache = {}
+
+    def __len__(self):
+        return self._fileBuffer.getLen()
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0: index += len(self)
+        if (line := self._cache.pop(index, None)) is None:
+            if not 0 <= index < len(self):
+                raise IndexError('line index out of range')
+            txt = self._fileBuffer.getLine(index)
+            line = TTkString(txt[:-1] if txt.endswith('\n') else txt)
+            if len(self._cache) >= _TTkFileLines.cacheSize:
+                del self._cache[next(iter(self._cache))]
+        self._cache[index] = line
+        return line
+
+class TTkFileDocument(TTkTextDocument):
+    ''' Read only :class:`~TermTk.TTkGui.textdocument.TTkTextDocument` of a (large) file
+
+    The file is indexed in the background by :class:`~TermTk.TTkCore.filebuffer.TTkFileBuffer`,
+    only the lines displayed are read and parsed.
+
+    :param filename: the file to be displayed
+    :type filename: str
+    :param follow: check periodically if the file is grown (i.e. "tail -f"), defaults to False
+    :type follow: bool, optional
+    :param period: the follow check period in seconds, defaults to 0.5
+    :type period: float, optional
+    '''
+    __slots__ = ('_fileBuffer', '_lineCount', '_indexPending', '_indexTimer', '_follow', '_period', '_timer')
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._fileBuffer = TTkFileBuffer(kwargs['filename'], kwargs.get('window', 0x100), kwargs.get('numWindows', 0x10))
+        self._dataLines = _TTkFileLines(self._fileBuffer)
+        self._lastSnap = self._dataLines
+        self._lineCount = 1
+        self._period = kwargs.get('period', 0.5)
+        self._follow = False
+        self._timer = None
+        # The index is updated in a background thread,
+        # the changes are notified through this timer
+        self._indexPending = False
+        self._indexTimer = TTkTimer()
+        self._indexTimer.timeout.connect(self._indexChanged)
+        self._fileBuffer.indexUpdated.connect(self._indexUpdated)
+        # The index may be already (partially) available
+        self._indexPending = True
+        self._indexChanged()
+        self.setFollow(kwargs.get('follow', False))
+
+    def fileBuffer(self):
+        return self._fileBuffer
+
+    def width(self):
+        ''' Return the length of the longest line indexed so far '''
+        return self._fileBuffer.getWidth()
+
+    def follow(self):
+        return self._follow
+
+    def setFollow(self, follow):
+        self._follow = follow
+        if follow and not self._timer:
+            self._timer = TTkTimer()
+            self._timer.timeout.connect(self._checkFile)
+        if follow:
+            self._timer.start(self._period)
+        elif self._timer:
+            self._timer.stop()
+
+    @pyTTkSlot()
+    def _checkFile(self):
+        if not self._follow: return
+        self._fileBuffer.refresh()
+        self._timer.start(self._period)
+
+    @pyTTkSlot(float)
+    def _indexUpdated(self, _):
+        # Called from the indexing thread
+        self._indexPending = True
+        self._indexTimer.start()
+
+    @pyTTkSlot()
+    def _indexChanged(self):
+        if not self._indexPending: return
+        self._indexPending = False
+        oldCount = self._lineCount
+        self._lineCount = newCount = self._fileBuffer.getLen()
+        # The last line may have been incomplete
+        self._dataLines.clearCache()
+        self.contentsChanged.emit()
+        self.contentsChange.emit(oldCount-1, 1, newCount-oldCount+1)
+
+    # Read Only
+    def setText(self, text): pass
+    def appendText(self, text): pass
+    def saveSnapshot(self, cursor): pass
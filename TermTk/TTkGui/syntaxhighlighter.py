@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2022 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from time import perf_counter
+
+from TermTk.TTkCore.signal import pyTTkSlot
+from TermTk.TTkCore.string import TTkString, _TTkColorRuns
+
+class TTkSyntaxHighlighter():
+    ''' TTkSyntaxHighlighter
+
+    Base class of the syntax highlighters of a :class:`~TermTk.TTkGui.textdocument.TTkTextDocument`
+    (similar to the QSyntaxHighlighter).
+
+    Reimplement :meth:`highlightBlock` to colorize a single line,
+    the lexer state at the end of the previous line is available through :meth:`previousBlockState`
+    and the state at the end of the current line is set through :meth:`setCurrentBlockState`.
+
+    The lines are highlighted only when displayed.
+    The state at the end of each line is cached, after an edit the lines are
+    highlighted again only from the edited one until the state matches the cached one.
+
+    ::
+
+        states:  [ s0, s1, s2, None, s4, s5, . . . ]
+                               │      │
+                               │      └─ highlighted again only if
+                               │         the state at the end of line 3 != s3 (before the edit)
+                               └─ edited line
+
+    :param document: the document to be highlighted
+    :type document: :class:`~TermTk.TTkGui.textdocument.TTkTextDocument`, optional
+    '''
+    __slots__ = (
+        '_document',
+        '_states', '_lines', '_valid',
+        '_prevState', '_curState', '_formats')
+
+    # Max time (sec) spent highlighting in a single paint,
+    # the remaining lines are highlighted in the next frames
+    timeBudget = 0.01
+
+    def __init__(self, *args, **kwargs):
+        self._document = None
+        # The state at the end of each line, None if (still) not highlighted
+        self._states = []
+        # The highlighted lines (or None)
+        self._lines = []
+        # All the lines before this index are highlighted
+        self._valid = 0
+        self._prevState = -1
+        self._curState  = -1
+        self._formats = []
+        self.setDocument(kwargs.get('document', None))
+
+    def document(self):
+        return self._document
+
+    def setDocument(self, document):
+        ''' Install the syntax highlighter on the document
+
+        :param document: the document to be highlighted, None to remove the highlighter
+        :type document: :class:`~TermTk.TTkGui.textdocument.TTkTextDocument`
+        '''
+        if self._document:
+            self._document.contentsChange.disconnect(self._documentChange)
+            self._document._highlighter = None
+            self._document.formatChanged.emit()
+        self._document = document
+        if document:
+            if document._highlighter:
+                document._highlighter.setDocument(None)
+            document._highlighter = self
+            document.contentsChange.connect(self._documentChange)
+            self.rehighlight()
+
+    def rehighlight(self):
+        ''' Discard the highlighted lines, i.e. after a change of the highlighting rules '''
+        if not self._document: return
+        lines = len(self._document._dataLines)
+        self._states = [None]*lines
+        self._lines  = [None]*lines
+        self._valid  = 0
+        self._document.formatChanged.emit()
+
+    @pyTTkSlot(int,int,int)
+    def _documentChange(self, line, removed, added):
+        self._states[line:line+removed] = [None]*added
+        self._lines[ line:line+removed] = [None]*added
+        if removed and not added and line < len(self._states):
+            # The line after the removed ones is no more in sync with the previous one
+            self._states[line] = None
+        if line < self._valid:
+            # The first line not highlighted is not in sync with the state
+            # of the previous one, it must not be used to detect the convergence
+            valid = self._valid + added - removed
+            if self._valid >= line+removed and valid < len(self._states):
+                self._states[valid] = None
+            self._valid = line
+
+    def highlightBlock(self, text):
+        ''' Reimplement this method to highlight a line of the document
+
+        :param text: the line to be highlighted
+        :type text: :class:`~TermTk.TTkCore.string.TTkString`
+        '''
+        pass
+
+    def setFormat(self, start, count, color):
+        ''' Apply a color to a slice of the current line
+
+        :param start: the starting position
+        :type start: int
+        :param count: the number of chars to be colorized
+        :type count: int
+        :param color: the color to be applied
+        :type color: :class:`~TermTk.TTkCore.color.TTkColor`
+        '''
+        self._formats.append((start, start+count, color))
+
+    def previousBlockState(self):
+        ''' Return the state at the end of the previous line, -1 for the first line '''
+        return self._prevState
+
+    def currentBlockState(self):
+        return self._curState
+
+    def setCurrentBlockState(self, state):
+        ''' Set the state at the end of the current line
+
+        The state must be comparable (==) and must not be None
+        '''
+        self._curState = state
+
+    def _highlightLine(self, text):
+        self._formats = []
+        self.highlightBlock(text)
+        if not self._formats:
+            return text
+        length = len(text)
+        runs = text._runs
+        for fr, to, color in self._formats:
+            runs = _TTkColorRuns.setRange(runs, max(0,fr), min(to,length), color, length)
+        ret = TTkString(text)
+        ret._runs = runs
+        return ret
+
+    def _highlight(self, to):
+        ''' Highlight the lines before "to" within the :attr:`timeBudget`,
+        return True if all of them are highlighted '''
+        dataLines = self._document._dataLines
+        states = self._states
+        to = min(to, len(states))
+        i = self._valid
+        tEnd = perf_counter() + self.timeBudget
+        while i < to:
+            self._prevState = states[i-1] if i else -1
+            self._curState  = -1
+            self._lines[i] = self._highlightLine(dataLines[i])
+            oldState, states[i] = states[i], self._curState
+            i += 1
+            if oldState is not None and oldState == self._curState:
+                # The state at the end of this line did not change,
+                # the following lines are still valid up to the next edited one
+                i = states.index(None, i) if None in states[i:to] else to
+            elif perf_counter() > tEnd:
+                break
+        self._valid = i
+        return i >= to
+
+    def _highlightedLines(self, fr, to):
+        ''' Return the lines [fr,to) of the document highlighted,
+        the lines not yet processed are returned with the previous (or no) highlight '''
+        if self._valid < to and not self._highlight(to):
+            # Continue in the next frame
+            self._document.formatChanged.emit()
+        dataLines = self._document._dataLines
+        return [dataLines[i] if l is None else l for i,l in enumerate(self._lines[fr:to],fr)]
@@ -353,22 +353,20 @@ class TTkTextCursor():
         if len(textLines) != len(self._properties):
             textLines = [text]*len(self._properties)
 
-        # Calc the added and removed lines
-        for i, pr in enumerate(self._properties):
-            lenNewLines=len(textLines[i].split('\n'))
-            l = pr.position.line
-            p = pr.position.pos
-            if (  textLines[i] == '\n' and
-                  l == lineFirst != _lineFirst and
-                  p==len(self._document._dataLines[l]) ):
-                lineFirst = l+1
-                lineAdd = 1
-                lineRem = 0
-            elif (lineFirst + lineRem) > l:
-                lineAdd += lenNewLines-1
-            else:
-                lineAdd += lenNewLines + l-lineFirst-lineRem
-                lineRem = l - lineFirst + 1
+        # Calc the added and removed lines,
+        # all the lines between the first and the last cursor are marked as changed
+        lineLast = self._properties[-1].position.line
+        lineRem = lineLast - lineFirst + 1
+        lineAdd = lineRem + sum(len(t.split('\n'))-1 for t in textLines)
+        pr = self._properties[0]
+        if ( len(self._properties) == 1 and
+             textLines[0] == '\n' and
+             lineFirst != _lineFirst and
+             pr.position.pos==len(self._document._dataLines[lineFirst]) ):
+            # Newline at the end of the line, the current line is not changed
+            lineFirst += 1
+            lineAdd = 1
+            lineRem = 0
         if _lineFirst != -1:
             lineFirst, lineRem, lineAdd = TTkTextDocument._mergeChangesSlices(
                                                 (_lineFirst, _lineRem, _lineAdd),
@@ -387,9 +385,7 @@ class TTkTextCursor():
             newLines = ( self._document._dataLines[l].substring(to=p) +
                          ttktext +
                          self._document._dataLines[l].substring(fr=p) ).split('\n')
-            self._document._dataLines[l] = newLines[0]
-            for nl in reversed(newLines[1:]):
-                self._document._dataLines.insert(l+1, nl)
+            self._document._dataLines[l:l+1] = newLines
 
             # 2 scenarios:
             #  1) No Newline(s) added
@@ -485,22 +481,13 @@ class TTkTextCursor():
     def _removeSelectedText(self):
         currPos = self.position().toNum()
 
+        # Calc the added and removed lines,
+        # all the lines between the first and the last selection are marked as changed
+        # (i.e. 2 selections in the same line change only that line)
         lineFirst = self._properties[0].selectionStart().line
-        lineAdd = 0
-        lineRem = 0
-
-        for p in self._properties:
-            # Check how many lines are removed/added after this operation
-            selSt = p.selectionStart()
-            selEn = p.selectionEnd()
-
-            if (lineFirst + lineRem) > selSt.line:
-                _lineAdd = 0
-            else:
-                _lineAdd = 0 if selSt.pos == selEn.pos == 0 else 1
-
-            lineAdd += selSt.line - lineFirst - lineRem + _lineAdd
-            lineRem = selEn.line - lineFirst + _lineAdd
+        lineLast  = max(p.selectionEnd().line for p in self._properties)
+        lineRem = lineLast - lineFirst + 1
+        lineAdd = lineRem - sum(p.selectionEnd().line - p.selectionStart().line for p in self._properties)
 
         def _alignPoint(point,st,en):
             point.line += st.line - en.line
@@ -512,7 +499,7 @@ class TTkTextCursor():
             selEn = p.selectionEnd()
             self._document._dataLines[selSt.line] = self._document._dataLines[selSt.line].substring(to=selSt.pos) + \
                                self._document._dataLines[selEn.line].substring(fr=selEn.pos)
-            self._document._dataLines = self._document._dataLines[:selSt.line+1] + self._document._dataLines[selEn.line+1:]
+            del self._document._dataLines[selSt.line+1:selEn.line+1]
             for pp in self._properties[i+1:]:
                 _alignPoint(pp.position, selSt, selEn)
                 _alignPoint(pp.anchor,   selSt, selEn)
@@ -557,7 +544,7 @@ class TTkTextCursor():
                 sel.append((selSt,selEn,p))
 
         # Retrieve the sublist of lines to be required (displayed)
-        ret = self._document._dataLines[fr:to+1]
+        ret = self._document._displayedLines(fr, to+1)
         # Apply the selection color for each of them
         for s in sel:
             selSt, selEn, _ = s
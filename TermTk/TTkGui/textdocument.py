@@ -22,9 +22,12 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from time import monotonic
+
 from TermTk.TTkCore.log import TTkLog
 from TermTk.TTkCore.signal import pyTTkSignal, pyTTkSlot
 from TermTk.TTkCore.string import TTkString
+from TermTk.TTkGui.textlines import _TTkTextLines
 
 class TTkTextDocument():
     '''
@@ -51,6 +54,15 @@ class TTkTextDocument():
             Slices: = common txt slices between snapshots
                 [   s01,  s12,  s23,  s34   ]
 
+            The lines are stored in a copy on write _TTkTextLines,
+            _lastSnap shares the chunks of lines with _dataLines,
+            only the chunks modified after the snapshot are duplicated
+
+            The history is bounded (see :meth:`setUndoLimit`, :meth:`setUndoMemoryLimit`),
+            the oldest snapshots (_snapFirst) are discarded when a limit is exceeded
+            and the small changes of the same line saved in a short time
+            (i.e. typing) are merged in a single step
+
             Data Structure
                         ╔═══════════════╗                         ╔═══════════════╗
                         ║   Snapshot B  ║          ┌─────────────>║   Snapshot C  ║
@@ -76,10 +88,12 @@ class TTkTextDocument():
          Mod:     |---------bbbbb   ---------|
                   0         slice
         '''
-        __slots__ = ('_slice', '_i1', '_i2', '_snap')
+        __slots__ = ('_slice', '_i1', '_i2', '_snap', '_size')
         def __init__(self, txt, i1, i2, snap):
             # The text slice required to change the current snap to the next one
             self._slice = txt
+            # Number of chars (newlines included) stored in the slice
+            self._size = sum(len(l) for l in txt) + len(txt)
             # Starting position of the slice to be removed
             self._i1 = i1
             # Ending position of the slice to be removed
@@ -110,27 +124,40 @@ class TTkTextDocument():
         '_dataLines', '_changed',
         '_snap', '_snapChanged',
         '_lastSnap', '_lastCursor',
+        '_snapFirst', '_snapCount', '_snapSize', '_snapTime',
+        '_undoLimit', '_undoMemoryLimit',
+        '_highlighter',
         # Signals
-        'contentsChange', 'contentsChanged',
+        'contentsChange', 'contentsChanged', 'formatChanged',
         'cursorPositionChanged',
         'undoAvailable', 'redoAvailable'
         )
+    # Small changes of the same line saved within this interval (sec)
+    # are merged in a single undo step
+    _mergeInterval = 1.0
+
     def __init__(self, *args, **kwargs):
         from TermTk.TTkGui.textcursor import TTkTextCursor
         self.cursorPositionChanged = pyTTkSignal(TTkTextCursor)
         self.contentsChange = pyTTkSignal(int,int,int) # int line, int linesRemoved, int linesAdded
         self.contentsChanged = pyTTkSignal()
+        # The colors of the lines are changed (i.e. by the syntax highlighter)
+        self.formatChanged = pyTTkSignal()
         self.undoAvailable = pyTTkSignal(bool)
         self.redoAvailable = pyTTkSignal(bool)
         text =  kwargs.get('text'," ")
-        self._dataLines = [TTkString(t) for t in text.split('\n')]
+        self._dataLines = _TTkTextLines(TTkTextDocument._textLines(text, False))
         self._changed = False
+        self._undoLimit = kwargs.get('undoLimit', 0x400)
+        self._undoMemoryLimit = kwargs.get('undoMemoryLimit', 0x100000)
+        # The TTkSyntaxHighlighter installed on this document
+        self._highlighter = None
         # Cumulative changes since the lasrt snapshot
         self._snapChanged = None
         self.contentsChange.connect(self._saveSnapChanged)
         self._lastSnap = self._dataLines.copy()
         self._lastCursor = TTkTextCursor(document=self)
-        self._snap = TTkTextDocument._snapshot(self._lastCursor, None, None)
+        self._resetSnapshots()
 
     # I need this moethod to cover the math of merging
     # multiples retuen values to be used in the contentsChange
@@ -183,32 +210,49 @@ class TTkTextDocument():
     def setChanged(self, c):
         self._changed = c
         if c and self._snap:
+            # Drop the redo history
+            diff = self._snap._nextDiff
+            while diff:
+                self._snapCount -= 1
+                self._snapSize  -= diff._size + diff._snap._prevDiff._size
+                diff = diff._snap._nextDiff
             self._snap._nextDiff = None
 
     def lineCount(self):
         return len(self._dataLines)
 
+    def _displayedLines(self, fr, to):
+        ''' Return the lines [fr,to) to be displayed,
+        highlighted if a syntax highlighter is installed '''
+        if self._highlighter:
+            return self._highlighter._highlightedLines(fr, to)
+        return self._dataLines[fr:to]
+
     def characterCount(self):
-        return sum([len[x] for x in self._dataLines])+self.lineCount()
+        return sum(len(x) for x in self._dataLines)+self.lineCount()
 
     def setText(self, text):
         remLines = len(self._dataLines)
-        self._dataLines = [TTkString(t) for t in text.split('\n')]
+        self._dataLines = _TTkTextLines(TTkTextDocument._textLines(text, False))
         self._changed = False
         self._lastSnap = self._dataLines.copy()
-        self._snap = TTkTextDocument._snapshot(self._lastCursor, None, None)
+        self._resetSnapshots()
         self.contentsChanged.emit()
         self.contentsChange.emit(0,remLines,len(self._dataLines))
         self._snapChanged = None
 
+    @staticmethod
+    def _textLines(text, retainColor=True):
+        if isinstance(text, str):
+            return TTkString.fromAnsiLines(text, retainColor=retainColor)
+        return [TTkString(t) for t in text.split('\n')]
+
     def appendText(self, text):
-        if type(text) == str:
-            text = TTkString() + text
         oldLines = len(self._dataLines)
-        self._dataLines += text.split('\n')
+        self._dataLines += TTkTextDocument._textLines(text)
         self._changed = False
         self._lastSnap = self._dataLines.copy()
-        self._snap = TTkTextDocument._snapshot(self._lastCursor, None, None)
+        self._resetSnapshots()
         self.contentsChanged.emit()
         self.contentsChange.emit(oldLines,0,len(self._dataLines)-oldLines)
         self._snapChanged = None
@@ -222,6 +266,55 @@ class TTkTextDocument():
     def hasSnapshots(self):
         return self._snap is not None
 
+    def undoLimit(self):
+        return self._undoLimit
+
+    def setUndoLimit(self, steps):
+        ''' Set the max number of undo/redo steps stored, 0 = unlimited
+
+        :param steps: the number of steps
+        :type steps: int
+        '''
+        self._undoLimit = steps
+        self._evictSnapshots()
+
+    def undoMemoryLimit(self):
+        return self._undoMemoryLimit
+
+    def setUndoMemoryLimit(self, size):
+        ''' Set the max number of chars stored in the undo/redo history, 0 = unlimited
+
+        :param size: the number of chars
+        :type size: int
+        '''
+        self._undoMemoryLimit = size
+        self._evictSnapshots()
+
+    def undoMemory(self):
+        ''' Return the number of chars (newlines included) stored in the undo/redo history '''
+        return self._snapSize
+
+    def undoSteps(self):
+        ''' Return the number of undo/redo steps stored '''
+        return self._snapCount
+
+    def _resetSnapshots(self):
+        self._snap = self._snapFirst = TTkTextDocument._snapshot(self._lastCursor, None, None)
+        self._snapCount = 0
+        self._snapSize  = 0
+        self._snapTime  = 0
+
+    def _evictSnapshots(self):
+        # Discard the oldest snapshots, the current one is always kept
+        while ( self._snapFirst is not self._snap and (
+                ( self._undoLimit       and self._snapCount > self._undoLimit       ) or
+                ( self._undoMemoryLimit and self._snapSize  > self._undoMemoryLimit ) ) ):
+            diff = self._snapFirst._nextDiff
+            self._snapCount -= 1
+            self._snapSize  -= diff._size + diff._snap._prevDiff._size
+            self._snapFirst = diff._snap
+            self._snapFirst._prevDiff = None
+
     def saveSnapshot(self, cursor):
         docA = self._lastSnap
         docB = self._dataLines
@@ -237,7 +330,27 @@ class TTkTextDocument():
         sliceA = docA[sa:sa+sb]
         sliceB = docB[sa:sa+sc]
 
-        if sliceA or sliceB:
+        now = monotonic()
+        diffAP = self._snap._prevDiff
+        if ( (sliceA or sliceB) and diffAP and
+             now - self._snapTime < TTkTextDocument._mergeInterval and
+             sb <= 1 and sc <= 1 and len(diffAP._slice) <= 1 and
+             diffAP._i1 == sa and diffAP._i2-diffAP._i1 <= 1 ):
+            # Merge the changes of the same line (i.e. typing)
+            #   P --diffPA--> A --(sa,sb,sc)--> B    becomes    P --diffPB--> B
+            snapP  = diffAP._snap
+            diffPA = snapP._nextDiff
+            ma,mb,mc = TTkTextDocument._mergeChangesSlices(
+                            (diffPA._i1, diffPA._i2-diffPA._i1, len(diffPA._slice)), (sa,sb,sc))
+            docP = docA.copy()
+            docP[diffAP._i1:diffAP._i2] = diffAP._slice
+            diffBP = TTkTextDocument._snapDiff(docP[ma:ma+mb], ma, ma+mc, snapP)
+            snapB  = TTkTextDocument._snapshot(cursor, None, diffBP)
+            diffPB = TTkTextDocument._snapDiff(docB[ma:ma+mc], ma, ma+mb, snapB)
+            snapP._nextDiff = diffPB
+            self._snapSize += diffBP._size + diffPB._size - diffAP._size - diffPA._size
+            self._snap = snapB
+        elif sliceA or sliceB:
             # current snapshot
             # is becoming the previous one
             snapA  = self._snap
@@ -245,9 +358,13 @@ class TTkTextDocument():
             snapB  = TTkTextDocument._snapshot(cursor, None, diffBA)
             diffAB = TTkTextDocument._snapDiff(sliceB, sa, sa+sb, snapB)
             snapA._nextDiff = diffAB
+            self._snapCount += 1
+            self._snapSize  += diffBA._size + diffAB._size
             self._snap = snapB
         else:
             self._snap._cursor = cursor
+        self._snapTime = now
+        self._evictSnapshots()
 
         self._changed = False
         self._lastSnap = self._dataLines.copy()
@@ -261,6 +378,10 @@ class TTkTextDocument():
             (not next and not self._snap._prevDiff) ):
             return None
 
+        # The lines [i1:i2] (clamped to the document) are replaced by the diff slice
+        diff = self._snap._nextDiff if next else self._snap._prevDiff
+        i1 = min(diff._i1, len(self._dataLines))
+        i2 = max(i1, min(diff._i2, len(self._dataLines)))
         if next:
             self._snap = self._snap.getNextSnap(self._dataLines)
         else:
@@ -268,8 +389,12 @@ class TTkTextDocument():
 
         self._lastSnap = self._dataLines.copy()
         self._lastCursor = self._snap._cursor.copy()
+        # Do not merge the next changes with the restored snapshot
+        self._snapTime = 0
 
         self.contentsChanged.emit()
+        self.contentsChange.emit(i1, i2-i1, len(diff._slice))
+        self._snapChanged = None
         self.undoAvailable.emit(self.isUndoAvailable())
         self.redoAvailable.emit(self.isRedoAvailable())
         return self._snap._cursor
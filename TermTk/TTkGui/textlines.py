@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2023 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from bisect import bisect_right
+from itertools import accumulate
+
+class _TTkTextLines():
+    ''' Lines storage of :class:`~TermTk.TTkGui.textdocument.TTkTextDocument`
+
+    The lines are stored in chunks of (up to) 2*"chunkSize" lines indexed
+    by their starting line, the chunks are shared between the copies
+    and duplicated only when modified (copy on write)
+
+    ::
+
+        _offsets:  0         512       1024        1530
+        _chunks:  [l0 .. l511][l512 .. ][l1024 .. ][l1530 .. ]
+
+    * copy: O(1), the chunks (and the index) are shared
+    * get/set a line: O(log n) + the copy of a chunk the first time it is modified
+    * insert/remove lines: O(log n) + O(chunkSize) + the rebuild of the offsets index (n/chunkSize)
+    '''
+    __slots__ = ('_chunks', '_offsets', '_len', '_shared', '_owned')
+    chunkSize = 512
+
+    def __init__(self, lines=()):
+        lines = list(lines)
+        size = _TTkTextLines.chunkSize
+        self._chunks  = [lines[i:i+size] for i in range(0,len(lines),size)]
+        self._offsets = list(range(0,len(lines),size))
+        self._len     = len(lines)
+        # The chunks list/index are shared with another copy
+        self._shared  = False
+        # id of the chunks created by this copy (safe to be modified in place)
+        self._owned   = set(id(c) for c in self._chunks)
+
+    def copy(self):
+        ret = _TTkTextLines.__new__(_TTkTextLines)
+        ret._chunks  = self._chunks
+        ret._offsets = self._offsets
+        ret._len     = self._len
+        ret._shared  = self._shared = True
+        ret._owned   = set()
+        self._owned  = set()
+        return ret
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for c in self._chunks:
+            yield from c
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __iadd__(self, other):
+        self._replace(self._len, self._len, list(other))
+        return self
+
+    def extend(self, other):
+        self._replace(self._len, self._len, list(other))
+
+    def insert(self, index, line):
+        index = max(0, min(self._len, index if index >= 0 else self._len + index))
+        self._replace(index, index, [line])
+
+    def _locate(self, index):
+        ci = bisect_right(self._offsets, index)-1
+        return ci, index-self._offsets[ci]
+
+    def _index(self, index):
+        if index < 0: index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError('line index out of range')
+        return index
+
+    def _unshare(self):
+        if self._shared:
+            self._chunks  = self._chunks.copy()
+            self._offsets = self._offsets.copy()
+            self._shared  = False
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            fr, to, step = index.indices(self._len)
+            if step != 1:
+                return list(self)[index]
+            if fr >= to: return []
+            ca,pa = self._locate(fr)
+            cb,pb = self._locate(to-1)
+            if ca == cb:
+                return self._chunks[ca][pa:pb+1]
+            ret = self._chunks[ca][pa:]
+            for c in self._chunks[ca+1:cb]:
+                ret += c
+            ret += self._chunks[cb][:pb+1]
+            return ret
+        ci, pos = self._locate(self._index(index))
+        return self._chunks[ci][pos]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            fr, to, step = index.indices(self._len)
+            if step != 1:
+                raise ValueError('extended slices are not supported')
+            self._replace(fr, max(fr,to), list(value))
+            return
+        ci, pos = self._locate(self._index(index))
+        chunk = self._chunks[ci]
+        if id(chunk) not in self._owned:
+            self._unshare()
+            chunk = self._chunks[ci] = chunk.copy()
+            self._owned.add(id(chunk))
+        chunk[pos] = value
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            fr, to, step = index.indices(self._len)
+            if step != 1:
+                raise ValueError('extended slices are not supported')
+            self._replace(fr, max(fr,to), [])
+            return
+        index = self._index(index)
+        self._replace(index, index+1, [])
+
+    def _replace(self, fr, to, lines):
+        ''' Replace the lines [fr:to] with the new "lines" '''
+        if not self._len:
+            self.__init__(lines)
+            return
+        size = _TTkTextLines.chunkSize
+        self._unshare()
+        chunks = self._chunks
+        ca,pa = self._locate(min(fr,self._len-1))
+        if fr == self._len: pa = len(chunks[ca])
+        if to > fr:
+            cb,pb = self._locate(to-1)
+            pb += 1
+        else:
+            cb,pb = ca,pa
+        merged = chunks[ca][:pa] + lines + chunks[cb][pb:]
+        # Keep the chunks balanced, merge the small remaining chunk
+        # with the next one and split the oversized ones
+        if len(merged) < size//2 and cb+1 < len(chunks):
+            cb += 1
+            merged += chunks[cb]
+        if len(merged) > 2*size:
+            newChunks = [merged[i:i+size] for i in range(0,len(merged),size)]
+        elif merged or len(chunks) == (cb-ca+1):
+            newChunks = [merged]
+        else:
+            newChunks = []
+        chunks[ca:cb+1] = newChunks
+        self._owned.update(id(c) for c in newChunks)
+        if len(self._owned) > 4*len(chunks):
+            self._owned.intersection_update(id(c) for c in chunks)
+        self._len += len(lines) - (to-fr)
+        if ca < len(chunks):
+            self._offsets[ca:] = accumulate((len(c) for c in chunks[ca:-1]), initial=self._offsets[ca])
+        else:
+            del self._offsets[ca:]
@@ -22,12 +22,34 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from bisect import bisect_left
+
 from TermTk.TTkCore.constant import TTkK
-from TermTk.TTkCore.signal import pyTTkSignal
+from TermTk.TTkCore.signal import pyTTkSignal, pyTTkSlot
 from TermTk.TTkCore.string import TTkString
 from TermTk.TTkGui.textcursor import TTkTextCursor
 from TermTk.TTkGui.textdocument import TTkTextDocument
 
+class _TTkNoWrapLines():
+    ''' Displayed lines [(line,(0,len+1)), ...] of the not wrapped document,
+    evaluated only when accessed (i.e. the visible area) '''
+    __slots__ = ('_textDocument')
+    def __init__(self, document):
+        self._textDocument = document
+
+    def __len__(self):
+        return len(self._textDocument._dataLines)
+
+    def __getitem__(self, index):
+        dataLines = self._textDocument._dataLines
+        if isinstance(index, slice):
+            fr, to, step = index.indices(len(dataLines))
+            if step != 1:
+                return [self[i] for i in range(fr, to, step)]
+            return [(i,(0,len(l)+1)) for i,l in enumerate(dataLines[fr:to],fr)]
+        if index < 0: index += len(dataLines)
+        return (index,(0,len(dataLines[index])+1))
+
 class TTkTextWrap():
     __slots__ = (
         '_lines', '_textDocument', '_tabSpaces',
@@ -45,10 +67,14 @@ class TTkTextWrap():
         self._tabSpaces = 4
         self._wrapWidth     = 80
         self._wordWrapMode = TTkK.WrapAnywhere
+        self._textDocument = None
         self.setDocument(kwargs.get('document',TTkTextDocument()))
 
     def setDocument(self, document):
+        if self._textDocument:
+            self._textDocument.contentsChange.disconnect(self._documentChange)
         self._textDocument = document
+        self._textDocument.contentsChange.connect(self._documentChange)
         self.rewrap()
 
     def disable(self):
@@ -74,44 +100,82 @@ class TTkTextWrap():
         self._wordWrapMode = mode
         self.rewrap()
 
+    def _wrapLine(self, i, l):
+        ''' Return the displayed lines [(i,(fr,to)),...] of the document line "i" '''
+        if not len(l): # if the line is empty append it
+            return [(i,(0,0))]
+        w = self._wrapWidth
+        ret = []
+        fr = 0
+        to = 0
+        while len(l):
+            fl = l.tab2spaces(self._tabSpaces)
+            if fl.termWidth() <= w:
+                ret.append((i,(fr,fr+len(l)+1)))
+                l=[]
+            else:
+                to = max(1,l.tabCharPos(w,self._tabSpaces))
+                if self._wordWrapMode == TTkK.WordWrap: # Find the index of the first white space
+                    s = str(l)
+                    newTo = to
+                    while newTo and ( s[newTo] != ' ' and s[newTo] != '\t' ): newTo-=1
+                    if newTo: to = newTo
+
+                ret.append((i,(fr,fr+to)))
+                l = l.substring(to)
+                fr += to
+        return ret
+
     def rewrap(self):
+        if not self._enable:
+            self._lines = _TTkNoWrapLines(self._textDocument)
+            self.wrapChanged.emit()
+            return
         self._lines = []
+        if not self._wrapWidth:
+            return
+        for i,l in enumerate(self._textDocument._dataLines):
+            self._lines += self._wrapLine(i,l)
+        self.wrapChanged.emit()
+
+    @pyTTkSlot(int,int,int)
+    def _documentChange(self, line, removed, added):
+        ''' Rewrap only the document lines changed,
+        the displayed lines of the following ones are shifted by (added-removed) '''
         if not self._enable:
-            def _process(i,l):
-                self._lines.append((i,(0,len(l)+1)))
+            # The not wrapped lines are evaluated from the document
+            self.wrapChanged.emit()
+            return
+        if not self._wrapWidth:
+            return
+        dataLines = self._textDocument._dataLines
+        # Every document line has at least a displayed line,
+        # rewrap everything if the change does not match the previous lines
+        oldCount = self._lines[-1][0]+1 if self._lines else 0
+        if ( not (removed or added) or line+removed > oldCount or
+             len(dataLines) != oldCount+added-removed ):
+            self.rewrap()
+            return
+        # The displayed lines are sorted by document line,
+        # the first displayed line of the document line "l" is
+        # bisect_left(self._lines,(l,))
+        fr = bisect_left(self._lines, (line,))
+        to = bisect_left(self._lines, (line+removed,), fr)
+        newLines = []
+        for i in range(line, min(line+added, len(dataLines))):
+            newLines += self._wrapLine(i,dataLines[i])
+        if delta := added-removed:
+            self._lines[fr:] = newLines + [(dt+delta,p) for dt,p in self._lines[to:]]
         else:
-            if not (w := self._wrapWidth):
-                return
-
-            def _process(i,l):
-                fr = 0
-                to = 0
-                if not len(l): # if the line is empty append it
-                    self._lines.append((i,(0,0)))
-                    return
-                while len(l):
-                    fl = l.tab2spaces(self._tabSpaces)
-                    if fl.termWidth() <= w:
-                        self._lines.append((i,(fr,fr+len(l)+1)))
-                        l=[]
-                    else:
-                        to = max(1,l.tabCharPos(w,self._tabSpaces))
-                        if self._wordWrapMode == TTkK.WordWrap: # Find the index of the first white space
-                            s = str(l)
-                            newTo = to
-                            while newTo and ( s[newTo] != ' ' and s[newTo] != '\t' ): newTo-=1
-                            if newTo: to = newTo
-
-                        self._lines.append((i,(fr,fr+to)))
-                        l = l.substring(to)
-                        fr += to
-        for i,l in enumerate(self._textDocument._dataLines):
-            _process(i,l)
+            self._lines[fr:to] = newLines
         self.wrapChanged.emit()
 
     def dataToScreenPosition(self, line, pos):
-        for i, (dt, (fr, to)) in enumerate(self._lines):
-            if dt == line and fr <= pos <= to:
+        y = bisect_left(self._lines, (line,))
+        for i in range(y, len(self._lines)):
+            dt, (fr, to) = self._lines[i]
+            if dt != line: break
+            if fr <= pos <= to:
                 l = self._textDocument._dataLines[dt].substring(fr,pos).tab2spaces(self._tabSpaces)
                 return l.termWidth(), i
         return 0,0
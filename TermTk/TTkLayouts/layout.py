@@ -156,11 +156,18 @@ class TTkLayout(TTkLayoutItem):
         ║                            ║
         ╚════════════════════════════╝
     '''
-    __slots__ = ('_items', '_zSortedItems')
+    __slots__ = ('_items', '_zSortedItems', '_hitIndex', '_hitAlways')
+    # Rows of each bucket of the hit test index (1<<3 = 8 rows)
+    _hitBucketBits = 3
+    # Widgets spanning more buckets are checked in every bucket
+    _hitMaxBuckets = 32
+
     def __init__(self, *args, **kwargs):
         TTkLayoutItem.__init__(self, *args, **kwargs)
         self._items = []
         self._zSortedItems = []
+        self._hitIndex = None
+        self._hitAlways = []
         self.layoutItemType = TTkK.LayoutItem
 
     def children(self):
@@ -202,6 +209,51 @@ class TTkLayout(TTkLayoutItem):
 
     def _zSortItems(self):
         self._zSortedItems = sorted(self._items, key=lambda item: item.z)
+        self._hitIndex = None
+
+    def _buildHitIndex(self):
+        ''' Group the items in buckets of rows, each bucket list
+        (from the top z to the bottom) the items that may contain
+        a point in those rows, the nested layouts and the very tall widgets
+        are included in every bucket '''
+        bits, maxBuckets = TTkLayout._hitBucketBits, TTkLayout._hitMaxBuckets
+        spans = []
+        for item in reversed(self._zSortedItems):
+            if item.layoutItemType == TTkK.WidgetItem and not item.isEmpty():
+                _,y,_,h = item.widget().geometry()
+                if h <= 0: continue
+                a, b = y>>bits, (y+h-1)>>bits
+                spans.append((item, (a,b) if b-a < maxBuckets else None))
+            elif item.layoutItemType == TTkK.LayoutItem:
+                spans.append((item, None))
+        index = {}
+        for _,span in spans:
+            if span is None: continue
+            for k in range(span[0],span[1]+1):
+                index[k] = []
+        self._hitAlways = []
+        for item,span in spans:
+            if span is None:
+                self._hitAlways.append(item)
+                for bucket in index.values():
+                    bucket.append(item)
+            else:
+                for k in range(span[0],span[1]+1):
+                    index[k].append(item)
+        self._hitIndex = index
+        return index
+
+    def hitTestItems(self, y):
+        ''' Return the items (from the top z to the bottom) that may contain
+        the row "y" (in the layout coordinates), the index is rebuilt only
+        after the items are added, removed, raised, lowered, moved or resized
+
+        :param int y: the row
+        :return: list[:class:`TTkLayoutItem`]
+        '''
+        if (index := self._hitIndex) is None:
+            index = self._buildHitIndex()
+        return index.get(y>>TTkLayout._hitBucketBits, self._hitAlways)
 
     @property
     def zSortedItems(self): return self._zSortedItems
@@ -248,6 +300,9 @@ class TTkLayout(TTkLayoutItem):
         if item in self._items:
             self._items.remove(item)
         self._zSortItems()
+        # The area covered by the removed item need to be repainted
+        if self.parentWidget():
+            self.parentWidget().update()
 
     def removeWidget(self, widget):
         ''' Remove a widget from this Layout
@@ -287,11 +342,20 @@ class TTkLayout(TTkLayoutItem):
             item.lowerWidget(widget)
         self._zSortItems()
 
+    def setOffset(self, x, y):
+        if (x,y) == self.offset(): return
+        TTkLayoutItem.setOffset(self, x, y)
+        # The children are moved, the area below need to be repainted
+        if self.parentWidget():
+            self.parentWidget().update()
+
     def setGeometry(self, x, y, w, h):
         ax, ay, aw, ah = self.geometry()
         if ax==x and ay==y and aw==w and ah==h: return
         TTkLayoutItem.setGeometry(self, x, y, w, h)
         self.update(repaint=True, updateLayout=True)
+        if self.parentWidget():
+            self.parentWidget().update()
 
     def fullWidgetAreaGeometry(self):
         if not self._items: return 0,0,0,0
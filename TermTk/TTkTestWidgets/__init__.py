@@ -4,3 +4,4 @@ from .testwidgetsizes import TTkTestWidgetSizes
 from .testabstractscroll import TTkTestAbstractScrollWidget
 from .keypressview import TTkKeyPressView
 from .tominspector import TTkTomInspector
+from .renderstatsview import TTkRenderStatsView
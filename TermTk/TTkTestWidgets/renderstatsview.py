@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2023 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from TermTk.TTkCore.renderstats import TTkRenderStats
+from TermTk.TTkCore.signal import pyTTkSlot
+from TermTk.TTkCore.timer import TTkTimer
+from TermTk.TTkCore.color import TTkColor
+from TermTk.TTkWidgets.widget import TTkWidget
+
+class TTkRenderStatsView(TTkWidget):
+    '''Overlay displaying the render statistics collected in the last period
+
+    The statistics collection (:class:`TTkRenderStats`) is enabled
+    while this widget is alive, the frames used to refresh this widget are included
+    '''
+    __slots__ = ('_timer','_period','_lines','_classes','_color')
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._period  = kwargs.get('period', 1.0)
+        self._classes = kwargs.get('classes', 5)
+        self._color = TTkColor.bg('#000044') + TTkColor.fg('#FFFF88')
+        self._lines = ['Collecting...']
+        if 'size' not in kwargs:
+            self.resize(40, 4+self._classes)
+        TTkRenderStats.enable()
+        self._timer = TTkTimer()
+        self._timer.timeout.connect(self._refresh)
+        self._timer.start(self._period)
+
+    @pyTTkSlot()
+    def _refresh(self):
+        self._timer.start(self._period)
+        now = TTkRenderStats.lastFrame()
+        if now is None: return
+        frames = [fs for fs in TTkRenderStats.frames() if fs.time > now.time-self._period]
+        n = len(frames)
+        paint   = sum(sum(t for _,t in fs.paintTime.values()) for fs in frames)*1000/n
+        compose = sum(fs.composeTime for fs in frames)*1000/n
+        encode  = sum(fs.encodeTime  for fs in frames)*1000/n
+        write   = sum(fs.writeTime   for fs in frames)*1000/n
+        self._lines = [
+            f"fps:{n/self._period:.0f} frame:{paint+compose+encode+write:.2f}ms {sum(fs.bytes for fs in frames)/self._period:.0f}B/s",
+            f"paint:{paint:.2f} comp:{compose:.2f} enc:{encode:.2f} wr:{write:.2f}",
+            f"repainted:{sum(fs.repainted for fs in frames)/n:.1f} composed:{sum(fs.composed for fs in frames)/n:.1f}"
+        ] + [
+            f" {name[:22]:22} {count:5} {delta*1000:7.2f}ms"
+            for name,count,delta in TTkRenderStats.paintTimeByClass(frames)[:self._classes] ]
+        self.update()
+
+    def close(self):
+        TTkRenderStats.disable()
+        self._timer.stop()
+        super().close()
+
+    def paintEvent(self):
+        w = self.width()
+        for y in range(self.height()):
+            self._canvas.drawText(pos=(0,y), text=self._lines[y] if y < len(self._lines) else '', width=w, color=self._color)
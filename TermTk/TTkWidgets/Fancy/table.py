@@ -30,7 +30,7 @@ class TTkFancyTable(TTkAbstractScrollArea):
     __slots__ = (
         '_tableView', 'activated',
         # Forwarded Methods
-        'setAlignment', 'setHeader', 'setColumnSize', 'setColumnColors', 'appendItem' )
+        'setAlignment', 'setHeader', 'setColumnSize', 'setColumnColors', 'appendItem', 'appendItems' )
 
 
 
@@ -51,6 +51,7 @@ class TTkFancyTable(TTkAbstractScrollArea):
         self.setColumnSize   = self._tableView.setColumnSize
         self.setColumnColors = self._tableView.setColumnColors
         self.appendItem      = self._tableView.appendItem
+        self.appendItems     = self._tableView.appendItems
 
 
 
@@ -85,7 +85,7 @@ class _TTkFancyTableView(TTkAbstractScrollView):
             '_columns', '_columnColors',
             '_tableDataId', '_tableDataText', '_tableDataWidget', '_shownWidgets',
             '_selectColor', '_selected',
-            '_tableWidth',
+            '_tableWidth', '_widthCount',
             # Signals
             'activated', 'doubleClicked')
     def __init__(self, *args, **kwargs):
@@ -99,6 +99,8 @@ class _TTkFancyTableView(TTkAbstractScrollView):
         self.doubleClicked = pyTTkSignal(int) # Value
 
         self._tableWidth = 0
+        # width -> number of rows with this width
+        self._widthCount = {}
         self._columns = kwargs.get('columns' , [-1] )
         self._alignments = [TTkK.NONE]*len(self._columns)
         self._columnColors = kwargs.get('columnColors' , [TTkColor.RST]*len(self._columns) )
@@ -197,69 +199,110 @@ class _TTkFancyTableView(TTkAbstractScrollView):
             return
         self._columnColors = colors
 
-    def _processValues(self):
-        size = 0
-        for txt in self._tableDataText:
-            size=max(size,sum(t.termWidth() for t in txt))
+    def _addWidths(self, textItems):
+        counts = self._widthCount
+        size = self._tableWidth
+        for txt in textItems:
+            width = sum(t.termWidth() for t in txt)
+            counts[width] = counts.get(width,0)+1
+            size = max(size, width)
+        self._setTableWidth(size)
+
+    def _removeWidths(self, textItems):
+        counts = self._widthCount
+        for txt in textItems:
+            width = sum(t.termWidth() for t in txt)
+            if counts[width] > 1:
+                counts[width] -= 1
+            else:
+                del counts[width]
+        # The max is evaluated again only if the widest rows are gone
+        if self._tableWidth not in counts:
+            self._setTableWidth(max(counts, default=0))
+
+    def _setTableWidth(self, size):
         if self._tableWidth != size:
             self._tableWidth = size
             self.viewChanged.emit()
 
+    def _buildItem(self, item):
+        textItem = [TTkString(i) if isinstance(i,str) else i if issubclass(type(i), TTkString) else TTkString() for i in item]
+        widgetItem = [i if isinstance(i,TTkWidget) else None for i in item]
+        return textItem, widgetItem
 
     def appendItem(self, item, id=None):
         if len(item) != len(self._columns):
             return
-        textItem = [TTkString(i) if isinstance(i,str) else i if issubclass(type(i), TTkString) else TTkString() for i in item]
-        widgetItem = [i if isinstance(i,TTkWidget) else None for i in item]
+        textItem, widgetItem = self._buildItem(item)
         if id is not None:
             self._tableDataId.append(id)
         else:
             self._tableDataId.append(item)
         self._tableDataText.append(textItem)
         self._tableDataWidget.append(widgetItem)
-        self._processValues()
+        self._addWidths((textItem,))
+        self.viewChanged.emit()
+        self.update()
+
+    def appendItems(self, items, ids=None):
+        ''' Append multiple rows with a single update
+
+        :param items: the rows to be appended, the rows with a wrong number of columns are ignored
+        :type items: list
+        :param ids: the ids of the rows (the row itself if not defined)
+        :type ids: list, optional
+        '''
+        if ids is None:
+            ids = items
+        cols = len(self._columns)
+        textItems = []
+        for item, id in zip(items, ids):
+            if len(item) != cols:
+                continue
+            textItem, widgetItem = self._buildItem(item)
+            self._tableDataId.append(id)
+            self._tableDataWidget.append(widgetItem)
+            textItems.append(textItem)
+        self._tableDataText += textItems
+        self._addWidths(textItems)
         self.viewChanged.emit()
         self.update()
 
     def insertItem(self, index, item, id=None):
         if len(item) != len(self._columns):
             return#
-        textItem = [TTkString(i) if isinstance(i,str) else i if issubclass(type(i), TTkString) else TTkString() for i in item]
-        widgetItem = [i if isinstance(i,TTkWidget) else None for i in item]
+        textItem, widgetItem = self._buildItem(item)
         if id is not None:
             self._tableDataId.insert(index, id)
         else:
             self._tableDataId.insert(index, item)
         self._tableDataText.insert(index, textItem)
         self._tableDataWidget.insert(index, widgetItem)
-        self._processValues()
+        self._addWidths((textItem,))
         self.viewChanged.emit()
         self.update()
 
     def removeItem(self, item):
         index = self.indexOf(item)
         self.removeItemAt(index)
-        self._processValues()
-        self.viewChanged.emit()
-        self.update()
 
     def removeItemAt(self, index):
         if self._selected == index:
             self._selected = -1
+        self._removeWidths((self._tableDataText[index],))
         del self._tableDataId[index]
         del self._tableDataText[index]
         del self._tableDataWidget[index]
-        self._processValues()
         self.viewChanged.emit()
         self.update()
 
     def removeItemsFrom(self, index):
         if self._selected >= index:
             self._selected = -1
+        self._removeWidths(self._tableDataText[index:])
         self._tableDataId = self._tableDataId[:index]
         self._tableDataText = self._tableDataText[:index]
         self._tableDataWidget = self._tableDataWidget[:index]
-        self._processValues()
         self.viewChanged.emit()
         self.update()
 
@@ -357,7 +400,7 @@ class TTkFancyTableView(TTkAbstractScrollView):
     __slots__ = (
         '_header', '_tableView', '_showHeader', 'activated',
         # Forwarded Methods
-        'setHeader', 'setColumnColors', 'appendItem', 'itemAt', 'dataAt', 'indexOf', 'insertItem',
+        'setHeader', 'setColumnColors', 'appendItem', 'appendItems', 'itemAt', 'dataAt', 'indexOf', 'insertItem',
         'removeItem', 'removeItemAt', 'removeItemsFrom', 'doubleClicked')
 
     def __init__(self, *args, **kwargs):
@@ -382,6 +425,7 @@ class TTkFancyTableView(TTkAbstractScrollView):
         self.setHeader       = self._header.setHeader
         self.setColumnColors = self._tableView.setColumnColors
         self.appendItem      = self._tableView.appendItem
+        self.appendItems     = self._tableView.appendItems
         self.dataAt          = self._tableView.dataAt
         self.itemAt          = self._tableView.itemAt
         self.indexOf         = self._tableView.indexOf
@@ -4,3 +4,6 @@ from .treewidgetitem      import TTkTreeWidgetItem
 from .filetree            import TTkFileTree
 from .filetreewidget      import TTkFileTreeWidget
 from .filetreewidgetitem  import TTkFileTreeWidgetItem
+from .table               import TTkTable
+from .tableview           import TTkTableView
+from .tablemodellist      import TTkTableModelList
@@ -24,20 +24,44 @@
 
 import os
 import datetime
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from TermTk.TTkCore.color import TTkColor
 
 from TermTk.TTkCore.constant import TTkK
 from TermTk.TTkCore.cfg import TTkCfg
 from TermTk.TTkCore.string import TTkString
+from TermTk.TTkCore.timer import TTkTimer
 from TermTk.TTkWidgets.TTkModelView.treewidget import TTkTreeWidget
 from TermTk.TTkWidgets.TTkModelView.filetreewidgetitem import TTkFileTreeWidgetItem
 from TermTk.TTkCore.signal import pyTTkSlot, pyTTkSignal
 
 class TTkFileTreeWidget(TTkTreeWidget):
-    __slots__ = ('_path', '_filter',
+    ''' TTkFileTreeWidget
+
+    The folders are read in a pool of background threads,
+    the items are added to the tree in batches while the folder is scanned
+    and a "loading..." item is displayed until the scan is completed.
+
+    The content of the folders is cached and reused until their modification time changes.
+    '''
+    __slots__ = ('_path', '_filter', '_loading', '_loaded', '_loadTimer',
                  # Signals
                  'fileClicked', 'folderClicked', 'fileDoubleClicked', 'folderDoubleClicked', 'fileActivated', 'folderActivated')
+
+    # Number of items added to the tree at once
+    loadBatchSize = 0x200
+    # Number of folders kept in the cache
+    dirCacheSize  = 0x100
+
+    # Shared by all the file trees
+    _loaderPool = None
+    # abspath -> (st_mtime_ns, [entries])
+    _dirCache = {}
+    _dirCacheLock = threading.Lock()
+
     def __init__(self, *args, **kwargs):
         # Signals
         self.fileClicked         = pyTTkSignal(TTkFileTreeWidgetItem)
@@ -46,6 +70,12 @@ class TTkFileTreeWidget(TTkTreeWidget):
         self.folderDoubleClicked = pyTTkSignal(TTkFileTreeWidgetItem)
         self.fileActivated       = pyTTkSignal(TTkFileTreeWidgetItem)
         self.folderActivated     = pyTTkSignal(TTkFileTreeWidgetItem)
+        # folder item -> its "loading..." item, for the folders being scanned
+        self._loading = {}
+        # (folder item, [items] or None when completed) produced by the loader threads
+        self._loaded = deque()
+        self._loadTimer = TTkTimer()
+        self._loadTimer.timeout.connect(self._loadedItems)
         TTkTreeWidget.__init__(self, *args, **kwargs)
         self._name = kwargs.get('name' , 'TTkFileTreeWidget' )
         self._path   = kwargs.get('path','.')
@@ -70,85 +100,167 @@ class TTkFileTreeWidget(TTkTreeWidget):
         self._path = path
 
         self.clear()
-        for i in TTkFileTreeWidget._getFileItems(path):
-            self.addTopLevelItem(i)
-        self.setFilter(self._filter)
+        # The scans still running are discarded
+        self._loading = {}
+        # TODO: Avoid to refer directly '_rootItem'
+        self._loadFolder(self._rootItem, path)
+
+    def _loadFolder(self, item, path):
+        loadingItem = TTkFileTreeWidgetItem(
+                            [ TTkString('loading...', TTkCfg.theme.failNameColor), "", "", ""],
+                            raw = [ '' , -1 , '' , 0 ],
+                            path='', type=None,
+                            childIndicatorPolicy=TTkK.DontShowIndicator)
+        self._loading[item] = loadingItem
+        item.addChild(loadingItem)
+        if not TTkFileTreeWidget._loaderPool:
+            TTkFileTreeWidget._loaderPool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='TTkFileTree')
+        try:
+            TTkFileTreeWidget._loaderPool.submit(self._loadThread, item, path)
+        except RuntimeError:
+            # Threads not available (i.e. pyodide)
+            self._loadThread(item, path)
+
+    def _loadThread(self, item, path):
+        try:
+            for entries in TTkFileTreeWidget._scanDir(path):
+                if item not in self._loading: return
+                self._loaded.append((item, [TTkFileTreeWidget._fileItem(*e) for e in entries]))
+                self._loadTimer.start()
+        finally:
+            self._loaded.append((item, None))
+            self._loadTimer.start()
+
+    @pyTTkSlot()
+    def _loadedItems(self):
+        while self._loaded:
+            item, items = self._loaded.popleft()
+            if item not in self._loading: continue
+            if items is None:
+                item.removeChild(self._loading.pop(item))
+                continue
+            for i in items:
+                # TODO: Find a better way than calling an internal function
+                i._processFilter(self._filter)
+            item.addChildren(items)
 
     @staticmethod
-    def _getFileItems(path):
+    def _scanDir(path):
+        ''' Yield the entries of the folder in batches of :attr:`loadBatchSize`
+
+        Each entry is (name, path, isDir, isLink, os.stat_result or None if broken)
+        '''
         path = os.path.abspath(path)
-        if not os.path.exists(path): return []
-        dir_list = os.listdir(path)
-        ret = []
-        for n in dir_list:
-            nodePath = os.path.join(path,n)
-
-            def _getStat(_path):
-                info = os.stat(_path)
-                time = datetime.datetime.fromtimestamp(info.st_ctime).strftime('%Y-%m-%d %H:%M:%S')
-                if info.st_size > (1024*1024*1024):
-                    size = f"{info.st_size/(1024*1024*1024):.2f} GB"
-                if info.st_size > (1024*1024):
-                    size = f"{info.st_size/(1024*1024):.2f} MB"
-                elif info.st_size > 1024:
-                    size = f"{info.st_size/1024:.2f} KB"
-                else:
-                    size = f"{info.st_size} bytes"
-                return time, size, info.st_ctime, info.st_size
-
-            if os.path.isdir(nodePath):
-                if os.path.exists(nodePath):
-                    time, _, rawTime, _ = _getStat(nodePath)
-                    color = TTkCfg.theme.folderNameColor
-                else:
-                    time, _, rawTime, _ = ""
-                    color = TTkCfg.theme.failNameColor
-
-                if os.path.islink(nodePath):
-                    name = TTkString()+TTkCfg.theme.linkNameColor+n+'/'+TTkColor.RST+' -> '+TTkCfg.theme.folderNameColor+os.readlink(nodePath)
-                    typef = "Folder Link"
-                else:
-                    name = TTkString()+color+n+'/'
-                    typef = "Folder"
-
-                ret.append(TTkFileTreeWidgetItem(
-                                [ name, "", typef, time],
-                                raw = [ n , -1 , typef , rawTime ],
-                                path=nodePath,
-                                type=TTkFileTreeWidgetItem.DIR,
-                                icon=TTkString() + TTkCfg.theme.folderIconColor + TTkCfg.theme.fileIcon.folderClose + TTkColor.RST,
-                                childIndicatorPolicy=TTkK.ShowIndicator))
-
-            elif os.path.isfile(nodePath) or os.path.islink(nodePath):
-                if os.path.exists(nodePath):
-                    time, size, rawTime, rawSize = _getStat(nodePath)
-                    if os.access(nodePath, os.X_OK):
-                        color = TTkCfg.theme.executableColor
-                        typef="Exec"
-                    else:
-                        color = TTkCfg.theme.fileNameColor
-                        typef="File"
-                else:
-                    time, size, rawTime, rawSize = "", "", 0, 0
-                    color = TTkCfg.theme.failNameColor
-                    typef="Broken"
-
-                if os.path.islink(nodePath):
-                    name = TTkString()+TTkCfg.theme.linkNameColor+n+TTkColor.RST+' -> '+color+os.readlink(nodePath)
-                    typef += " Link"
-                else:
-                    name = TTkString()+color+n
-
-                _, ext = os.path.splitext(n)
-                if ext: ext = f"{ext[1:]} "
-                ret.append(TTkFileTreeWidgetItem(
-                                [ name, size, typef, time],
-                                raw = [ n , rawSize , typef , rawTime ],
-                                path=nodePath,
-                                type=TTkFileTreeWidgetItem.FILE,
-                                icon=TTkString() + TTkCfg.theme.fileIconColor + TTkCfg.theme.fileIcon.getIcon(n) + TTkColor.RST,
-                                childIndicatorPolicy=TTkK.DontShowIndicator))
-        return ret
+        cache = TTkFileTreeWidget._dirCache
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return
+        with TTkFileTreeWidget._dirCacheLock:
+            cached = cache.get(path)
+        if cached and cached[0] == mtime:
+            entries = cached[1]
+            for i in range(0, len(entries), TTkFileTreeWidget.loadBatchSize):
+                yield entries[i:i+TTkFileTreeWidget.loadBatchSize]
+            return
+        entries = []
+        batch = 0
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    # The DirEntry caches the type and the stat results
+                    isLink = entry.is_symlink()
+                    isDir  = entry.is_dir()
+                    if not (isDir or isLink or entry.is_file()): continue
+                    try:
+                        info = entry.stat()
+                    except OSError:
+                        info = None
+                    entries.append((entry.name, entry.path, isDir, isLink, info))
+                    if len(entries) - batch >= TTkFileTreeWidget.loadBatchSize:
+                        yield entries[batch:]
+                        batch = len(entries)
+        except OSError:
+            if batch < len(entries):
+                yield entries[batch:]
+            return
+        if batch < len(entries):
+            yield entries[batch:]
+        # The cache is shared by the loader threads
+        with TTkFileTreeWidget._dirCacheLock:
+            cache.pop(path, None)
+            cache[path] = (mtime, entries)
+            while len(cache) > TTkFileTreeWidget.dirCacheSize:
+                cache.pop(next(iter(cache)))
+
+    @staticmethod
+    def _fileItem(n, nodePath, isDir, isLink, info):
+        def _getStat(info):
+            time = datetime.datetime.fromtimestamp(info.st_ctime).strftime('%Y-%m-%d %H:%M:%S')
+            if info.st_size > (1024*1024*1024):
+                size = f"{info.st_size/(1024*1024*1024):.2f} GB"
+            elif info.st_size > (1024*1024):
+                size = f"{info.st_size/(1024*1024):.2f} MB"
+            elif info.st_size > 1024:
+                size = f"{info.st_size/1024:.2f} KB"
+            else:
+                size = f"{info.st_size} bytes"
+            return time, size, info.st_ctime, info.st_size
+
+        if isDir:
+            if info:
+                time, _, rawTime, _ = _getStat(info)
+                color = TTkCfg.theme.folderNameColor
+            else:
+                time, rawTime = "", 0
+                color = TTkCfg.theme.failNameColor
+
+            if isLink:
+                name = TTkString()+TTkCfg.theme.linkNameColor+n+'/'+TTkColor.RST+' -> '+TTkCfg.theme.folderNameColor+os.readlink(nodePath)
+                typef = "Folder Link"
+            else:
+                name = TTkString(n+'/', color)
+                typef = "Folder"
+
+            return TTkFileTreeWidgetItem(
+                            [ name, "", typef, time],
+                            raw = [ n , -1 , typef , rawTime ],
+                            path=nodePath,
+                            type=TTkFileTreeWidgetItem.DIR,
+                            icon=TTkString(TTkCfg.theme.fileIcon.folderClose, TTkCfg.theme.folderIconColor),
+                            childIndicatorPolicy=TTkK.ShowIndicator)
+
+        if info:
+            time, size, rawTime, rawSize = _getStat(info)
+            # Any execute permission bit, to avoid an access() call per file
+            if info.st_mode & 0o111:
+                color = TTkCfg.theme.executableColor
+                typef="Exec"
+            else:
+                color = TTkCfg.theme.fileNameColor
+                typef="File"
+        else:
+            time, size, rawTime, rawSize = "", "", 0, 0
+            color = TTkCfg.theme.failNameColor
+            typef="Broken"
+
+        if isLink:
+            name = TTkString()+TTkCfg.theme.linkNameColor+n+TTkColor.RST+' -> '+color+os.readlink(nodePath)
+            typef += " Link"
+        else:
+            name = TTkString(n, color)
+
+        return TTkFileTreeWidgetItem(
+                        [ name, size, typef, time],
+                        raw = [ n , rawSize , typef , rawTime ],
+                        path=nodePath,
+                        type=TTkFileTreeWidgetItem.FILE,
+                        icon=TTkString(TTkCfg.theme.fileIcon.getIcon(n), TTkCfg.theme.fileIconColor),
+                        childIndicatorPolicy=TTkK.DontShowIndicator)
+
+    @staticmethod
+    def _getFileItems(path):
+        return [TTkFileTreeWidget._fileItem(*e) for entries in TTkFileTreeWidget._scanDir(path) for e in entries]
 
     @staticmethod
     def _folderExpanded(item):
@@ -160,11 +272,9 @@ class TTkFileTreeWidget(TTkTreeWidget):
 
     @pyTTkSlot(TTkFileTreeWidgetItem)
     def _updateChildren(self, item):
-        if item.children(): return
-        for i in TTkFileTreeWidget._getFileItems(item.path()):
-            item.addChild(i)
-            # TODO: Find a better way than calling an internal function
-            i._processFilter(self._filter)
+        # Already loaded (or being loaded)
+        if item._children or item.getType() != TTkFileTreeWidgetItem.DIR: return
+        self._loadFolder(item, item.path())
 
     @pyTTkSlot(TTkFileTreeWidgetItem, int)
     def _activated(self, item, _):
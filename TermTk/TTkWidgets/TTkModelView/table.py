@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2022 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from TermTk.TTkCore.constant import TTkK
+from TermTk.TTkWidgets.TTkModelView.tableview import TTkTableView
+from TermTk.TTkAbstract.abstractscrollarea import TTkAbstractScrollArea
+
+class TTkTable(TTkAbstractScrollArea):
+    ''' TTkTable
+
+    Scroll area of a :class:`~TermTk.TTkWidgets.TTkModelView.tableview.TTkTableView`
+    '''
+    __slots__ = (
+        '_tableView',
+        # Forwarded Signals
+        'cellClicked', 'cellDoubleClicked',
+        # Forwarded Methods
+        'model', 'setModel', 'columnWidth', 'setColumnWidth', 'currentRow', 'setCurrentRow' )
+
+    def __init__(self, *args, **kwargs):
+        TTkAbstractScrollArea.__init__(self, *args, **kwargs)
+        self._name = kwargs.get('name' , 'TTkTable' )
+        if 'parent' in kwargs: kwargs.pop('parent')
+        self._tableView = kwargs.get('tableView',TTkTableView(*args, **kwargs))
+        self.setViewport(self._tableView)
+        self.setFocusPolicy(TTkK.ClickFocus)
+
+        # Forward the signal
+        self.cellClicked       = self._tableView.cellClicked
+        self.cellDoubleClicked = self._tableView.cellDoubleClicked
+
+        # Forwarded Methods
+        self.model          = self._tableView.model
+        self.setModel       = self._tableView.setModel
+        self.columnWidth    = self._tableView.columnWidth
+        self.setColumnWidth = self._tableView.setColumnWidth
+        self.currentRow     = self._tableView.currentRow
+        self.setCurrentRow  = self._tableView.setCurrentRow
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2022 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from TermTk.TTkCore.constant import TTkK
+from TermTk.TTkAbstract.abstracttablemodel import TTkAbstractTableModel
+
+class TTkTableModelList(TTkAbstractTableModel):
+    ''' TTkTableModelList
+
+    Table model of a list of rows, the list is used as it is (not copied)
+
+    ::
+
+        model = TTkTableModelList(
+                    header = ['Name', 'Size'],
+                    data   = [['a.txt', 123],
+                              ['b.txt', 456]] )
+
+    :param data: the list of the rows, each row is a list of cells (str, :class:`~TermTk.TTkCore.string.TTkString` or any other object),
+                 the missing cells of the rows shorter than :meth:`columnCount` are empty
+    :type data: list, optional
+    :param header: the labels of the columns
+    :type header: list, optional
+    '''
+    __slots__ = ('_data', '_header')
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._data   = kwargs.get('data', [])
+        self._header = kwargs.get('header', [])
+
+    def modelList(self):
+        return self._data
+
+    def setModelList(self, data):
+        self._data = data
+        self.modelReset.emit()
+
+    def setHeader(self, header):
+        self._header = header
+        self.modelReset.emit()
+
+    def rowCount(self) -> int:
+        return len(self._data)
+
+    def columnCount(self) -> int:
+        if self._header:
+            return len(self._header)
+        return len(self._data[0]) if self._data else 0
+
+    def data(self, row, col, role=TTkK.DisplayRole):
+        if role == TTkK.DisplayRole and col < len(line := self._data[row]):
+            return line[col]
+        return None
+
+    def headerData(self, col, role=TTkK.DisplayRole):
+        if role == TTkK.DisplayRole and col < len(self._header):
+            return self._header[col]
+        return None
+
+    def setData(self, row, col, value):
+        line = self._data[row]
+        if col >= len(line):
+            line.extend([None]*(col+1-len(line)))
+        line[col] = value
+        self.rowsChanged.emit(row, 1)
+
+    def appendRows(self, rows):
+        first = len(self._data)
+        self._data.extend(rows)
+        self.rowsInserted.emit(first, len(self._data)-first)
+
+    def insertRows(self, row, rows):
+        self._data[row:row] = rows
+        self.rowsInserted.emit(row, len(rows))
+
+    def removeRows(self, row, count):
+        count = max(0, min(count, len(self._data)-row))
+        del self._data[row:row+count]
+        self.rowsRemoved.emit(row, count)
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2022 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from bisect import bisect_left
+from collections import OrderedDict
+
+from TermTk.TTkCore.cfg import TTkCfg
+from TermTk.TTkCore.constant import TTkK
+from TermTk.TTkCore.string import TTkString
+from TermTk.TTkCore.signal import pyTTkSignal, pyTTkSlot
+from TermTk.TTkAbstract.abstractscrollview import TTkAbstractScrollView
+from TermTk.TTkAbstract.abstracttablemodel import TTkAbstractTableModel
+from TermTk.TTkWidgets.TTkModelView.tablemodellist import TTkTableModelList
+
+class TTkTableView(TTkAbstractScrollView):
+    ''' TTkTableView
+
+    View of a :class:`~TermTk.TTkAbstract.abstracttablemodel.TTkAbstractTableModel`
+
+    Only the displayed cells are queried to the model,
+    the rendered cells are kept in a LRU cache of :attr:`cacheSize` cells
+    and discarded when the model notify a change of their rows.
+
+    ::
+
+        Name     │Size     │Date      ◀─ model.headerData(col)
+        a.txt    │      123│2022-01-01 ◀─ model.data(row, col)
+        b.txt    │      456│2022-01-02
+
+    :param model: the model to be displayed, defaults to an empty :class:`~TermTk.TTkWidgets.TTkModelView.tablemodellist.TTkTableModelList`
+    :type model: :class:`~TermTk.TTkAbstract.abstracttablemodel.TTkAbstractTableModel`, optional
+    :param cacheSize: the max number of rendered cells kept in the cache, defaults to 0x4000
+    :type cacheSize: int, optional
+    '''
+    __slots__ = ( '_tableModel', '_columnsPos', '_cache', '_cacheSize',
+                  '_selected', '_separatorSelected',
+                  '_headerColor', '_selectedColor', '_lineColor',
+                  # Signals
+                  'cellClicked', 'cellDoubleClicked'
+                  )
+
+    def __init__(self, *args, **kwargs):
+        # Signals
+        self.cellClicked       = pyTTkSignal(int, int)
+        self.cellDoubleClicked = pyTTkSignal(int, int)
+
+        super().__init__(*args, **kwargs)
+        self._name = kwargs.get('name' , 'TTkTableView' )
+        self._selected = None
+        self._separatorSelected = None
+        self._columnsPos = []
+        # (row, col) -> (text, alignment)
+        self._cache = OrderedDict()
+        self._cacheSize = kwargs.get('cacheSize', 0x4000)
+        self._headerColor   = kwargs.get('headerColor',   TTkCfg.theme.treeHeaderColor)
+        self._selectedColor = kwargs.get('selectedColor', TTkCfg.theme.treeSelectedColor)
+        self._lineColor     = kwargs.get('lineColor',     TTkCfg.theme.treeLineColor)
+        self.setMinimumHeight(1)
+        self.setFocusPolicy(TTkK.ClickFocus)
+        self._tableModel = None
+        self.setModel(kwargs.get('model', TTkTableModelList()))
+
+    # Overridden function
+    def viewFullAreaSize(self) -> (int, int):
+        w = self._columnsPos[-1]+1 if self._columnsPos else 0
+        h = self._tableModel.rowCount()+1
+        return w,h
+
+    # Overridden function
+    def viewDisplayedSize(self) -> (int, int):
+        return self.size()
+
+    def model(self) -> TTkAbstractTableModel:
+        return self._tableModel
+
+    def setModel(self, model):
+        if self._tableModel:
+            self._tableModel.dataChanged.disconnect(self._dataChanged)
+            self._tableModel.rowsChanged.disconnect(self._rowsChanged)
+            self._tableModel.rowsInserted.disconnect(self._rowsInserted)
+            self._tableModel.rowsRemoved.disconnect(self._rowsRemoved)
+            self._tableModel.modelReset.disconnect(self._modelReset)
+        self._tableModel = model
+        model.dataChanged.connect(self._dataChanged)
+        model.rowsChanged.connect(self._rowsChanged)
+        model.rowsInserted.connect(self._rowsInserted)
+        model.rowsRemoved.connect(self._rowsRemoved)
+        model.modelReset.connect(self._modelReset)
+        self._columnsPos = []
+        self._modelReset()
+
+    def columnWidth(self, col) -> int:
+        return self._columnsPos[col] - (self._columnsPos[col-1]+1 if col else 0)
+
+    def setColumnWidth(self, col, width):
+        diff = width - self.columnWidth(col)
+        for i in range(col, len(self._columnsPos)):
+            self._columnsPos[i] += diff
+        self.viewChanged.emit()
+        self.update()
+
+    def currentRow(self):
+        ''' Return the selected row, None if no row is selected '''
+        return self._selected
+
+    def setCurrentRow(self, row):
+        self._selected = row
+        self.update()
+
+    @pyTTkSlot()
+    def _dataChanged(self):
+        self._cache.clear()
+        self.viewChanged.emit()
+        self.update()
+
+    @pyTTkSlot(int, int)
+    def _rowsChanged(self, first, count):
+        for key in [k for k in self._cache if first <= k[0] < first+count]:
+            del self._cache[key]
+        self.update()
+
+    def _dropRowsFrom(self, first):
+        # The rows after "first" are moved
+        for key in [k for k in self._cache if k[0] >= first]:
+            del self._cache[key]
+
+    @pyTTkSlot(int, int)
+    def _rowsInserted(self, first, count):
+        self._dropRowsFrom(first)
+        if self._selected is not None and self._selected >= first:
+            self._selected += count
+        self.viewChanged.emit()
+        self.update()
+
+    @pyTTkSlot(int, int)
+    def _rowsRemoved(self, first, count):
+        self._dropRowsFrom(first)
+        if self._selected is not None and self._selected >= first:
+            self._selected = self._selected - count if self._selected >= first+count else None
+        self.viewChanged.emit()
+        self.update()
+
+    @pyTTkSlot()
+    def _modelReset(self):
+        self._cache.clear()
+        self._selected = None
+        cols = self._tableModel.columnCount()
+        if cols != len(self._columnsPos):
+            # Set 20 as default column size
+            self._columnsPos = [20+x*20 for x in range(cols)]
+        self.viewChanged.emit()
+        self.update()
+
+    @staticmethod
+    def _toString(value):
+        if value is None:
+            return TTkString()
+        if isinstance(value, TTkString):
+            return value
+        return TTkString(value if isinstance(value, str) else str(value))
+
+    def _cellData(self, row, col):
+        cache = self._cache
+        if (cell := cache.get((row, col))) is not None:
+            cache.move_to_end((row, col))
+            return cell
+        model = self._tableModel
+        alignment = model.data(row, col, TTkK.TextAlignmentRole)
+        cell = ( TTkTableView._toString(model.data(row, col)),
+                 TTkK.NONE if alignment is None else alignment )
+        cache[(row, col)] = cell
+        if len(cache) > self._cacheSize:
+            cache.popitem(last=False)
+        return cell
+
+    def _columnAt(self, x):
+        col = bisect_left(self._columnsPos, x)
+        return col if col < len(self._columnsPos) else -1
+
+    def mouseDoubleClickEvent(self, evt):
+        x,y = evt.x, evt.y
+        ox, oy = self.getViewOffsets()
+        row = y+oy-1
+        if y > 0 and row < self._tableModel.rowCount():
+            self._selected = row
+            self.cellDoubleClicked.emit(row, self._columnAt(x+ox))
+            self.update()
+        return True
+
+    def focusOutEvent(self):
+        self._separatorSelected = None
+
+    def mousePressEvent(self, evt):
+        x,y = evt.x, evt.y
+        ox, oy = self.getViewOffsets()
+        x += ox
+        self._separatorSelected = None
+        # Handle Header Events
+        if y == 0:
+            if x in self._columnsPos:
+                self._separatorSelected = self._columnsPos.index(x)
+                self.update()
+            return True
+        row = y+oy-1
+        if row < self._tableModel.rowCount():
+            self._selected = row
+            self.cellClicked.emit(row, self._columnAt(x))
+            self.update()
+        return True
+
+    def mouseDragEvent(self, evt):
+        ''' Resize the column of the selected separator (see :class:`~TermTk.TTkWidgets.TTkModelView.treewidget.TTkTreeWidget`) '''
+        if self._separatorSelected is not None:
+            x,y = evt.x, evt.y
+            ox, oy = self.getViewOffsets()
+            x += ox
+            ss = self._separatorSelected
+            pos = max((ss+1)*4, x)
+            diff = pos - self._columnsPos[ss]
+            # Align the previous Separators if pushed
+            for i in range(ss):
+                self._columnsPos[i] = min(self._columnsPos[i], pos-(ss-i)*4)
+            # Align all the other Separators relative to the selection
+            for i in range(ss, len(self._columnsPos)):
+                self._columnsPos[i] += diff
+            self.update()
+            self.viewChanged.emit()
+            return True
+        return False
+
+    def paintEvent(self):
+        x,y = self.getViewOffsets()
+        w,h = self.size()
+        tt = TTkCfg.theme.tree
+        model = self._tableModel
+        columnsPos = self._columnsPos
+
+        # Only the displayed columns and rows are queried
+        colFrom = bisect_left(columnsPos, x)
+        colTo   = min(len(columnsPos), bisect_left(columnsPos, x+w)+1)
+        rowTo   = min(y+h-1, model.rowCount())
+
+        # Draw header first:
+        for col in range(colFrom, colTo):
+            hx  = 0 if col==0 else columnsPos[col-1]+1
+            hx1 = columnsPos[col]
+            text = TTkTableView._toString(model.headerData(col))
+            self._canvas.drawText(pos=(hx-x,0), text=text, width=hx1-hx, color=self._headerColor)
+        # Draw header separators
+        for sx in columnsPos[colFrom:colTo]:
+            self._canvas.drawChar(pos=(sx-x,0), char=tt[5], color=self._headerColor)
+            for sy in range(1,h):
+                self._canvas.drawChar(pos=(sx-x,sy), char=tt[4], color=self._lineColor)
+
+        # Draw the displayed cells
+        for i, row in enumerate(range(y, rowTo),1):
+            for col in range(colFrom, colTo):
+                lx  = 0 if col==0 else columnsPos[col-1]+1
+                lx1 = columnsPos[col]
+                text, alignment = self._cellData(row, col)
+                if row == self._selected:
+                    self._canvas.drawText(pos=(lx-x,i), text=text, width=lx1-lx, alignment=alignment, color=self._selectedColor, forceColor=True)
+                else:
+                    self._canvas.drawText(pos=(lx-x,i), text=text, width=lx1-lx, alignment=alignment)
@@ -29,8 +29,6 @@ from TermTk.TTkWidgets.TTkModelView.treewidgetitem import TTkTreeWidgetItem
 from TermTk.TTkAbstract.abstractscrollview import TTkAbstractScrollView
 from TermTk.TTkCore.signal import pyTTkSignal, pyTTkSlot
 
-from dataclasses import dataclass
-
 class TTkTreeWidget(TTkAbstractScrollView):
     __slots__ = ( '_rootItem', '_header', '_columnsPos', '_cache',
                   '_selectedId', '_selected', '_separatorSelected', '_mouseDelta',
@@ -39,12 +37,6 @@ class TTkTreeWidget(TTkAbstractScrollView):
                   # Signals
                   'itemChanged', 'itemClicked', 'itemDoubleClicked', 'itemExpanded', 'itemCollapsed', 'itemActivated'
                   )
-    @dataclass(frozen=True)
-    class _Cache:
-        item: TTkTreeWidgetItem
-        level: int
-        data: list
-
     def __init__(self, *args, **kwargs):
         # Signals
         self.itemActivated     = pyTTkSignal(TTkTreeWidgetItem, int)
@@ -61,7 +53,7 @@ class TTkTreeWidget(TTkAbstractScrollView):
         self._separatorSelected = None
         self._header = kwargs.get('header',[])
         self._columnsPos = []
-        self._cache = []
+        self._cache = {}
         self._sortColumn = -1
         self._sortOrder = TTkK.AscendingOrder
         self._headerColor   = kwargs.get('headerColor',   TTkCfg.theme.treeHeaderColor)
@@ -123,8 +115,8 @@ class TTkTreeWidget(TTkAbstractScrollView):
         ox, oy = self.getViewOffsets()
         y += oy-1
         x += ox
-        if 0 <= y < len(self._cache):
-            item  = self._cache[y].item
+        if row := self._itemAt(y):
+            item, _ = row
             if item.childIndicatorPolicy() == TTkK.DontShowIndicatorWhenChildless and item.children() or \
                item.childIndicatorPolicy() == TTkK.ShowIndicator:
                 item.setExpanded(not item.isExpanded())
@@ -176,9 +168,8 @@ class TTkTreeWidget(TTkAbstractScrollView):
             return True
         # Handle Tree/Table Events
         y += oy-1
-        if 0 <= y < len(self._cache):
-            item  = self._cache[y].item
-            level = self._cache[y].level
+        if row := self._itemAt(y):
+            item, level = row
             if level*2 <= x < level*2+3 and \
                ( item.childIndicatorPolicy() == TTkK.DontShowIndicatorWhenChildless and item.children() or
                  item.childIndicatorPolicy() == TTkK.ShowIndicator ):
@@ -236,37 +227,40 @@ class TTkTreeWidget(TTkAbstractScrollView):
 
     @pyTTkSlot()
     def _refreshCache(self):
-        ''' I save a representation of the displayed tree in a cache array
-            to avoid eccessve recursion over the items and
-            identify quickly the nth displayed line to improve the interaction
+        ''' The displayed rows are not stored,
+            the item at the nth displayed line is retrieved from the
+            (memoized) sizes of the subtrees (_itemAt)
 
-            _cache is an array of TTkTreeWidget._Cache:
-            [ item, level, data=[txtCol1, txtCol2, txtCol3, ... ]]
+            _cache stores only the strings of the cells of the displayed rows:
+            { item : [txtCol1, txtCol2, txtCol3, ... ] }
+            it is cleared when the items change
         '''
-        self._cache = []
-        def _addToCache(_child, _level):
-            _data = []
-            for _il in range(len(self._header)):
-                _icon = _child.icon(_il)
-                if _icon:
-                    _icon = ' '+_icon+' '
-                if _il==0:
-                    _data.append(TTkString('  '*_level+_icon+_child.data(_il)))
-                else:
-                    _data.append(TTkString(_icon+_child.data(_il)))
-
-            self._cache.append(TTkTreeWidget._Cache(
-                                item  = _child,
-                                level = _level,
-                                data  = _data))
-            if _child.isExpanded():
-                for _c in _child.children():
-                   _addToCache(_c, _level+1)
-        for c in self._rootItem.children():
-            _addToCache(c,0)
+        self._cache = {}
         self.update()
         self.viewChanged.emit()
 
+    def _itemAt(self, row):
+        ''' Return (item, level) displayed at "row" or None if out of range '''
+        if not 0 <= row < self._rootItem.size()-1:
+            return None
+        # The root item is not displayed
+        item, level = self._rootItem._itemAt(row+1)
+        return item, level-1
+
+    def _rowData(self, item, level, cache):
+        if (data := self._cache.get(item)) is None:
+            data = []
+            for il in range(len(self._header)):
+                icon = item.icon(il)
+                if icon:
+                    icon = ' '+icon+' '
+                if il==0:
+                    data.append(TTkString('  '*level+icon+item.data(il)))
+                else:
+                    data.append(TTkString(icon+item.data(il)))
+        cache[item] = data
+        return data
+
     def paintEvent(self):
         x,y = self.getViewOffsets()
         w,h = self.size()
@@ -286,14 +280,17 @@ class TTkTreeWidget(TTkAbstractScrollView):
             for sy in range(1,h):
                 self._canvas.drawChar(pos=(sx-x,sy), char=tt[4], color=self._lineColor)
 
-        # Draw cache
-        for i, c in enumerate(self._cache):
-            if i-y<0 : continue
-            item  = c.item
+        # Draw the displayed rows,
+        # only the strings of these rows are kept in the cache
+        cache = {}
+        for i in range(1, min(h, self._rootItem.size()-y)):
+            item, level = self._itemAt(y+i-1)
+            data  = self._rowData(item, level, cache)
             for il in range(len(self._header)):
                 lx = 0 if il==0 else self._columnsPos[il-1]+1
                 lx1 = self._columnsPos[il]
                 if item.isSelected():
-                    self._canvas.drawText(pos=(lx-x,i-y+1), text=c.data[il], width=lx1-lx, alignment=item.textAlignment(il), color=self._selectedColor, forceColor=True)
+                    self._canvas.drawText(pos=(lx-x,i), text=data[il], width=lx1-lx, alignment=item.textAlignment(il), color=self._selectedColor, forceColor=True)
                 else:
-                    self._canvas.drawText(pos=(lx-x,i-y+1), text=c.data[il], width=lx1-lx, alignment=item.textAlignment(il))
+                    self._canvas.drawText(pos=(lx-x,i), text=data[il], width=lx1-lx, alignment=item.textAlignment(il))
+        self._cache = cache
@@ -22,6 +22,9 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from bisect import bisect_right
+from itertools import accumulate
+
 from TermTk.TTkCore.cfg import TTkCfg
 from TermTk.TTkCore.constant import TTkK
 from TermTk.TTkCore.string import TTkString
@@ -32,7 +35,8 @@ from TermTk.TTkAbstract.abstractitemmodel import TTkAbstractItemModel
 class TTkTreeWidgetItem(TTkAbstractItemModel):
     __slots__ = ('_parent', '_data', '_alignment', '_children', '_expanded', '_selected', '_hidden',
                  '_childIndicatorPolicy', '_icon', '_defaultIcon',
-                 '_sortColumn', '_sortOrder'
+                 '_sortColumn', '_sortOrder',
+                 '_visibleChildren', '_offsets', '_size'
         # Signals
         # 'refreshData'
         )
@@ -42,6 +46,12 @@ class TTkTreeWidgetItem(TTkAbstractItemModel):
         # self.refreshData = pyTTkSignal(TTkTreeWidgetItem)
         super().__init__(*args, **kwargs)
         self._children = []
+        # Cached: the not hidden children, the displayed rows before each of them
+        #         and the displayed rows of this subtree
+        #         (None = to be evaluated, see _invalidate)
+        self._visibleChildren = None
+        self._offsets = None
+        self._size = None
         data = args[0] if len(args)>0 and type(args[0])==list else [TTkString()]
         self._data = [i if issubclass(type(i), TTkString) else TTkString(i) if isinstance(i,str) else TTkString() for i in data]
         self._alignment = [TTkK.LEFT_ALIGN]*len(self._data)
@@ -79,8 +89,22 @@ class TTkTreeWidgetItem(TTkAbstractItemModel):
     def setHidden(self, hide):
         if hide == self._hidden: return
         self._hidden = hide
+        if self._parent:
+            self._parent._childrenChanged()
         self.dataChanged.emit()
 
+    def _invalidate(self):
+        ''' Invalidate the cached size of this item and all its parents '''
+        item = self
+        while item:
+            item._offsets = None
+            item._size = None
+            item = item._parent
+
+    def _childrenChanged(self):
+        self._visibleChildren = None
+        self._invalidate()
+
     def childIndicatorPolicy(self):
         return self._childIndicatorPolicy
 
@@ -95,12 +119,31 @@ class TTkTreeWidgetItem(TTkAbstractItemModel):
         child._sortColumn = self._sortColumn
         self._setDefaultIcon()
         self._sort(children=False)
+        self._childrenChanged()
         child.dataChanged.connect(self.emitDataChanged)
         self.dataChanged.emit()
 
     def addChildren(self, children):
+        # Sort and notify the change only once
         for child in children:
-            self.addChild(child)
+            self._children.append(child)
+            child._parent = self
+            child._sortOrder = self._sortOrder
+            child._sortColumn = self._sortColumn
+            child.dataChanged.connect(self.emitDataChanged)
+        self._setDefaultIcon()
+        self._sort(children=False)
+        self._childrenChanged()
+        self.dataChanged.emit()
+
+    def removeChild(self, child):
+        if child not in self._children: return
+        self._children.remove(child)
+        child._parent = None
+        child.dataChanged.disconnect(self.emitDataChanged)
+        self._setDefaultIcon()
+        self._childrenChanged()
+        self.dataChanged.emit()
 
     def child(self, index):
         if 0 <= index < len(self._children):
@@ -108,7 +151,10 @@ class TTkTreeWidgetItem(TTkAbstractItemModel):
         return None
 
     def children(self):
-        return [x for x in self._children if not x.isHidden()]
+        ''' Return the list of the not hidden children (cached, it must not be modified) '''
+        if self._visibleChildren is None:
+            self._visibleChildren = [x for x in self._children if not x.isHidden()]
+        return self._visibleChildren
 
     def icon(self, col):
         if col >= len(self._icon):
@@ -144,6 +190,9 @@ class TTkTreeWidgetItem(TTkAbstractItemModel):
                 self._children,
                 key = lambda x : x.sortData(self._sortColumn),
                 reverse = self._sortOrder == TTkK.DescendingOrder)
+        # Only the order is changed
+        self._visibleChildren = None
+        self._offsets = None
         # Broadcast the sorting to the children
         if children:
             for c in self._children:
@@ -167,6 +216,7 @@ class TTkTreeWidgetItem(TTkAbstractItemModel):
 
     def setExpanded(self, expand):
         self._expanded = expand
+        self._invalidate()
         self._setDefaultIcon()
         self.emitDataChanged()
 
@@ -182,8 +232,26 @@ class TTkTreeWidgetItem(TTkAbstractItemModel):
     def isSelected(self):
         return self._selected
 
+    def _childrenOffsets(self):
+        # The displayed rows before each child (the last one is the total)
+        if self._offsets is None:
+            self._offsets = list(accumulate((c.size() for c in self.children()), initial=0))
+        return self._offsets
+
     def size(self):
-        if self._expanded:
-            return 1 + sum(c.size() for c in self.children())
-        else:
-            return 1
+        ''' Return the number of displayed rows of this subtree (this item included) '''
+        if self._size is None:
+            self._size = 1 + self._childrenOffsets()[-1] if self._expanded else 1
+        return self._size
+
+    def _itemAt(self, index):
+        ''' Return the item displayed at row "index" of this subtree (0 = this item)
+        and its depth relative to this item, 0 <= index < size() '''
+        item, level = self, 0
+        while index:
+            offsets = item._childrenOffsets()
+            i = bisect_right(offsets, index-1) - 1
+            index -= offsets[i] + 1
+            item = item.children()[i]
+            level += 1
+        return item, level
@@ -35,6 +35,7 @@ from TermTk.TTkGui.clipboard import TTkClipboard
 from TermTk.TTkGui.textwrap1 import TTkTextWrap
 from TermTk.TTkGui.textcursor import TTkTextCursor
 from TermTk.TTkGui.textdocument import TTkTextDocument
+from TermTk.TTkGui.filedocument import TTkFileDocument
 from TermTk.TTkLayouts.gridlayout import TTkGridLayout
 from TermTk.TTkAbstract.abstractscrollarea import TTkAbstractScrollArea
 from TermTk.TTkAbstract.abstractscrollview import TTkAbstractScrollView, TTkAbstractScrollViewGridLayout
@@ -93,7 +94,7 @@ class TTkTextEditView(TTkAbstractScrollView):
             '_textCursor', '_textColor', '_cursorParams',
             '_textWrap', '_lineWrapMode', '_lastWrapUsed',
             '_replace',
-            '_readOnly', '_multiCursor',
+            '_readOnly', '_readOnlyUser', '_multiCursor',
             '_clipboard',
             '_preview', '_previewWidth',
             # # Forwarded Methods
@@ -118,7 +119,9 @@ class TTkTextEditView(TTkAbstractScrollView):
         self.undoAvailable = pyTTkSignal(bool)
         self.redoAvailable = pyTTkSignal(bool)
         self.textChanged = pyTTkSignal()
-        self._readOnly = kwargs.get('readOnly', True)
+        # The read only state requested by the user,
+        # the file documents are always read only
+        self._readOnlyUser = self._readOnly = kwargs.get('readOnly', True)
         self._multiCursor = True
         self._hsize = 0
         self._lastWrapUsed  = 0
@@ -131,7 +134,6 @@ class TTkTextEditView(TTkAbstractScrollView):
         self._clipboard = TTkClipboard()
         self.setFocusPolicy(TTkK.ClickFocus + TTkK.TabFocus)
         self.setDocument(kwargs.get('document', TTkTextDocument()))
-        self._updateSize()
 
     @pyTTkSlot(bool)
     def _undoAvailable(self, available):
@@ -182,21 +184,26 @@ class TTkTextEditView(TTkAbstractScrollView):
     def setDocument(self, document):
         if self._textDocument:
             self._textDocument.contentsChanged.disconnect(self._documentChanged)
+            self._textDocument.formatChanged.disconnect(self.update)
             self._textDocument.cursorPositionChanged.disconnect(self._cursorPositionChanged)
             self._textDocument.undoAvailable.disconnect(self._undoAvailable)
             self._textDocument.redoAvailable.disconnect(self._redoAvailable)
-            self._textWrap.wrapChanged.disconnect(self.update)
+            self._textWrap.wrapChanged.disconnect(self._wrapChanged)
         if not document:
             document = TTkTextDocument()
         self._textDocument = document
+        # The lines of a file document cannot be edited
+        self._readOnly = self._readOnlyUser or isinstance(document, TTkFileDocument)
         self._textCursor = TTkTextCursor(document=self._textDocument)
         self._textWrap = TTkTextWrap(document=self._textDocument)
         self._textDocument.contentsChanged.connect(self._documentChanged)
+        self._textDocument.formatChanged.connect(self.update)
         self._textDocument.cursorPositionChanged.connect(self._cursorPositionChanged)
         self._textDocument.undoAvailable.connect(self._undoAvailable)
         self._textDocument.redoAvailable.connect(self._redoAvailable)
         # Trigger an update when the rewrap happen
-        self._textWrap.wrapChanged.connect(self.update)
+        self._textWrap.wrapChanged.connect(self._wrapChanged)
+        self._updateSize()
 
     # forward textWrap Methods
     def wrapWidth(self, *args, **kwargs):       return self._textWrap.wrapWidth(*args, **kwargs)
@@ -211,7 +218,8 @@ class TTkTextEditView(TTkAbstractScrollView):
         return self._readOnly
 
     def setReadOnly(self, ro):
-        self._readOnly = ro
+        self._readOnlyUser = ro
+        self._readOnly = ro or isinstance(self._textDocument, TTkFileDocument)
 
     def clear(self):
         self.setText(TTkString())
@@ -278,14 +286,24 @@ class TTkTextEditView(TTkAbstractScrollView):
 
     @pyTTkSlot()
     def _documentChanged(self):
-        self._rewrap()
+        # The changed lines are rewrapped by the TTkTextWrap (contentsChange)
+        if isinstance(self._textDocument, TTkFileDocument):
+            self._updateSize()
+        self.update()
         self.textChanged.emit()
 
-    def _rewrap(self):
-        self._textWrap.rewrap()
+    @pyTTkSlot()
+    def _wrapChanged(self):
         self.viewChanged.emit()
+        # Keep the end of the growing file in view
+        if isinstance(self._textDocument, TTkFileDocument) and self._textDocument.follow():
+            ox, _ = self.getViewOffsets()
+            self.viewMoveTo(ox, max(0, self._textWrap.size()-self.height()))
         self.update()
 
+    def _rewrap(self):
+        self._textWrap.rewrap()
+
     @pyTTkSlot(TTkTextCursor)
     def _cursorPositionChanged(self, cursor):
         if cursor == self._textCursor:
@@ -301,7 +319,11 @@ class TTkTextEditView(TTkAbstractScrollView):
         return super().resizeEvent(w,h)
 
     def _updateSize(self):
-        self._hsize = max( len(l) for l in self._textDocument._dataLines ) + 1
+        if isinstance(self._textDocument, TTkFileDocument):
+            # Avoid reading the whole file, the width is evaluated by the index
+            self._hsize = self._textDocument.width() + 1
+        else:
+            self._hsize = max( len(l) for l in self._textDocument._dataLines ) + 1
 
     def viewFullAreaSize(self) -> (int, int):
         if self.lineWrapMode() == TTkK.NoWrap:
@@ -141,6 +141,8 @@ class TTkWidget(TMouseEvents,TKeyEvents, TDragEvents):
         self._minw, self._minh = kwargs.get('minSize', (self._minw, self._minh))
 
         self._visible = kwargs.get('visible', True)
+        # The canvas of an opaque widget cover all the area below it
+        self._transparent = False
         self._enabled = kwargs.get('enabled', True)
 
         self._toolTip = TTkString(kwargs.get('toolTip',''))
@@ -234,26 +236,62 @@ class TTkWidget(TMouseEvents,TKeyEvents, TDragEvents):
                         (    0,     0, cw, ch), # slice
                         (   lx,    ly, lw, lh)) # bound
         else:
-            for child in item.zSortedItems:
-                # The geometry include the padding of the layout
-                igx, igy, igw, igh = item.geometry()
-                iox, ioy = item.offset()
-                ix = igx+ox+iox
-                iy = igy+oy+ioy
-                iw = igw-iox
-                ih = igh-ioy
-                # child outside the bound
-                if ix+iw < lx and ix > lx+lw and iy+ih < ly and iy > ly+lh: continue
-                # Reduce the bound to the minimum visible
-                bx = max(igx,ix,lx)
-                by = max(igy,iy,ly)
-                bw = min(ix+iw,lx+lw)-bx
-                bh = min(iy+ih,ly+lh)-by
-                TTkWidget._paintChildCanvas(canvas, child, (bx,by,bw,bh), (ix,iy))
-
-    def paintChildCanvas(self):
-        ''' .. caution:: Don't touch this! '''
-        TTkWidget._paintChildCanvas(self._canvas, self.rootLayout(), self.rootLayout().geometry(), self.rootLayout().pos())
+            # The geometry include the padding of the layout
+            igx, igy, igw, igh = item.geometry()
+            iox, ioy = item.offset()
+            ix = igx+ox+iox
+            iy = igy+oy+ioy
+            iw = igw-iox
+            ih = igh-ioy
+            # child outside the bound
+            if ix+iw < lx or ix > lx+lw or iy+ih < ly or iy > ly+lh: return
+            # Reduce the bound to the minimum visible
+            bx = max(igx,ix,lx)
+            by = max(igy,iy,ly)
+            bw = min(ix+iw,lx+lw)-bx
+            bh = min(iy+ih,ly+lh)-by
+            # Occlusion culling, from the top to the bottom collect the
+            # rows of each child not covered by the opaque widgets above it
+            occluders = []
+            plan = []
+            for child in reversed(item.zSortedItems):
+                if child.layoutItemType != TTkK.WidgetItem or child.isEmpty():
+                    plan.append((child,((by,by+bh),)))
+                    continue
+                widget = child.widget()
+                if not widget._visible: continue
+                cx,cy,cw,ch = widget.geometry()
+                x1, y1 = max(bx,cx+ix), max(by,cy+iy)
+                x2, y2 = min(bx+bw,cx+ix+cw), min(by+bh,cy+iy+ch)
+                if x1>=x2 or y1>=y2: continue
+                rows = [(y1,y2)]
+                for ox1,oy1,ox2,oy2 in occluders:
+                    # Only the occluders that cover the whole width remove rows
+                    if ox1>x1 or ox2<x2: continue
+                    rows = [r for a,b in rows for r in ((a,min(b,oy1)),(max(a,oy2),b)) if r[0]<r[1]]
+                    if not rows: break
+                if rows:
+                    plan.append((child,rows))
+                if not widget._transparent:
+                    occluders.append((x1,y1,x2,y2))
+            for child, rows in reversed(plan):
+                for a,b in rows:
+                    TTkWidget._paintChildCanvas(canvas, child, (bx,a,bw,b-a), (ix,iy))
+
+    def paintChildCanvas(self, bound=None):
+        ''' .. caution:: Don't touch this!
+
+        :param bound: optional area (x,y,w,h) of the canvas to be composed, default: the whole canvas
+        :type bound: tuple
+        '''
+        lx,ly,lw,lh = self.rootLayout().geometry()
+        if bound is not None:
+            bx,by,bw,bh = bound
+            x1,y1 = max(lx,bx), max(ly,by)
+            x2,y2 = min(lx+lw,bx+bw), min(ly+lh,by+bh)
+            if x1>=x2 or y1>=y2: return
+            lx,ly,lw,lh = x1,y1,x2-x1,y2-y1
+        TTkWidget._paintChildCanvas(self._canvas, self.rootLayout(), (lx,ly,lw,lh), self.rootLayout().pos())
 
     def moveEvent(self, x: int, y: int):
         ''' Event Callback triggered after a successful move'''
@@ -279,7 +317,13 @@ class TTkWidget(TMouseEvents,TKeyEvents, TDragEvents):
         if x==self._x and y==self._y: return
         self._x = x
         self._y = y
+        # Invalidate the hit test index of the layout
+        if (layout := self._widgetItem.parent()) is not None:
+            layout._hitIndex = None
         self.update(repaint=False, updateLayout=False)
+        # The area uncovered need to be repainted
+        if self._parent is not None:
+            TTkHelper.addUpdateBuffer(self._parent)
         self.moveEvent(x,y)
 
     def resize(self, w: int, h: int):
@@ -293,7 +337,13 @@ class TTkWidget(TMouseEvents,TKeyEvents, TDragEvents):
             self._width  = w
             self._height = h
             self._canvas.resize(self._width, self._height)
+            # Invalidate the hit test index of the layout
+            if (layout := self._widgetItem.parent()) is not None:
+                layout._hitIndex = None
             self.update(repaint=True, updateLayout=True)
+            # The area uncovered need to be repainted
+            if self._parent is not None:
+                TTkHelper.addUpdateBuffer(self._parent)
         self.resizeEvent(w,h)
 
     def setGeometry(self, x: int, y: int, w: int, h: int):
@@ -331,9 +381,10 @@ class TTkWidget(TMouseEvents,TKeyEvents, TDragEvents):
         self.update(repaint=True, updateLayout=True)
 
     @staticmethod
-    def _mouseEventLayoutHandle(evt, layout):
+    def _mouseEventLayoutHandle(evt, layout, x=None, y=None):
         ''' .. caution:: Don't touch this! '''
-        x, y = evt.x, evt.y
+        if x is None:
+            x, y = evt.x, evt.y
         lx,ly,lw,lh =layout.geometry()
         lox, loy = layout.offset()
         lx,ly,lw,lh = lx+lox, ly+loy, lw-lox, lh-loy
@@ -342,20 +393,20 @@ class TTkWidget(TMouseEvents,TKeyEvents, TDragEvents):
             return False
         x-=lx
         y-=ly
-        for item in reversed(layout.zSortedItems):
-        # for item in layout.zSortedItems:
+        # Only the items that may contain the row "y", from the top z
+        for item in layout.hitTestItems(y):
             if item.layoutItemType == TTkK.WidgetItem and not item.isEmpty():
                 widget = item.widget()
                 if not widget._visible: continue
                 wx,wy,ww,wh = widget.geometry()
                 # Skip the mouse event if outside this widget
                 if not (wx <= x < wx+ww and wy <= y < wy+wh): continue
+                # The event is cloned only for the widget that receive it
                 wevt = evt.clone(pos=(x-wx, y-wy))
                 if widget.mouseEvent(wevt):
                     return True
             elif item.layoutItemType == TTkK.LayoutItem:
-                levt = evt.clone(pos=(x, y))
-                if TTkWidget._mouseEventLayoutHandle(levt, item):
+                if TTkWidget._mouseEventLayoutHandle(evt, item, x, y):
                     return True
         return False
 
@@ -575,12 +626,14 @@ class TTkWidget(TMouseEvents,TKeyEvents, TDragEvents):
            self._parent.rootLayout() is not None:
             self._parent.raiseWidget()
             self._parent.rootLayout().raiseWidget(self)
+            self.update(repaint=False)
 
     def lowerWidget(self):
         if self._parent is not None and \
            self._parent.rootLayout() is not None:
             self._parent.lowerWidget()
             self._parent.rootLayout().lowerWidget(self)
+            self.update(repaint=False)
 
     @pyTTkSlot()
     def close(self):
@@ -74,8 +74,7 @@ tableCommit.setColumnColors((
         ttk.TTkColor.fg('#00dddd', modifier=ttk.TTkColorGradient(increment=-4)),
     ))
 
-for commit in commitResults:
-    tableCommit.appendItem(commit)
+tableCommit.appendItems(commitResults)
 
 @ttk.pyTTkSlot(int)
 def _tableCallback(val):
@@ -74,12 +74,17 @@ class Mock_TTkTerm():
         sys.stdout.write(str(*args))
         sys.stdout.flush()
 
+    @staticmethod
+    def beginFrame(): pass
+    @staticmethod
+    def endFrame(): pass
+
     @staticmethod
     def registerResizeCb(_): pass
     @staticmethod
     def exit(): pass
     @staticmethod
-    def init(title,sigmask,mouse,directMouse): pass
+    def init(title,sigmask,mouse,directMouse,syncUpdate=False): pass
     @staticmethod
     def getTerminalSize():
         return 250,70
@@ -138,4 +138,37 @@ def test_demo3():
 
     assert cbLine == 1
     assert cbRem  == 5
-    assert cbAdd  == 3
\ No newline at end of file
+    assert cbAdd  == 3
+# aa______bbbb______eeee
+# 2 selections in the same line
+# rem=1 add=1
+
+def test_demo4():
+    doc = ttk.TTkTextDocument(text='aaaa bbbb cccc dddd eeee')
+    cur = ttk.TTkTextCursor(document=doc)
+    wrap = ttk.TTkTextWrap(document=doc)
+    wrap.enable()
+    wrap._wrapWidth = 10
+    wrap.rewrap()
+
+    _setCursor(cur, [
+        ((0,2),(0,8)),
+        ((0,12),(0,20))])
+    cbLine, cbRem, cbAdd = -1,-1,-1
+
+    def _cb(a,b,c):
+        nonlocal cbLine, cbRem, cbAdd
+        cbLine, cbRem, cbAdd = a,b,c
+
+    doc.contentsChange.connect(_cb)
+    cur.removeSelectedText()
+    print(f"{cbLine=}, {cbRem=}, {cbAdd=}")
+
+    assert cbLine == 0
+    assert cbRem  == 1
+    assert cbAdd  == 1
+
+    # The incremental wrap must match a full rewrap
+    lines = list(wrap._lines)
+    wrap.rewrap()
+    assert lines == wrap._lines
@@ -66,3 +66,25 @@ def test_stringAlign1():
     assert '  Yes⌛⌛⌛  '== str(test1.align(width=13, alignment=TermTk.TTkK.CENTER_ALIGN))
     # width=14: |  Yes⌛⌛⌛   |
     assert '  Yes⌛⌛⌛   '==str(test1.align(width=14, alignment=TermTk.TTkK.CENTER_ALIGN))
+
+def test_setColorAt():
+    # The derived strings may share the colors of the source,
+    # setColorAt must not change the source string
+    red  = TermTk.TTkColor.fg('#FF0000')
+    blue = TermTk.TTkColor.fg('#0000FF')
+    a = TermTk.TTkString('Hello World', red)
+
+    b = a.setColor(blue, match='zzz')
+    b.setColorAt(1, blue)
+    assert b.colorAt(1) == blue
+    assert a.colorAt(1) == red
+
+    c = a.replace('l','L')
+    c.setColorAt(0, blue)
+    assert c.colorAt(0) == blue
+    assert a.colorAt(0) == red
+
+    d = a + TermTk.TTkString()
+    d.setColorAt(2, blue)
+    assert d.colorAt(2) == blue
+    assert a.colorAt(2) == red
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2022 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import sys, os
+import re
+import time
+import tempfile
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+
+from TermTk.TTkCore.filebuffer import TTkFileBuffer
+
+lines = [
+    'café au lait', 'cafe', 'naïve résumé', 'über', 'plain ascii line',
+    'foo', 'foo bar', 'Kelvin', '\u212aelvin sign', '日本語 テキスト', '', '  indented', 'end.']
+
+patterns = [
+    r'caf.$', r'^\w+$', r'^.{4}$', r'foo$', r'^foo', r'\bbar\b', r'é',
+    r'\s', r'^$', r'[^a-z ]', r'foo\sbar', r'o[^z]*b', 'kelvin', 'foo', '日本']
+
+def _searchFile(text):
+    fd, filename = tempfile.mkstemp()
+    with os.fdopen(fd, 'wb') as f:
+        f.write(text.encode())
+    fb = TTkFileBuffer(filename, 0x10, 0x10)
+    while fb._indexing:
+        time.sleep(0.01)
+    # The baseline is the search line by line of the decoded file
+    with open(filename, encoding='utf-8') as f:
+        fileLines = f.readlines()
+    for pattern in patterns:
+        for ignoreCase in (False, True):
+            rr = re.compile(pattern, re.IGNORECASE if ignoreCase else 0)
+            expected = [i for i,l in enumerate(fileLines) if rr.search(l)]
+            print(f"{pattern=} {ignoreCase=} {expected=}")
+            assert expected == fb.searchRe(pattern, ignoreCase)
+        expected = [i for i,l in enumerate(fileLines) if pattern in l]
+        assert expected == fb.search(pattern)
+    os.remove(filename)
+
+def test_search_utf8():
+    _searchFile('\n'.join(lines*50))
+
+def test_search_crlf():
+    _searchFile('\r\n'.join(lines*50))
@@ -27,13 +27,90 @@ import sys
 import random
 import argparse
 
-from pygments import highlight
-from pygments.lexers import PythonLexer
-from pygments.formatters import TerminalFormatter, Terminal256Formatter, TerminalTrueColorFormatter
+from pygments.lexer import RegexLexer
+from pygments.lexers import PythonLexer, get_lexer_for_filename
+from pygments.styles import get_style_by_name
+from pygments.token import _TokenType, Error, Whitespace
+from pygments.util import ClassNotFound
 
 sys.path.append(os.path.join(sys.path[0],'../..'))
 import TermTk as ttk
 
+class PygmentsHighlighter(ttk.TTkSyntaxHighlighter):
+    '''Highlight each line with a pygments RegexLexer,
+    the state at the end of the line is the lexer stack'''
+    __slots__ = ('_lexer', '_style', '_colors')
+    def __init__(self, *args, **kwargs):
+        self._lexer = kwargs.get('lexer', PythonLexer())
+        self._style = get_style_by_name(kwargs.get('style', 'material'))
+        self._colors = {}
+        super().__init__(*args, **kwargs)
+
+    def _color(self, ttype):
+        if (color := self._colors.get(ttype)) is None:
+            st = self._style.style_for_token(ttype)
+            color = ttk.TTkColor.fg(f"#{st['color']}") if st['color'] else ttk.TTkColor.RST
+            if st['bold']:      color += ttk.TTkColor.BOLD
+            if st['italic']:    color += ttk.TTkColor.ITALIC
+            if st['underline']: color += ttk.TTkColor.UNDERLINE
+            self._colors[ttype] = color
+        return color
+
+    def _tokens(self, text, stack):
+        # Same logic of pygments RegexLexer.get_tokens_unprocessed
+        # with the state stack exposed
+        tokendefs = self._lexer._tokens
+        statetokens = tokendefs[stack[-1]]
+        pos = 0
+        while pos < len(text):
+            for rexmatch, action, newState in statetokens:
+                if m := rexmatch(text, pos):
+                    if action is not None:
+                        if type(action) is _TokenType:
+                            yield pos, action, m.group()
+                        else:
+                            yield from action(self._lexer, m)
+                    pos = m.end()
+                    if newState is not None:
+                        if isinstance(newState, tuple):
+                            for state in newState:
+                                if state == '#pop':
+                                    if len(stack) > 1: stack.pop()
+                                elif state == '#push':
+                                    stack.append(stack[-1])
+                                else:
+                                    stack.append(state)
+                        elif isinstance(newState, int):
+                            # pop, but keep at least one state on the stack
+                            if abs(newState) >= len(stack): del stack[1:]
+                            else: del stack[newState:]
+                        elif newState == '#push':
+                            stack.append(stack[-1])
+                        statetokens = tokendefs[stack[-1]]
+                    break
+            else:
+                if text[pos] == '\n':
+                    stack[:] = ['root']
+                    statetokens = tokendefs['root']
+                    yield pos, Whitespace, '\n'
+                else:
+                    yield pos, Error, text[pos]
+                pos += 1
+
+    def highlightBlock(self, text):
+        # The line is lexed including the newline to match the multiline rules
+        text = str(text)+'\n'
+        if isinstance(self._lexer, RegexLexer):
+            prev = self.previousBlockState()
+            stack = ['root'] if prev == -1 else list(prev)
+            tokens = self._tokens(text, stack)
+        else:
+            stack = None
+            tokens = self._lexer.get_tokens_unprocessed(text)
+        for pos, ttype, value in tokens:
+            self.setFormat(pos, len(value), self._color(ttype))
+        self.setCurrentBlockState(-1 if stack is None else tuple(stack))
+
 
 def demoTextEdit(root, filenames):
     frame = ttk.TTkFrame(parent=root, border=False, layout=ttk.TTkGridLayout())
@@ -45,9 +122,15 @@ def demoTextEdit(root, filenames):
     file = filenames[0]
     with open(file, 'r') as f:
         content = f.read()
-    # te.setText(highlight(content, PythonLexer(), TerminalFormatter()))
-    # te.setText(highlight(content, PythonLexer(), Terminal256Formatter()))
-    te.setText(highlight(content, PythonLexer(), TerminalTrueColorFormatter(style='material')))
+    te.setText(content)
+
+    # The lines are highlighted only when displayed and
+    # after each change only until the lexer state is the same as before
+    try:
+        lexer = get_lexer_for_filename(file)
+    except ClassNotFound:
+        lexer = PythonLexer()
+    PygmentsHighlighter(document=te.document(), lexer=lexer, style='material')
 
     # use the widget size to wrap
     # te.setLineWrapMode(ttk.TTkK.WidgetWidth)
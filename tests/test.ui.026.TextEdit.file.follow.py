@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2023 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Read only viewer of a (large/growing) file,
+# i.e. the session.log displayed by tools/tailSession.sh:
+#    python3 tests/test.ui.026.TextEdit.file.follow.py -f session.log
+
+import os
+import sys
+import argparse
+
+sys.path.append(os.path.join(sys.path[0],'..'))
+import TermTk as ttk
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-f', help='Follow the file (tail -f)', action='store_true')
+    parser.add_argument('filename', help='the file to be displayed')
+    args = parser.parse_args()
+
+    root = ttk.TTk(layout=ttk.TTkGridLayout())
+
+    document = ttk.TTkFileDocument(filename=args.filename, follow=args.f)
+    te = ttk.TTkTextEdit(parent=root, document=document, lineNumber=True)
+
+    document.fileBuffer().indexUpdated.connect(
+        lambda p: ttk.TTkLog.debug(f"Indexed {p*100:.1f}% lines:{document.lineCount()}"))
+
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
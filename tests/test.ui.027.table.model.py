@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2022 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Table view of a model with millions of rows,
+# the rows are generated only when displayed:
+#    python3 tests/test.ui.027.table.model.py -r 10000000
+
+import os
+import sys
+import argparse
+
+sys.path.append(os.path.join(sys.path[0],'..'))
+import TermTk as ttk
+
+class RangeModel(ttk.TTkAbstractTableModel):
+    __slots__ = ('_rows')
+    def __init__(self, rows):
+        super().__init__()
+        self._rows = rows
+
+    def rowCount(self):
+        return self._rows
+
+    def columnCount(self):
+        return 4
+
+    def data(self, row, col, role=ttk.TTkK.DisplayRole):
+        if role == ttk.TTkK.TextAlignmentRole:
+            return ttk.TTkK.RIGHT_ALIGN if col else ttk.TTkK.LEFT_ALIGN
+        if role != ttk.TTkK.DisplayRole:
+            return None
+        if col == 0: return ttk.TTkString(f"Row {row}", ttk.TTkColor.fg('#00FF00') if row%2 else ttk.TTkColor.RST)
+        if col == 1: return row*row
+        if col == 2: return hex(row)
+        return f"{row/max(1,self._rows):.6f}"
+
+    def headerData(self, col, role=ttk.TTkK.DisplayRole):
+        return ["Name", "Square", "Hex", "Ratio"][col]
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-r', help='Number of rows', type=int, default=1000000)
+    args = parser.parse_args()
+
+    root = ttk.TTk(layout=ttk.TTkGridLayout())
+
+    split = ttk.TTkSplitter(parent=root)
+    table = ttk.TTkTable(parent=split, model=RangeModel(args.r))
+    table.setColumnWidth(0, 15)
+    table.cellClicked.connect(lambda r,c: ttk.TTkLog.debug(f"Clicked row:{r} col:{c}"))
+    ttk.TTkLogViewer(parent=split)
+
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2021 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Bytes per frame produced by pushToTerminalBuffered
+# compared with the previous encoder (absolute moves, full sgr, str +=)
+
+import sys, os
+
+import timeit
+import random
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+sys.path.append(os.path.join(sys.path[0],'.'))
+import TermTk as ttk
+from TermTk.TTkCore.TTkTerm.term import TTkTerm
+ttk.TTk()  # in order to have TTkCfg.theme
+
+out = []
+TTkTerm.push = lambda *args: out.append(''.join(args))
+
+def pushOld(canvas):
+    oldData, oldColors = canvas._bufferedData, canvas._bufferedColors
+    data, colors = canvas._data, canvas._colors
+    glyphs, colorPool = ttk.TTkCanvas._glyphs, ttk.TTkCanvas._colorPool
+    lastcolor = ttk.TTkColor.RST
+    empty = True
+    ansi = ""
+    sw = canvas._width
+    for y in range(0, canvas._height):
+        for x in range(0, sw):
+            i = y*sw+x
+            if data[i] == oldData[i] and colors[i] == oldColors[i]:
+                if not empty:
+                    TTkTerm.push(ansi)
+                    empty=True
+                continue
+            if empty:
+                ansi = TTkTerm.Cursor.moveTo(y+1,x+1)
+                empty = False
+            color = colorPool[colors[i]]
+            if color != lastcolor:
+                ansi += str(color-lastcolor)
+                lastcolor = color
+            ansi+=glyphs[data[i]]
+        if not empty:
+            TTkTerm.push(ansi)
+            empty=True
+    TTkTerm.push(str(ttk.TTkColor.RST))
+    oldData[:], oldColors[:] = data, colors
+
+def pushNew(canvas):
+    canvas.pushToTerminalBuffered(0, 0, canvas._width, canvas._height)
+
+w, h = 200, 50
+colors = [ttk.TTkColor.RST,
+          ttk.TTkColor.fg('#FFFF00')+ttk.TTkColor.bg('#000044'),
+          ttk.TTkColor.fg('#DDDDDD')+ttk.TTkColor.bg('#222222'),
+          ttk.TTkColor.fg('#FFFFFF')+ttk.TTkColor.BOLD,
+          ttk.TTkColor.fg('#AAAAAA')]
+words = ['Lorem', 'ipsum', 'dolor', 'sit', 'amet,', 'consectetur', '────', '╔══╗', '│', 'Tèst', '😁', '     ']
+
+def frame(canvas, seed, scroll):
+    rnd = random.Random(seed)
+    canvas.clean()
+    canvas.drawBox(pos=(0,0), size=(w,h), color=colors[4])
+    for y in range(1,h-1):
+        txt = ' '.join(rnd.choice(words) for _ in range(rnd.randint(0,20)))
+        canvas.drawText(pos=(2,y), text=txt[scroll:], width=w-4, color=rnd.choice(colors))
+    canvas.drawText(pos=(2,1), text=f"Status: {seed}", color=colors[3])
+
+def bench(pushFn, scenario):
+    canvas = ttk.TTkCanvas(width=w, height=h)
+    canvas.enableDoubleBuffer()
+    out.clear()
+    for i in range(10):
+        scenario(canvas, i)
+        pushFn(canvas)
+    return sum(len(o.encode()) for o in out)/10
+
+# Full redraw of random content
+def test1(): return bench(pushOld, lambda c,i: frame(c,i,0))
+def test2(): return bench(pushNew, lambda c,i: frame(c,i,0))
+# Only the status line change
+def test3(): return bench(pushOld, lambda c,i: frame(c,0,0) or c.drawText(pos=(2,1), text=f"Status: {i}", color=colors[3]))
+def test4(): return bench(pushNew, lambda c,i: frame(c,0,0) or c.drawText(pos=(2,1), text=f"Status: {i}", color=colors[3]))
+# Horizontal scroll of the same content
+def test5(): return bench(pushOld, lambda c,i: frame(c,0,i))
+def test6(): return bench(pushNew, lambda c,i: frame(c,0,i))
+
+loop = 3
+
+result = timeit.timeit('test1()', globals=globals(), number=loop)
+print(f"1  {result / loop:.10f} - {result / loop} bytes/frame (old full redraw) {test1()}")
+result = timeit.timeit('test2()', globals=globals(), number=loop)
+print(f"2  {result / loop:.10f} - {result / loop} bytes/frame (new full redraw) {test2()}")
+result = timeit.timeit('test3()', globals=globals(), number=loop)
+print(f"3  {result / loop:.10f} - {result / loop} bytes/frame (old status line) {test3()}")
+result = timeit.timeit('test4()', globals=globals(), number=loop)
+print(f"4  {result / loop:.10f} - {result / loop} bytes/frame (new status line) {test4()}")
+result = timeit.timeit('test5()', globals=globals(), number=loop)
+print(f"5  {result / loop:.10f} - {result / loop} bytes/frame (old scroll)      {test5()}")
+result = timeit.timeit('test6()', globals=globals(), number=loop)
+print(f"6  {result / loop:.10f} - {result / loop} bytes/frame (new scroll)      {test6()}")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2021 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# TTkString width/data of CJK/emoji log lines,
+# unicodedata per char (previous) vs the cached width table (_TTkCharWidth)
+
+import sys, os
+
+import timeit
+import random
+import unicodedata
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+sys.path.append(os.path.join(sys.path[0],'.'))
+import TermTk as ttk
+from TermTk.TTkCore.charwidth import _TTkCharWidth
+
+random.seed(1)
+chars = "abcdef ghijk 0123 " + "日本語のテキスト中文字符한국어" + "😀😎🐀🎉🚀" + "áè"
+lines = ["".join(random.choice(chars) for _ in range(120)) for _ in range(200)]
+
+def _termWidthOld(text):
+    return ( len(text) +
+         sum(unicodedata.east_asian_width(ch) == 'W' for ch in text) -
+         sum(unicodedata.category(ch) in ('Me','Mn') for ch in text) )
+
+def _getDataOld(text):
+    retTxt = []
+    for ch in text:
+        if unicodedata.east_asian_width(ch) == 'W':
+            retTxt += (ch,'')
+        elif unicodedata.category(ch) in ('Me','Mn'):
+            if retTxt:
+                if len(retTxt)>1 and retTxt[-1] == '':
+                    retTxt[-2]+=ch
+                else:
+                    retTxt[-1]+=ch
+        else:
+            retTxt.append(ch)
+    return retTxt
+
+def test1():
+    return sum(_termWidthOld(l) for l in lines)
+def test2():
+    return sum(_TTkCharWidth._textWidth.__wrapped__(l) for l in lines)
+def test3():
+    return sum(_TTkCharWidth.textWidth(l) for l in lines)
+def test4():
+    return sum(len(_getDataOld(l)) for l in lines)
+def test5():
+    return sum(len(_TTkCharWidth.textLayout.__wrapped__(l)[0]) for l in lines)
+def test6():
+    return sum(len(ttk.TTkString(l).getData()[0]) for l in lines)
+
+loop = 100
+
+result = timeit.timeit('test1()', globals=globals(), number=loop)
+print(f"1  {result / loop:.10f} - {result / loop} {test1()} width unicodedata")
+result = timeit.timeit('test2()', globals=globals(), number=loop)
+print(f"2  {result / loop:.10f} - {result / loop} {test2()} width table")
+result = timeit.timeit('test3()', globals=globals(), number=loop)
+print(f"3  {result / loop:.10f} - {result / loop} {test3()} width table + lru")
+result = timeit.timeit('test4()', globals=globals(), number=loop)
+print(f"4  {result / loop:.10f} - {result / loop} {test4()} data unicodedata")
+result = timeit.timeit('test5()', globals=globals(), number=loop)
+print(f"5  {result / loop:.10f} - {result / loop} {test5()} data table")
+result = timeit.timeit('test6()', globals=globals(), number=loop)
+print(f"6  {result / loop:.10f} - {result / loop} {test6()} TTkString + getData")
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2021 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Parsing of a colored log,
+# TTkString concatenation + split (previous) vs the bulk TTkString.fromAnsiLines
+
+import sys, os
+
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+sys.path.append(os.path.join(sys.path[0],'.'))
+import TermTk as ttk
+
+log = "".join(
+        f"\033[32m2023-10-17 12:00:{i%60:02}\033[0m \033[1;34mINFO\033[0m build step {i} "
+        f"\033[38;2;200;100;0mwarning\033[0m compiling foo/bar/baz_{i}.c\n" for i in range(5000))
+
+def test1():
+    return len((ttk.TTkString()+log).split('\n'))
+def test2():
+    return len(ttk.TTkString.fromAnsiLines(log))
+def test3():
+    return len([ttk.TTkString(l) for l in log.split('\n')])
+
+loop = 10
+
+result = timeit.timeit('test1()', globals=globals(), number=loop)
+print(f"1  {result / loop:.10f} - {result / loop} {test1()} concat + split")
+result = timeit.timeit('test2()', globals=globals(), number=loop)
+print(f"2  {result / loop:.10f} - {result / loop} {test2()} fromAnsiLines")
+result = timeit.timeit('test3()', globals=globals(), number=loop)
+print(f"3  {result / loop:.10f} - {result / loop} {test3()} TTkString per line")
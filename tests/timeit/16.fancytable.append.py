@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2021 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Filling a TTkFancyTable (i.e. a git log),
+# one row at a time (appendItem 10k/100k rows) vs the bulk appendItems
+
+import sys, os
+
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+sys.path.append(os.path.join(sys.path[0],'.'))
+import TermTk as ttk
+
+ttk.TTkCfg.theme = ttk.TTkTheme()
+
+commits = [(f"Commit message number {i}", f"Author {i%37}", f"{i%28+1:02}-10-2023 12:{i%60:02}") for i in range(100000)]
+
+def test1():
+    table = ttk.TTkFancyTable(columns=[-1,20,20])
+    for commit in commits[:10000]:
+        table.appendItem(commit)
+    return table._tableView.viewFullAreaSize()
+def test2():
+    table = ttk.TTkFancyTable(columns=[-1,20,20])
+    for commit in commits:
+        table.appendItem(commit)
+    return table._tableView.viewFullAreaSize()
+def test3():
+    table = ttk.TTkFancyTable(columns=[-1,20,20])
+    table.appendItems(commits)
+    return table._tableView.viewFullAreaSize()
+
+loop = 1
+
+result = timeit.timeit('test1()', globals=globals(), number=loop)
+print(f"1  {result / loop:.10f} - {result / loop} {test1()} appendItem 10k")
+result = timeit.timeit('test2()', globals=globals(), number=loop)
+print(f"2  {result / loop:.10f} - {result / loop} {test2()} appendItem 100k")
+result = timeit.timeit('test3()', globals=globals(), number=loop)
+print(f"3  {result / loop:.10f} - {result / loop} {test3()} appendItems 100k")
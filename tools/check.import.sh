@@ -9,6 +9,7 @@ __check(){
             -e "from dataclasses" \
             -e "colors.py:from .colors_ansi_map" \
             -e "timer.py:import threading, time" \
+            -e "color.py:import threading" \
             -e "log.py:import inspect" \
             -e "log.py:import logging" \
             -e "log.py:from collections.abc import Callable, Set" \
@@ -29,8 +30,27 @@ __check(){
             -e "ttk.py:import platform" \
             -e "clipboard.py:import importlib.util" \
             -e "filebuffer.py:import threading" \
+            -e "filebuffer.py:import mmap" \
+            -e "filebuffer.py:from array import array" \
+            -e "filebuffer.py:from operator import add" \
+            -e "filebuffer.py:from itertools import accumulate, count" \
             -e "texedit.py:from math import log10, ceil" \
-            -e "string.py:import unicodedata" \
+            -e "charwidth.py:import unicodedata" \
+            -e "charwidth.py:from functools import lru_cache" \
+            -e "canvas.py:from array import array" \
+            -e "renderstats.py:import time" \
+            -e "renderstats.py:from collections import deque" \
+            -e "renderstats.py:from collections.abc import Callable" \
+            -e "textlines.py:from bisect import bisect_right" \
+            -e "textlines.py:from itertools import accumulate" \
+            -e "textwrap1.py:from bisect import bisect_left" \
+            -e "treewidgetitem.py:from bisect import bisect_right" \
+            -e "treewidgetitem.py:from itertools import accumulate" \
+            -e "tableview.py:from bisect import bisect_left" \
+            -e "tableview.py:from collections import OrderedDict" \
+            -e "filetreewidget.py:import threading" \
+            -e "filetreewidget.py:from collections import deque" \
+            -e "filetreewidget.py:from concurrent.futures import ThreadPoolExecutor" \
             -e "progressbar.py:import math"
 } ;
 